@@ -0,0 +1,14 @@
+"""
+Benchmark suite of `fexcel`.
+
+It measures how many values per second every field type generates, the end to end
+throughput of `Fexcel.write_to_file` for every file format, the startup time of the
+command line interface and the peak memory used to write files of several sizes.
+
+Run it from the root of the repository with
+
+    python -m benchmarks
+
+and check ``python -m benchmarks --help`` to store its results as a baseline and to
+compare later runs against it.
+"""
@@ -0,0 +1,128 @@
+import sys
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+from benchmarks import report, suite
+
+GROUPS = ("fields", "writers", "memory", "cli")
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def main(args: list[str] = sys.argv[1:]) -> None:
+    namespace = parse_args(args)
+    if namespace.quick:
+        namespace.field_rows, namespace.writer_rows = 1_000, 2_000
+        namespace.memory_rows, namespace.repeat = [1_000, 10_000], 1
+
+    config = {
+        "field_rows": namespace.field_rows,
+        "writer_rows": namespace.writer_rows,
+        "memory_rows": namespace.memory_rows,
+        "repeat": namespace.repeat,
+        "groups": namespace.groups,
+    }
+    metrics = suite.run(**config)
+
+    baseline = []
+    if namespace.compare is not None and namespace.compare.exists():
+        baseline = report.load(namespace.compare)
+    comparisons = report.compare(metrics, baseline, namespace.threshold)
+    print(report.format_report(comparisons))
+
+    if namespace.output is not None:
+        report.save(namespace.output, metrics, config)
+    if namespace.save_baseline:
+        report.save(namespace.baseline, metrics, config)
+    if namespace.fail_on_regression and any(
+        comparison.status == "worse" for comparison in comparisons
+    ):
+        sys.exit(1)
+
+
+def parse_args(args: list[str]) -> Namespace:
+    parser = ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark fexcel fields, writers, memory usage and CLI startup",
+    )
+    parser.add_argument(
+        "-g",
+        "--groups",
+        nargs="+",
+        choices=GROUPS,
+        default=list(GROUPS),
+        help="Groups of benchmarks to run, all of them by default",
+    )
+    parser.add_argument(
+        "--field-rows",
+        type=int,
+        default=5_000,
+        help="Number of values generated per field type",
+    )
+    parser.add_argument(
+        "--writer-rows",
+        type=int,
+        default=50_000,
+        help="Number of rows written per file format",
+    )
+    parser.add_argument(
+        "--memory-rows",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Row counts the peak memory is measured at",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs of every timed benchmark, the fastest one is reported",
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Run a short smoke version of the suite",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="Store the results of the run in a JSON file",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline file, defaults to {DEFAULT_BASELINE.name} in the suite",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results of the run as the new baseline",
+    )
+    parser.add_argument(
+        "--no-compare",
+        dest="compare_baseline",
+        action="store_false",
+        help="Do not compare the results against the baseline",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change from the baseline considered noise, defaults to 0.1",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with an error if any metric is worse than the baseline",
+    )
+    namespace = parser.parse_args(args)
+    namespace.compare = namespace.baseline if namespace.compare_baseline else None
+    return namespace
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+import fexcel
+from benchmarks.suite import Metric
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A metric compared against the same metric of a baseline."""
+
+    metric: Metric
+    baseline: float | None
+    threshold: float
+
+    @property
+    def change(self) -> float | None:
+        """Relative change of the metric from the baseline, e.g. `0.1` for +10%."""
+        if not self.baseline:
+            return None
+        return self.metric.value / self.baseline - 1
+
+    @property
+    def status(self) -> str:
+        """Either `new`, `ok`, `better` or `worse` than the baseline."""
+        change = self.change
+        if change is None:
+            return "new"
+        if not self.metric.higher_is_better:
+            change = -change
+        if change > self.threshold:
+            return "better"
+        if change < -self.threshold:
+            return "worse"
+        return "ok"
+
+
+def environment() -> dict[str, Any]:
+    """Describe the environment the benchmarks ran on."""
+    try:
+        fexcel_version = version("fexcel")
+    except PackageNotFoundError:
+        fexcel_version = None
+    return {
+        "fexcel": fexcel_version,
+        "source": str(Path(fexcel.__file__).parent),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def save(file_path: Path, metrics: list[Metric], config: dict[str, Any]) -> None:
+    """Store the metrics of a run, along with its configuration, as a JSON file."""
+    results = {
+        "environment": environment(),
+        "config": config,
+        "metrics": [metric.to_dict() for metric in metrics],
+    }
+    with file_path.open("w") as fp:
+        json.dump(results, fp, indent=2)
+
+
+def load(file_path: Path) -> list[Metric]:
+    """Load the metrics of a run stored with :func:`save`."""
+    with file_path.open("r") as fp:
+        results = json.load(fp)
+    return [Metric(**metric) for metric in results["metrics"]]
+
+
+def compare(
+    metrics: list[Metric],
+    baseline: list[Metric],
+    threshold: float,
+) -> list[Comparison]:
+    """
+    Compare every metric against the metric with the same name of the baseline. Any
+    relative change within `threshold` is considered noise.
+    """
+    baseline_values = {metric.name: metric.value for metric in baseline}
+    return [
+        Comparison(metric, baseline_values.get(metric.name), threshold)
+        for metric in metrics
+    ]
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    """Format the compared metrics as a plain text table."""
+    rows = [("metric", "value", "unit", "baseline", "change", "status")]
+    for comparison in comparisons:
+        metric, change = comparison.metric, comparison.change
+        rows.append(
+            (
+                metric.name,
+                _format_value(metric.value),
+                metric.unit,
+                _format_value(comparison.baseline),
+                f"{change:+.1%}" if change is not None else "",
+                comparison.status if comparison.baseline is not None else "",
+            ),
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            cell.rjust(width) if 0 < column < len(row) - 1 else cell.ljust(width)
+            for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in rows
+    )
+
+
+def _format_value(value: float | None) -> str:
+    if value is None:
+        return ""
+    if value >= 100:  # noqa: PLR2004
+        return f"{value:,.0f}"
+    return f"{value:.4g}"
@@ -0,0 +1,251 @@
+import gc
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import fexcel
+from fexcel import Fexcel, FexcelField
+from fexcel.fields import ArrayKeyIndex, ReferenceFieldFaker
+from fexcel.writers import FexcelWriter, XLSXWriter
+
+SEED = 0
+
+# NOTE: Constraints of the field types that cannot be built without any
+FIELD_CONSTRAINTS: dict[str, dict[str, Any]] = {
+    "choice": {"allowed_values": ["A", "B", "C", "D"]},
+    "reference": {"sheet": "Parent", "field": "id"},
+}
+
+# NOTE: Writers are benchmarked with cheap fields only, so the time spent generating
+# values does not hide the time spent serializing them.
+WRITER_SCHEMA = [
+    {"name": "int", "type": "int"},
+    {"name": "float", "type": "float"},
+    {"name": "bool", "type": "bool"},
+    {"name": "choice", "type": "choice", "constraints": FIELD_CONSTRAINTS["choice"]},
+    {"name": "datetime", "type": "datetime"},
+    {"name": "date", "type": "date"},
+]
+
+
+@dataclass(frozen=True)
+class WriterCase:
+    """A file format benchmarked through `write_to_file` or through its own writer."""
+
+    name: str
+    suffix: str
+    requires: str | None = None
+    writer: type[FexcelWriter] | None = None
+
+
+WRITER_CASES = [
+    WriterCase("csv", ".csv"),
+    WriterCase("tsv", ".tsv"),
+    WriterCase("xlsx", ".xlsx", requires="pyexcel_xlsx"),
+    WriterCase("xlsx-streaming", ".xlsx", writer=XLSXWriter),
+    WriterCase("xls", ".xls", requires="pyexcel_xls"),
+    WriterCase("ods", ".ods", requires="pyexcel_ods3"),
+    WriterCase("parquet", ".parquet", requires="pyarrow"),
+    WriterCase("arrow", ".arrow", requires="pyarrow"),
+]
+
+MEMORY_SUFFIXES = (".csv", ".xlsx", ".parquet")
+
+
+@dataclass(frozen=True)
+class Metric:
+    """A single measurement of the benchmark suite."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def field_types() -> Iterator[tuple[str, type[FexcelField]]]:
+    """Yield every built-in field class once, along with its first type name."""
+    seen = set()
+    for field_type, field_cls in FexcelField._fakers.items():  # noqa: SLF001
+        if field_cls not in seen and field_cls.__module__.startswith("fexcel."):
+            seen.add(field_cls)
+            yield field_type, field_cls
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Run `func` `repeat` times and return its fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_fields(rows: int, repeat: int) -> Iterator[Metric]:
+    """Values per second generated by every field type, as strings and natively."""
+    for field_type, _ in field_types():
+        schema = [
+            {
+                "name": field_type,
+                "type": field_type,
+                "constraints": FIELD_CONSTRAINTS.get(field_type, {}),
+            },
+        ]
+        field = Fexcel(schema, seed=SEED).fields[0]
+        if isinstance(field, ReferenceFieldFaker):
+            # NOTE: References draw from as many integer keys as rows, as if bound to
+            # the key column of another sheet of a workbook
+            key_index = ArrayKeyIndex()
+            key_index.extend(list(range(rows)))
+            field.bind(key_index, int)
+        for method in ("get_values", "get_native_values"):
+            generate = getattr(field, method)
+            # NOTE: Warm up lazily created resources, such as the field's Faker
+            generate(1)
+            elapsed = best_time(lambda g=generate: g(rows), repeat)
+            yield Metric(
+                f"field.{field_type}.{method}",
+                rows / elapsed,
+                "rows/s",
+                higher_is_better=True,
+            )
+
+
+def bench_writers(rows: int, repeat: int, directory: Path) -> Iterator[Metric]:
+    """End to end rows per second written to every available file format."""
+    for case in WRITER_CASES:
+        if case.requires and importlib.util.find_spec(case.requires) is None:
+            continue
+        file_path = directory / f"{case.name}{case.suffix}"
+        elapsed = best_time(lambda c=case, p=file_path: _write(c, p, rows), repeat)
+        yield Metric(
+            f"write.{case.name}",
+            rows / elapsed,
+            "rows/s",
+            higher_is_better=True,
+        )
+        yield Metric(
+            f"write.{case.name}.bytes",
+            file_path.stat().st_size,
+            "bytes",
+            higher_is_better=False,
+        )
+
+
+def bench_memory(row_counts: list[int], directory: Path) -> Iterator[Metric]:
+    """Peak memory allocated while writing files of several sizes."""
+    for suffix in MEMORY_SUFFIXES:
+        case = next(case for case in WRITER_CASES if case.suffix == suffix)
+        if case.requires and importlib.util.find_spec(case.requires) is None:
+            continue
+        for rows in row_counts:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                _write(case, directory / f"memory{suffix}", rows)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            yield Metric(
+                f"memory.{suffix.lstrip('.')}.{rows}",
+                peak,
+                "bytes",
+                higher_is_better=False,
+            )
+
+
+def bench_cli(repeat: int, directory: Path) -> Iterator[Metric]:
+    """
+    Time spent importing `fexcel`, starting its command line interface and running a
+    tiny invocation of it.
+    """
+    schema_path = directory / "cli-schema.json"
+    schema_path.write_text(json.dumps(WRITER_SCHEMA))
+    commands = {
+        "cli.interpreter": ["-c", "pass"],
+        "cli.import": ["-c", "import fexcel"],
+        "cli.startup": ["-m", "fexcel", "--help"],
+        "cli.tiny_run": [
+            "-m",
+            "fexcel",
+            str(schema_path),
+            str(directory / "cli.csv"),
+            "--num-fakes",
+            "10",
+        ],
+    }
+    env = os.environ.copy()
+    source = str(Path(fexcel.__file__).parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source, env.get("PYTHONPATH")]))
+    for name, arguments in commands.items():
+        elapsed = best_time(
+            lambda a=arguments: subprocess.run(  # noqa: S603
+                [sys.executable, *a],
+                check=True,
+                env=env,
+                stdout=subprocess.DEVNULL,
+            ),
+            repeat,
+        )
+        yield Metric(name, elapsed, "s", higher_is_better=False)
+
+
+def run(
+    *,
+    field_rows: int,
+    writer_rows: int,
+    memory_rows: list[int],
+    repeat: int,
+    groups: list[str],
+) -> list[Metric]:
+    """
+    Run the selected groups of benchmarks.
+
+    :param field_rows: Number of values generated per field type.
+    :type field_rows: int
+    :param writer_rows: Number of rows written per file format.
+    :type writer_rows: int
+    :param memory_rows: Row counts the peak memory is measured at.
+    :type memory_rows: list[int]
+    :param repeat: Number of runs of every timed benchmark, the fastest one is kept.
+    :type repeat: int
+    :param groups: Groups of benchmarks to run, any of `fields`, `writers`, `memory`
+    and `cli`.
+    :type groups: list[str]
+    :return: Every metric measured.
+    :rtype: list[Metric]
+    """
+    metrics: list[Metric] = []
+    with tempfile.TemporaryDirectory(prefix="fexcel-benchmarks-") as tmp:
+        directory = Path(tmp)
+        if "fields" in groups:
+            metrics.extend(bench_fields(field_rows, repeat))
+        if "writers" in groups:
+            metrics.extend(bench_writers(writer_rows, repeat, directory))
+        if "memory" in groups:
+            metrics.extend(bench_memory(memory_rows, directory))
+        if "cli" in groups:
+            metrics.extend(bench_cli(repeat, directory))
+    return metrics
+
+
+def _write(case: WriterCase, file_path: Path, rows: int) -> None:
+    fexcel = Fexcel(WRITER_SCHEMA, seed=SEED)
+    if case.writer is None:
+        fexcel.write_to_file(file_path, rows)
+        return
+    with case.writer(file_path) as writer:
+        fexcel.write_sheet(writer, rows)
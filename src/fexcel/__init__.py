@@ -1,4 +1,5 @@
 from .fields import FexcelField
 from .generator import Fexcel
+from .workbook import FexcelWorkbook
 
-__all__ = ["Fexcel", "FexcelField"]
+__all__ = ["Fexcel", "FexcelField", "FexcelWorkbook"]
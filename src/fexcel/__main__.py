@@ -1,8 +1,13 @@
+import json
 import sys
+import time
 from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
 
 from fexcel.generator import Fexcel
+from fexcel.profiling import Profiler
+from fexcel.stats import ProgressReporter, run_stats
+from fexcel.workbook import FexcelWorkbook
 
 
 @dataclass
@@ -10,6 +15,12 @@ class Args:
     schema_path: str
     output_path: str
     num_fakes: int
+    workers: int
+    seed: int | None
+    rollover: str
+    profile: bool
+    stats: str | None = None
+    progress: float | None = None
 
     @classmethod
     def from_namespace(cls, namespace: Namespace) -> "Args":
@@ -17,20 +28,75 @@ class Args:
             schema_path=namespace.schema_path,
             output_path=namespace.output_path,
             num_fakes=namespace.num_fakes,
+            workers=namespace.workers,
+            seed=namespace.seed,
+            rollover=namespace.rollover,
+            profile=namespace.profile,
+            stats=namespace.stats,
+            progress=namespace.progress,
         )
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    start = time.perf_counter()
+    args, profiler, error = None, None, None
     try:
-        args = parse_args()
-        fexcel = Fexcel.from_file(args.schema_path)
-        fexcel.write_to_file(args.output_path, args.num_fakes)
+        args = parse_args(argv)
+        with open(args.schema_path) as fp:  # noqa: PTH123
+            schema = json.load(fp)
+        # NOTE: The stats and the progress lines are built from the profiler
+        # measurements, so nothing is measured unless any of them is asked for.
+        if args.profile or args.stats is not None or args.progress is not None:
+            profiler = Profiler()
+        # NOTE: Multi-sheet workbooks are declared as an object with a list of sheets,
+        # while single sheet schemas are plain lists of fields.
+        if isinstance(schema, dict):
+            workbook = FexcelWorkbook(
+                schema,
+                seed=args.seed,
+                num_fakes=args.num_fakes,
+                profiler=profiler,
+            )
+            track_progress(profiler, args, sum(s.num_fakes for s in workbook.sheets))
+            workbook.write_to_file(args.output_path, workers=args.workers)
+        else:
+            fexcel = Fexcel(schema, seed=args.seed, profiler=profiler)
+            track_progress(profiler, args, args.num_fakes)
+            fexcel.write_to_file(
+                args.output_path,
+                args.num_fakes,
+                workers=args.workers,
+                rollover=args.rollover,
+            )
+        # NOTE: Stdout is left to the stats, so they can be piped to other programs
+        if args.profile:
+            print(profiler.report(), file=sys.stderr)
     except Exception as e:  # noqa: BLE001
-        print(f"fexcel: {e}")
+        error = e
+        print(f"fexcel: {e}", file=sys.stderr)
+    finally:
+        if args is not None and args.stats is not None:
+            elapsed = time.perf_counter() - start
+            write_stats(run_stats(profiler or Profiler(), elapsed, error), args.stats)
+    if error is not None:
         sys.exit(1)
 
 
-def parse_args(args: list[str] = sys.argv[1:]) -> Args:
+def track_progress(profiler: Profiler | None, args: Args, total: int) -> None:
+    if profiler is not None and args.progress is not None:
+        profiler.callback = ProgressReporter(total, args.progress)
+
+
+def write_stats(stats: dict, path: str) -> None:
+    content = json.dumps(stats, indent=2)
+    if path == "-":
+        print(content)
+        return
+    with open(path, "w") as fp:  # noqa: PTH123
+        fp.write(content + "\n")
+
+
+def parse_args(args: list[str] | None = None) -> Args:
     parser = ArgumentParser()
     parser.add_argument("schema_path", type=str, help="Path to the schema file")
     parser.add_argument("output_path", type=str, help="Path to the output file")
@@ -39,7 +105,51 @@ def parse_args(args: list[str] = sys.argv[1:]) -> Args:
         "--num-fakes",
         type=int,
         default=1000,
-        help="Number of fake records to generate",
+        help="Number of fake records to generate, per sheet in multi-sheet schemas",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes generating the fake records in parallel",
+    )
+    parser.add_argument(
+        "-s",
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed to make the generated records reproducible",
+    )
+    parser.add_argument(
+        "-r",
+        "--rollover",
+        type=str,
+        choices=Fexcel.ROLLOVER_MODES,
+        default="sheet",
+        help="Where records past the row limit of the file format are written to",
+    )
+    parser.add_argument(
+        "-p",
+        "--profile",
+        action="store_true",
+        help="Print the time spent on every field and writing phase to stderr",
+    )
+    parser.add_argument(
+        "--stats",
+        type=str,
+        nargs="?",
+        const="-",
+        default=None,
+        metavar="PATH",
+        help="Write a JSON report of the run to PATH, or print it if no PATH is given",
+    )
+    parser.add_argument(
+        "--progress",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Print the rows generated so far to stderr every SECONDS seconds",
     )
 
     return Args.from_namespace(parser.parse_args(args))
@@ -3,6 +3,9 @@ from .boolean import BooleanFieldFaker
 from .choice import ChoiceFieldFaker
 from .network import IPv4FieldFaker, IPv6FieldFaker, URLFieldFaker
 from .numeric import FloatFieldFaker, IntegerFieldFaker
+from .pool import PooledFieldFaker, ValuePool
+from .reference import ArrayKeyIndex, RangeKeyIndex, ReferenceFieldFaker
+from .sequence import SequenceFieldFaker
 from .temporal import DateFieldFaker, DateTimeFieldFaker, TimeFieldFaker
 from .text import (
     AddressFieldFaker,
@@ -16,6 +19,7 @@ from .text import (
 
 __all__ = [
     "AddressFieldFaker",
+    "ArrayKeyIndex",
     "BooleanFieldFaker",
     "ChoiceFieldFaker",
     "DateFieldFaker",
@@ -29,8 +33,13 @@ __all__ = [
     "LocationFieldFaker",
     "NameFieldFaker",
     "PhoneFieldFaker",
+    "PooledFieldFaker",
+    "RangeKeyIndex",
+    "ReferenceFieldFaker",
+    "SequenceFieldFaker",
     "TextFieldFaker",
     "TimeFieldFaker",
     "URLFieldFaker",
     "UUIDFieldFaker",
+    "ValuePool",
 ]
@@ -1,4 +1,56 @@
+import random
+import threading
 from abc import ABC, abstractmethod
+from functools import cache, cached_property
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+# NOTE: Building a `Faker` loads every one of its providers, which is expensive, so a
+# single instance per thread is shared by every field and only built once needed.
+_shared = threading.local()
+
+# NOTE: Smaller batches are faster to draw one by one than to import NumPy for them
+NUMPY_MIN_BATCH_SIZE = 1_000
+
+# NOTE: Unique values are given up on after this many batches in a row without a single
+# new value, the first retry drawing this many values and every other one twice more.
+MAX_UNIQUE_ATTEMPTS = 10
+MIN_UNIQUE_BATCH_SIZE = 100
+
+
+def shared_faker() -> "Faker":
+    """
+    Get the `Faker` instance shared by every field of the current thread, importing
+    `faker` and building it the first time it is needed.
+
+    :return: The shared `Faker` instance.
+    :rtype: Faker
+    """
+    fake = getattr(_shared, "fake", None)
+    if fake is None:
+        from faker import Faker  # noqa: PLC0415
+
+        fake = _shared.fake = Faker()
+    return fake
+
+
+@cache
+def import_numpy() -> ModuleType | None:
+    """
+    Import NumPy the first time a field needs it, so it is not paid for unless some
+    field generates a batch large enough to benefit from it.
+
+    :return: The `numpy` module, or None if it is not installed.
+    :rtype: ModuleType | None
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError:
+        return None
+    return np
 
 
 class FexcelField(ABC):
@@ -29,12 +81,57 @@ class FexcelField(ABC):
 
     _fakers: dict[str, type["FexcelField"]] = {}  # noqa: RUF012
 
+    native_type: type = str
+    """Python type of the values returned by `get_native_value`"""
+
+    indexed: bool = False
+    """Whether the values are derived from the index of their row, see `seek`"""
+
     def __init__(
         self,
         field_name: str,
+        *,
+        rng: random.Random | None = None,
+        unique: bool = False,
+        null_probability: float | str = 0,
         **_kwargs: str | float | list,
     ) -> None:
         self.name = field_name
+        self.unique = unique
+        self.null_probability = self._ensure_probability(null_probability)
+        self._rng = rng if rng is not None else random.Random()
+        self._seen: set[Any] = set()
+        self._unique_count = 0
+        # NOTE: Nulls are drawn apart so the values of a field do not depend on them
+        self._null_rng = (
+            random.Random(self._rng.getrandbits(64)) if self.null_probability else None
+        )
+
+    @staticmethod
+    def _ensure_probability(value: float | str) -> float:
+        try:
+            probability = float(value)
+        except (ValueError, TypeError) as err:
+            msg = f"Invalid 'null_probability': Unable to convert '{value}' to float"
+            raise ValueError(msg) from err
+        if not 0 <= probability <= 1:
+            msg = f"null_probability must be between 0 and 1, got {probability}"
+            raise ValueError(msg)
+        return probability
+
+    @property
+    def fake(self) -> "Faker":
+        """
+        `Faker` instance drawing from the field's own random generator, so fields never
+        share any random state. It is the instance every field shares, see
+        :func:`shared_faker`, bound to the field's generator on every access.
+
+        :return: The `Faker` instance bound to the field.
+        :rtype: Faker
+        """
+        fake = shared_faker()
+        fake.random = self._rng
+        return fake
 
     def __init_subclass__(cls, *, faker_types: str | list[str]) -> None:
         cls.register_faker(faker_types, cls)
@@ -101,6 +198,197 @@ class FexcelField(ABC):
         """
         ...
 
+    def get_values(self, n: int) -> list[str]:
+        """
+        Fake `n` values at once for the field this class is representing.
+
+        The default implementation just calls `get_value` `n` times, subclasses are
+        encouraged to override it with a faster batch implementation whenever their
+        underlying generator allows it.
+
+        :param n: The number of values to generate.
+        :type n: int
+        :return: A list with `n` values of the field.
+        :rtype: list[str]
+        """
+        get_value = self.get_value
+        return [get_value() for _ in range(n)]
+
+    def get_native_value(self) -> Any:
+        """
+        Fake a value for the field in its native Python type instead of as a string,
+        e.g. an `int` for integer fields or a `datetime` for datetime fields. Writers
+        of typed formats use it to emit real numeric, boolean and date cells.
+
+        Fields whose values are text do not need to override it, as it defaults to
+        `get_value`.
+
+        :return: The value of the field in its native type.
+        :rtype: Any
+        """
+        return self.get_value()
+
+    def get_native_values(self, n: int) -> list[Any]:
+        """
+        Fake `n` values at once for the field in their native Python type. Fields whose
+        values are text do not need to override it, as it defaults to `get_values`.
+
+        :param n: The number of values to generate.
+        :type n: int
+        :return: A list with `n` native values of the field.
+        :rtype: list[Any]
+        """
+        if type(self).get_native_value is FexcelField.get_native_value:
+            return self.get_values(n)
+        get_native_value = self.get_native_value
+        return [get_native_value() for _ in range(n)]
+
+    @property
+    def cardinality(self) -> int | None:
+        """
+        Number of distinct values the field can generate, if it is known and small
+        enough for unique values to run out.
+
+        :return: The number of distinct values, or None if it is unknown.
+        :rtype: int | None
+        """
+        return None
+
+    def get_column(self, n: int, *, native: bool = False) -> list[Any]:
+        """
+        Fake a column of `n` values, applying the constraints every field accepts, such
+        as `unique` and `null_probability`, on top of `get_values` (or
+        `get_native_values` in native mode). It is what `Fexcel` generates every column
+        with.
+
+        Null cells, None in native mode and empty strings otherwise, are drawn first
+        as a mask over the whole column, so only the remaining cells are generated
+        and nulls never count as unique values. Only `indexed` fields generate every
+        cell, so their values still match their rows.
+
+        :param n: The number of values to generate.
+        :type n: int
+        :param native: Whether to generate values in their native Python types instead
+        of strings, defaults to False
+        :type native: bool, optional
+        :return: A list with `n` values of the field.
+        :rtype: list[Any]
+        """
+        if not self.null_probability:
+            return self._get_dense_column(n, native=native)
+
+        null = None if native else ""
+        rows = self._non_null_rows(n)
+        if self.indexed:
+            values = self._get_dense_column(n, native=native)
+            column = [null] * n
+            for row in rows:
+                column[row] = values[row]
+            return column
+        if len(rows) == n:
+            return self._get_dense_column(n, native=native)
+        column = [null] * n
+        for row, value in zip(
+            rows,
+            self._get_dense_column(len(rows), native=native),
+            strict=True,
+        ):
+            column[row] = value
+        return column
+
+    def _get_dense_column(self, n: int, *, native: bool) -> list[Any]:
+        if self.unique:
+            return self.get_unique_values(n, native=native)
+        return self.get_native_values(n) if native else self.get_values(n)
+
+    def _non_null_rows(self, n: int) -> list[int]:
+        """
+        Draw the mask of null cells of a column of `n` values, as the indexes of the
+        rows which are not null.
+        """
+        if n >= NUMPY_MIN_BATCH_SIZE and import_numpy() is not None:
+            draws = self._null_np_rng.random(n)
+            return import_numpy().flatnonzero(draws >= self.null_probability).tolist()
+        random, probability = self._null_rng.random, self.null_probability
+        return [row for row in range(n) if random() >= probability]
+
+    @cached_property
+    def _null_np_rng(self) -> Any:
+        return import_numpy().random.default_rng(self._null_rng.getrandbits(64))
+
+    def seek(self, index: int) -> None:  # noqa: B027
+        """
+        Move the field to the row at position `index` of the column, so the next value
+        it generates is the one of that row. It is how shards and part files generated
+        on their own start where they belong in the column.
+
+        Only `indexed` fields, whose values are derived from the index of their row,
+        need to implement it, any other field ignores it.
+
+        :param index: The index of the next row, starting at 0.
+        :type index: int
+        """
+
+    def get_unique_values(self, n: int, *, native: bool = False) -> list[Any]:
+        """
+        Fake `n` values never generated before by the field.
+
+        The default implementation keeps every value generated so far and draws again
+        as many values as were repeated. Subclasses able to enumerate their values
+        without repeating them, e.g. ranges of integers, are encouraged to override it.
+
+        :param n: The number of values to generate.
+        :type n: int
+        :param native: Whether to generate values in their native Python types instead
+        of strings, defaults to False
+        :type native: bool, optional
+        :return: A list with `n` unique values of the field.
+        :rtype: list[Any]
+        :raises ValueError: If the field cannot generate `n` more unique values.
+        """
+        self.raise_if_not_enough_values(n)
+        get_values = self.get_native_values if native else self.get_values
+        values, seen, attempts = [], self._seen, 0
+        while len(values) < n:
+            missing = n - len(values)
+            # NOTE: Retries draw twice as many values every time none of them is new
+            size = (
+                max(missing, MIN_UNIQUE_BATCH_SIZE << attempts) if attempts else missing
+            )
+            found = 0
+            for value in get_values(size):
+                # NOTE: Values are kept themselves, their hashes may collide, e.g. the
+                # ones of -1 and -2.
+                if value not in seen and found < missing:
+                    seen.add(value)
+                    values.append(value)
+                    found += 1
+            self._unique_count += found
+            attempts = attempts + 1 if not found else 0
+            if attempts >= MAX_UNIQUE_ATTEMPTS:
+                msg = (
+                    f"Unable to generate {n} unique values for field '{self.name}', "
+                    f"its values ran out after {len(seen)} unique values"
+                )
+                raise ValueError(msg)
+        return values
+
+    def raise_if_not_enough_values(self, n: int) -> None:
+        """
+        Fail fast if the field can not generate `n` more unique values.
+
+        :param n: The number of unique values to generate.
+        :type n: int
+        :raises ValueError: If the field has fewer than `n` distinct values left.
+        """
+        cardinality = self.cardinality
+        if cardinality is not None and self._unique_count + n > cardinality:
+            msg = (
+                f"Unable to generate {n} unique values for field '{self.name}', "
+                f"it can only generate {cardinality} distinct values"
+            )
+            raise ValueError(msg)
+
     def __eq__(self, value: object) -> bool:
         if not isinstance(value, self.__class__):
             return False
@@ -120,6 +408,8 @@ class FexcelField(ABC):
         cls,
         field_name: str,
         field_type: str,
+        *,
+        rng: random.Random | None = None,
         **kwargs: str | float | list,
     ) -> "FexcelField":
         """
@@ -132,10 +422,13 @@ class FexcelField(ABC):
         :param field_type: The value used to parse the corresponding `FexcelField`,
         must correspond to a registered `FexcelField`
         :type field_type: str
+        :param rng: Random generator the field will draw its values from. If None, the
+        field creates its own unseeded generator.
+        :type rng: random.Random | None, optional
         :return: A concrete `FexcelField` implementation
         :rtype: FexcelField
         :raises ValueError: If the faker type is unknown.
         """
 
         faker_cls = cls.get_faker(field_type)
-        return faker_cls(field_name, **kwargs)
+        return faker_cls(field_name, rng=rng, **kwargs)
@@ -1,13 +1,11 @@
 from typing import Any
 
-from faker import Faker
-
 from fexcel.fields.base import FexcelField
 
-fake = Faker()
-
 
 class BooleanFieldFaker(FexcelField, faker_types=["bool", "boolean"]):
+    native_type = bool
+
     def __init__(
         self,
         field_name: str,
@@ -20,7 +18,13 @@ class BooleanFieldFaker(FexcelField, faker_types=["bool", "boolean"]):
             msg = f"Probability must be between 0 and 1, got {probability}"
             raise ValueError(msg)
         self.probability = probability
-        self.probability = probability
+
+    @property
+    def cardinality(self) -> int:
+        return 2 if 0 < self.probability < 1 else 1
 
     def get_value(self) -> str:
-        return str(fake.boolean(int(self.probability * 100)))
+        return str(self.get_native_value())
+
+    def get_native_value(self) -> bool:
+        return self.fake.boolean(int(self.probability * 100))
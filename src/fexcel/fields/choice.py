@@ -1,8 +1,10 @@
-import random
+import math
 from copy import deepcopy
+from functools import cached_property
+from itertools import accumulate
 from typing import Any
 
-from fexcel.fields.base import FexcelField
+from fexcel.fields.base import NUMPY_MIN_BATCH_SIZE, FexcelField, import_numpy
 
 
 class ChoiceFieldFaker(FexcelField, faker_types="choice"):
@@ -19,19 +21,73 @@ class ChoiceFieldFaker(FexcelField, faker_types="choice"):
         if not probabilities:
             probabilities = [1 / len(self.allowed_values)] * len(self.allowed_values)
         self.probabilities = self._parse_probabilities(probabilities)
+        self._build_sampler()
+
+    def _build_sampler(self) -> None:
+        """
+        Precompute the cumulative weights once so every draw is a binary search over
+        them instead of rebuilding them on each call.
+        """
+        self._cum_weights = list(accumulate(self.probabilities))
+        self._np_seed = self._rng.getrandbits(64)
+
+    @cached_property
+    def _np_sampler(self) -> tuple[Any, Any, Any] | None:
+        """
+        NumPy generator, values and cumulative weights used to draw large batches, only
+        built, and NumPy imported, the first time one is generated.
+        """
+        np = import_numpy()
+        if np is None:
+            return None
+        return (
+            np.random.default_rng(self._np_seed),
+            np.array(self.allowed_values, dtype=object),
+            np.array(self._cum_weights),
+        )
+
+    @property
+    def cardinality(self) -> int:
+        return len(
+            {
+                value
+                for value, probability in zip(
+                    self.allowed_values,
+                    self.probabilities,
+                    strict=True,
+                )
+                if probability > 0
+            },
+        )
 
     def get_value(self) -> str:
-        choice = random.choices(
+        choice = self._rng.choices(
             population=self.allowed_values,
-            weights=self.probabilities,
+            cum_weights=self._cum_weights,
         )
         return choice[0]
 
+    def get_values(self, n: int) -> list[str]:
+        if n < NUMPY_MIN_BATCH_SIZE or self._np_sampler is None:
+            return self._rng.choices(
+                population=self.allowed_values,
+                cum_weights=self._cum_weights,
+                k=n,
+            )
+        # NOTE: Same lookup `random.choices` does, uniform draws scaled to the total
+        # weight are searched on the cumulative weights, but for a whole batch.
+        np = import_numpy()
+        np_rng, np_values, np_cum_weights = self._np_sampler
+        draws = np_rng.random(n) * np_cum_weights[-1]
+        indexes = np.searchsorted(np_cum_weights, draws, side="right")
+        np.minimum(indexes, len(self.allowed_values) - 1, out=indexes)
+        return np_values[indexes].tolist()
+
     def _parse_probabilities(self, original_probabilities: list[float]) -> list[float]:
         probabilities = deepcopy(original_probabilities)
         if len(probabilities) <= len(self.allowed_values):
-            remaining_probability_space = 1 - sum(probabilities)
-            remaining_observations = len(probabilities) - len(self.allowed_values)
+            remaining_probability_space = 1 - math.fsum(probabilities)
+            remaining_observations = len(self.allowed_values) - len(probabilities)
             probabilities.extend(
                 remaining_probability_space / remaining_observations
                 for _ in range(remaining_observations)
@@ -49,8 +105,10 @@ class ChoiceFieldFaker(FexcelField, faker_types="choice"):
             msg = f"Probabilities must be positive, got {probabilities}"
             raise ValueError(msg)
 
-        if sum(probabilities) != 1:
-            msg = f"Probabilities must sum up to 1, got {sum(probabilities)}"
+        # NOTE: Compared with a tolerance, equidistributed probabilities for thousands
+        # of values do not add up exactly to 1 in floating point arithmetic.
+        if not math.isclose(math.fsum(probabilities), 1):
+            msg = f"Probabilities must sum up to 1, got {math.fsum(probabilities)}"
             raise ValueError(msg)
 
         return probabilities
@@ -1,20 +1,132 @@
-from faker import Faker
+import socket
+import struct
+from abc import abstractmethod
+from ipaddress import IPv4Network, IPv6Network, ip_network
+from itertools import accumulate
+from typing import Any, ClassVar
 
 from fexcel.fields.base import FexcelField
 
-fake = Faker()
-
 
 class URLFieldFaker(FexcelField, faker_types="url"):
     def get_value(self) -> str:
-        return fake.url()
+        return self.fake.url()
 
 
-class IPv4FieldFaker(FexcelField, faker_types="ipv4"):
-    def get_value(self) -> str:
-        return fake.ipv4()
+class IPFieldFaker(FexcelField, faker_types=[]):
+    """
+    Base class of the IP address fields, which draw their addresses from one or more
+    networks given in CIDR notation as `network`, or its alias `cidr`, e.g.
+    `"10.0.0.0/8"`. Every network is drawn from in proportion to its size.
+
+    Addresses are drawn as batches of random integers masked into the networks and
+    formatted by the `socket` module, without going through `faker` at all.
+    """
+
+    VERSION: ClassVar[int]
+    DEFAULT_NETWORK: ClassVar[str]
+
+    def __init__(
+        self,
+        field_name: str,
+        *,
+        network: str | list[str] | None = None,
+        cidr: str | list[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        if network is not None and cidr is not None:
+            msg = "Cannot specify both network and cidr"
+            raise ValueError(msg)
 
+        networks = network if network is not None else cidr
+        if networks is None:
+            networks = [self.DEFAULT_NETWORK]
+        elif isinstance(networks, str):
+            networks = [networks]
+        if not networks:
+            msg = "At least one network must be specified"
+            raise ValueError(msg)
+        self.networks = [self._ensure_network(value) for value in networks]
+
+        self._bases = [int(network.network_address) for network in self.networks]
+        self._masks = [int(network.hostmask) for network in self.networks]
+        self._cum_sizes = list(
+            accumulate(float(network.num_addresses) for network in self.networks),
+        )
+
+    def _ensure_network(self, value: str) -> IPv4Network | IPv6Network:
+        try:
+            network = ip_network(value, strict=False)
+        except (ValueError, TypeError) as err:
+            msg = f"Invalid network '{value}': {err}"
+            raise ValueError(msg) from err
+        if network.version != self.VERSION:
+            msg = f"Invalid network '{value}': Not an IPv{self.VERSION} network"
+            raise ValueError(msg)
+        return network
+
+    @property
+    def cardinality(self) -> int:
+        return sum(network.num_addresses for network in self.networks)
 
-class IPv6FieldFaker(FexcelField, faker_types="ipv6"):
     def get_value(self) -> str:
-        return fake.ipv6()
+        return self.get_values(1)[0]
+
+    def get_values(self, n: int) -> list[str]:
+        draws = self._random_integers(n)
+        if len(self.networks) == 1:
+            [base], [mask] = self._bases, self._masks
+            addresses = [base | (draw & mask) for draw in draws]
+        else:
+            bases, masks = self._bases, self._masks
+            indexes = self._rng.choices(
+                range(len(self.networks)),
+                cum_weights=self._cum_sizes,
+                k=n,
+            )
+            addresses = [
+                bases[index] | (draw & masks[index])
+                for index, draw in zip(indexes, draws, strict=True)
+            ]
+        return self._format(addresses)
+
+    @abstractmethod
+    def _random_integers(self, n: int) -> list[int]:
+        """
+        Draw `n` random integers of as many bits as the addresses.
+        """
+        ...
+
+    @abstractmethod
+    def _format(self, addresses: list[int]) -> list[str]:
+        """
+        Format addresses, given as integers, in their text representation.
+        """
+        ...
+
+
+class IPv4FieldFaker(IPFieldFaker, faker_types="ipv4"):
+    VERSION = 4
+    DEFAULT_NETWORK = "0.0.0.0/0"
+
+    def _random_integers(self, n: int) -> list[int]:
+        # NOTE: Every 4 random bytes are read at once as an unsigned 32 bits integer
+        return memoryview(self._rng.randbytes(4 * n)).cast("I").tolist()
+
+    def _format(self, addresses: list[int]) -> list[str]:
+        pack, inet_ntoa = struct.Struct(">I").pack, socket.inet_ntoa
+        return [inet_ntoa(pack(address)) for address in addresses]
+
+
+class IPv6FieldFaker(IPFieldFaker, faker_types="ipv6"):
+    VERSION = 6
+    DEFAULT_NETWORK = "::/0"
+
+    def _random_integers(self, n: int) -> list[int]:
+        buffer, from_bytes = self._rng.randbytes(16 * n), int.from_bytes
+        return [from_bytes(buffer[i : i + 16], "big") for i in range(0, 16 * n, 16)]
+
+    def _format(self, addresses: list[int]) -> list[str]:
+        inet_ntop, family = socket.inet_ntop, socket.AF_INET6
+        return [inet_ntop(family, address.to_bytes(16, "big")) for address in addresses]
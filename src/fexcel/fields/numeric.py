@@ -1,15 +1,16 @@
+import math
 import random
-from functools import partial
-from typing import Any
+from functools import cached_property, partial
+from typing import Any, Callable
 
-from faker import Faker
+from fexcel.fields.base import NUMPY_MIN_BATCH_SIZE, FexcelField, import_numpy
 
-from fexcel.fields.base import FexcelField
-
-fake = Faker()
+INT64_BOUND = 2.0**63
 
 
 class FloatFieldFaker(FexcelField, faker_types="float"):
+    native_type = float
+
     INTERVAL_DISTRIBUTIONS = ("uniform",)
     EXPONENTIAL_DISTRIBUTIONS = ("normal", "gaussian", "lognormal")
 
@@ -77,22 +78,127 @@ class FloatFieldFaker(FexcelField, faker_types="float"):
     def _resolve_rng(self) -> None:
         match self.distribution.lower():
             case "uniform":
-                self.rng = partial(random.uniform, self.min_value, self.max_value)
+                self.rng = partial(self._rng.uniform, self.min_value, self.max_value)
             case "normal":
-                self.rng = partial(random.normalvariate, self.mean, self.std)
+                self.rng = partial(self._rng.normalvariate, self.mean, self.std)
             case "gaussian":
-                self.rng = partial(random.gauss, self.mean, self.std)
+                self.rng = partial(self._rng.gauss, self.mean, self.std)
             case "lognormal":
-                self.rng = partial(random.lognormvariate, self.mean, self.std)
+                self.rng = partial(self._rng.lognormvariate, self.mean, self.std)
             case _:
                 msg = f"Invalid distribution: {self.distribution} for field {self.name}"
                 raise ValueError(msg)
+        self._np_seed = self._rng.getrandbits(64)
+
+    @cached_property
+    def np_rng(self) -> Callable[..., Any] | None:
+        """
+        Equivalent NumPy sampler able to draw whole arrays at once, only resolved, and
+        NumPy imported, the first time a large batch is generated. It is `None` when
+        NumPy is not installed so batches fall back to `rng`.
+        """
+        np = import_numpy()
+        if np is None:
+            return None
+        generator = np.random.default_rng(self._np_seed)
+        # NOTE: `Random` accepts negative deviations while NumPy does not, as both
+        # distributions are symmetric on it the absolute value is equivalent.
+        match self.distribution.lower():
+            case "uniform":
+                return partial(generator.uniform, self.min_value, self.max_value)
+            case "normal" | "gaussian":
+                return partial(generator.normal, self.mean, abs(self.std))
+            case "lognormal":
+                return partial(generator.lognormal, self.mean, abs(self.std))
+        return None
 
     def get_value(self) -> str:
-        return str(self.rng())
+        return str(self.get_native_value())
+
+    def get_values(self, n: int) -> list[str]:
+        return list(map(str, self.get_native_values(n)))
+
+    def get_native_value(self) -> float:
+        return self.rng()
+
+    def get_native_values(self, n: int) -> list[float]:
+        if n >= NUMPY_MIN_BATCH_SIZE and self.np_rng is not None:
+            return self.np_rng(size=n).tolist()
+        rng = self.rng
+        return [rng() for _ in range(n)]
+
+
+class Permutation:
+    """
+    Pseudo random bijection of `range(size)`, so every index is mapped to a different
+    value without keeping track of the values already drawn.
+
+    It is a Feistel network over the smallest even number of bits covering `size`,
+    whose outputs past `size` are walked through the network again until they fall
+    within it, see "Ciphers with Arbitrary Finite Domains" by Black and Rogaway.
+
+    :param size: The number of values to permute.
+    :param rng: Random generator the keys of the network are drawn from.
+    """
+
+    ROUNDS = 6
+    MULTIPLIER = 0x9E3779B97F4A7C15
+
+    def __init__(self, size: int, rng: random.Random) -> None:
+        self.size = size
+        self._half_bits = max((size - 1).bit_length() + 1, 2) // 2
+        self._mask = (1 << self._half_bits) - 1
+        self._keys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+
+    def __call__(self, index: int) -> int:
+        half_bits, mask, multiplier = self._half_bits, self._mask, self.MULTIPLIER
+        while True:
+            left, right = index >> half_bits, index & mask
+            for key in self._keys:
+                mixed = ((right ^ key) * multiplier) >> 32
+                left, right = right, left ^ (mixed & mask)
+            index = (left << half_bits) | right
+            if index < self.size:
+                return index
 
 
 # NOTE: If Python allows `int` to be treated as a `float` then I will too
 class IntegerFieldFaker(FloatFieldFaker, faker_types=["int", "integer"]):
-    def get_value(self) -> str:
-        return str(int(self.rng()))
+    native_type = int
+
+    @property
+    def cardinality(self) -> int | None:
+        if self.distribution.lower() != "uniform":
+            return None
+        return max(math.floor(self.max_value) - math.ceil(self.min_value) + 1, 0)
+
+    @cached_property
+    def _permutation(self) -> Permutation:
+        return Permutation(self.cardinality, self._rng)
+
+    def get_unique_values(self, n: int, *, native: bool = False) -> list[Any]:
+        """
+        Uniform integers are unique by construction, as the `i`-th one is the `i`-th
+        index of a pseudo random permutation of the range, so they never collide.
+        """
+        if self.cardinality is None:
+            return super().get_unique_values(n, native=native)
+        start = self._unique_count
+        self.raise_if_not_enough_values(n)
+        self._unique_count += n
+        low, permutation = math.ceil(self.min_value), self._permutation
+        values = [low + permutation(index) for index in range(start, start + n)]
+        return values if native else list(map(str, values))
+
+    def get_native_value(self) -> int:
+        return int(self.rng())
+
+    def get_native_values(self, n: int) -> list[int]:
+        if n >= NUMPY_MIN_BATCH_SIZE and self.np_rng is not None:
+            np = import_numpy()
+            values = np.trunc(self.np_rng(size=n))
+            if np.all(np.abs(values) < INT64_BOUND):
+                return values.astype(np.int64).tolist()
+            return [int(value) for value in values.tolist()]
+        rng = self.rng
+        return [int(rng()) for _ in range(n)]
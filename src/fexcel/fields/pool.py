@@ -0,0 +1,269 @@
+import math
+import sys
+from abc import abstractmethod
+from collections.abc import Callable, Hashable
+from functools import cached_property
+from itertools import accumulate
+from typing import Any
+
+from fexcel.fields.base import NUMPY_MIN_BATCH_SIZE, FexcelField, import_numpy
+
+DEFAULT_POOL_MEMORY_LIMIT = 64 * 1024 * 1024
+
+
+class ValuePool:
+    """
+    Bounded pool of values, generated the first time they are needed and then drawn
+    from by every field sharing it.
+
+    The pool holds at most `size` values and stops growing once they take
+    `memory_limit` bytes, so it may end up holding fewer than `size` values.
+
+    :param size: Maximum number of values of the pool.
+    :param memory_limit: Maximum number of bytes taken by the values of the pool.
+    """
+
+    def __init__(self, size: int, memory_limit: int) -> None:
+        self.size = size
+        self.memory_limit = memory_limit
+        self._values: list[Any] | None = None
+
+    def __repr__(self) -> str:
+        return f"ValuePool(size={self.size}, memory_limit={self.memory_limit})"
+
+    def get_values(self, generate: Callable[[], Any]) -> list[Any]:
+        """
+        Get the values of the pool, generating them with `generate` the first time.
+
+        :param generate: Function generating a single new value.
+        :type generate: Callable[[], Any]
+        :return: The values of the pool.
+        :rtype: list[Any]
+        """
+        if self._values is None:
+            values, nbytes = [], 0
+            for _ in range(self.size):
+                value = generate()
+                # NOTE: Every value is also referenced by a pointer from the list
+                nbytes += sys.getsizeof(value) + 8
+                if values and nbytes > self.memory_limit:
+                    break
+                values.append(value)
+            self._values = values
+        return self._values
+
+
+# NOTE: Registered without any field type, only its subclasses are actual fields
+class PooledFieldFaker(FexcelField, faker_types=[]):
+    """
+    Base class of the fields whose values are expensive to generate, which can draw
+    them from a bounded pool of `pool_size` values generated once instead.
+
+    Values are drawn uniformly from the pool by default. With `"zipf"` as
+    `pool_distribution` the n-th value of the pool is drawn with a weight of
+    `1 / n ** pool_skew`, and `pool_weights` gives the weight of every value
+    explicitly, in which case `pool_size` defaults to their number.
+
+    With `shared_pool`, fields of the same type and pool settings of a schema draw from
+    the very same pool, see :meth:`pool_key`.
+
+    Subclasses implement `generate_value` instead of `get_value`.
+    """
+
+    POOL_DISTRIBUTIONS = ("uniform", "zipf")
+
+    def __init__(  # noqa: PLR0913
+        self,
+        field_name: str,
+        *,
+        pool_size: int | str | None = None,
+        pool_distribution: str = "uniform",
+        pool_skew: float | str = 1.0,
+        pool_weights: list[float | str] | None = None,
+        pool_memory_limit: int | str = DEFAULT_POOL_MEMORY_LIMIT,
+        shared_pool: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        if pool_weights is not None:
+            pool_weights = [
+                self._ensure_pool_float(weight, "pool_weights")
+                for weight in pool_weights
+            ]
+        if pool_size is None and pool_weights:
+            pool_size = len(pool_weights)
+        self.pool_size = (
+            self._ensure_pool_int(pool_size, "pool_size")
+            if pool_size is not None
+            else None
+        )
+        self.pool_distribution = pool_distribution.lower()
+        self.pool_skew = self._ensure_pool_float(pool_skew, "pool_skew")
+        self.pool_weights = pool_weights
+        self.pool_memory_limit = self._ensure_pool_int(
+            pool_memory_limit,
+            "pool_memory_limit",
+        )
+        self.shared_pool = shared_pool
+        self._raise_if_invalid_pool()
+
+        self.value_pool = None
+        if self.pool_size is not None:
+            self.value_pool = ValuePool(self.pool_size, self.pool_memory_limit)
+            self._np_seed = self._rng.getrandbits(64)
+
+    # NOTE: Named apart from the `_ensure_int` of subclasses, which take a default
+    @staticmethod
+    def _ensure_pool_int(value: int | str, var_name: str) -> int:
+        msg = f"Invalid '{var_name}': Unable to convert '{value}' to int"
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError(msg)
+        try:
+            return int(value)
+        except (ValueError, TypeError) as err:
+            raise ValueError(msg) from err
+
+    @staticmethod
+    def _ensure_pool_float(value: float | str, var_name: str) -> float:
+        try:
+            return float(value)
+        except (ValueError, TypeError) as err:
+            msg = f"Invalid '{var_name}': Unable to convert '{value}' to float"
+            raise ValueError(msg) from err
+
+    def _raise_if_invalid_pool(self) -> None:
+        if self.pool_size is None:
+            return
+        if self.pool_size <= 0:
+            msg = f"pool_size must be a positive integer, got {self.pool_size}"
+            raise ValueError(msg)
+        if self.pool_skew <= 0:
+            msg = f"pool_skew must be a positive number, got {self.pool_skew}"
+            raise ValueError(msg)
+        if self.pool_memory_limit <= 0:
+            msg = (
+                "pool_memory_limit must be a positive number of bytes, "
+                f"got {self.pool_memory_limit}"
+            )
+            raise ValueError(msg)
+        if self.pool_distribution not in self.POOL_DISTRIBUTIONS:
+            msg = (
+                f"Invalid pool_distribution '{self.pool_distribution}', "
+                f"expected one of {self.POOL_DISTRIBUTIONS}"
+            )
+            raise ValueError(msg)
+        if self.pool_weights is not None:
+            if len(self.pool_weights) != self.pool_size:
+                msg = (
+                    "pool_weights must have a weight for every value of the pool, got "
+                    f"{len(self.pool_weights)} weights for a pool_size of "
+                    f"{self.pool_size}"
+                )
+                raise ValueError(msg)
+            if any(w < 0 for w in self.pool_weights) or not math.fsum(
+                self.pool_weights,
+            ):
+                msg = f"pool_weights must be positive, got {self.pool_weights}"
+                raise ValueError(msg)
+
+    @abstractmethod
+    def generate_value(self) -> str:
+        """
+        Generate a new value for the field, without drawing it from the pool.
+
+        :return: The new value of the field.
+        :rtype: str
+        """
+        ...
+
+    def generate_values(self, n: int) -> list[str]:
+        """
+        Generate `n` new values for the field, without drawing them from the pool.
+        Subclasses are encouraged to override it with a faster batch implementation.
+
+        :param n: The number of values to generate.
+        :type n: int
+        :return: A list with `n` new values of the field.
+        :rtype: list[str]
+        """
+        generate_value = self.generate_value
+        return [generate_value() for _ in range(n)]
+
+    @property
+    def pool_key(self) -> Hashable | None:
+        """
+        Key identifying the pool of the field among the pools of a schema, fields with
+        the same key share a single pool. Subclasses whose values depend on further
+        constraints must add them to the key.
+
+        :return: The key of the pool, or None if it is not shared.
+        :rtype: Hashable | None
+        """
+        if self.value_pool is None or not self.shared_pool:
+            return None
+        return (type(self), self.pool_size, self.pool_memory_limit)
+
+    @property
+    def cardinality(self) -> int | None:
+        if self.value_pool is None:
+            return None
+        values, cum_weights = self._pool_sampler
+        if cum_weights is not None:
+            # NOTE: Values never drawn, given a weight of zero, do not count
+            previous = [0, *cum_weights[:-1]]
+            values = [
+                value
+                for value, low, high in zip(values, previous, cum_weights, strict=True)
+                if high > low
+            ]
+        return len(set(values))
+
+    @cached_property
+    def _pool_sampler(self) -> tuple[list[str], list[float] | None]:
+        """
+        Values of the pool and their cumulative weights, None when they are drawn
+        uniformly. Only built, and the pool generated, the first time one is drawn.
+        """
+        values = self.value_pool.get_values(self.generate_value)
+        if self.pool_weights is not None:
+            weights = self.pool_weights[: len(values)]
+        elif self.pool_distribution == "zipf":
+            weights = [1 / rank**self.pool_skew for rank in range(1, len(values) + 1)]
+        else:
+            return values, None
+        return values, list(accumulate(weights))
+
+    @cached_property
+    def _np_pool_sampler(self) -> tuple[Any, Any, Any] | None:
+        np = import_numpy()
+        if np is None:
+            return None
+        values, cum_weights = self._pool_sampler
+        return (
+            np.random.default_rng(self._np_seed),
+            np.array(values, dtype=object),
+            np.array(cum_weights) if cum_weights is not None else None,
+        )
+
+    def get_value(self) -> str:
+        if self.value_pool is None:
+            return self.generate_value()
+        values, cum_weights = self._pool_sampler
+        return self._rng.choices(values, cum_weights=cum_weights)[0]
+
+    def get_values(self, n: int) -> list[str]:
+        if self.value_pool is None:
+            return self.generate_values(n)
+        if n < NUMPY_MIN_BATCH_SIZE or self._np_pool_sampler is None:
+            values, cum_weights = self._pool_sampler
+            return self._rng.choices(values, cum_weights=cum_weights, k=n)
+
+        np = import_numpy()
+        np_rng, np_values, np_cum_weights = self._np_pool_sampler
+        if np_cum_weights is None:
+            indexes = np_rng.integers(0, len(np_values), n)
+        else:
+            draws = np_rng.random(n) * np_cum_weights[-1]
+            indexes = np.searchsorted(np_cum_weights, draws, side="right")
+            np.minimum(indexes, len(np_values) - 1, out=indexes)
+        return np_values[indexes].tolist()
@@ -0,0 +1,197 @@
+from array import array
+from itertools import accumulate
+from typing import Any
+
+from fexcel.fields.base import FexcelField
+
+
+class RangeKeyIndex:
+    """
+    Index of the keys of a sequence column, which are described by their range alone,
+    so it takes constant memory whatever the number of keys.
+
+    :param keys: The range of the keys, in row order.
+    :type keys: range
+    :param format_string: Format of the keys, if they are not plain integers.
+    :type format_string: str | None, optional
+    """
+
+    def __init__(self, keys: range, format_string: str | None = None) -> None:
+        self.keys = keys
+        self.format_string = format_string
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.take([index])[0]
+
+    def take(self, indexes: list[int]) -> list[Any]:
+        """
+        Get the keys at every one of the `indexes`.
+
+        :param indexes: Positions of the keys, in row order.
+        :type indexes: list[int]
+        :return: A list with the key at every position.
+        :rtype: list[Any]
+        """
+        keys = self.keys
+        if self.format_string is None:
+            return [keys[index] for index in indexes]
+        return [self.format_string.format(keys[index]) for index in indexes]
+
+
+class ArrayKeyIndex:
+    """
+    Index of the keys of a column, filled block by block as the column is generated.
+
+    Integer keys are packed in an `array` of 64 bits integers, any other key is
+    stored encoded as UTF-8 in a single buffer along with the offsets where each one of
+    them starts, so neither takes a Python object per key.
+    """
+
+    def __init__(self) -> None:
+        self._integers: array | None = None
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+
+    def __len__(self) -> int:
+        if self._integers is not None:
+            return len(self._integers)
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> Any:
+        return self.take([index])[0]
+
+    def extend(self, keys: list[Any]) -> None:
+        """
+        Add the keys of a new block of the column.
+
+        :param keys: The keys to add, in row order.
+        :type keys: list[Any]
+        """
+        if not keys:
+            return
+        if not len(self) and all(type(key) is int for key in keys):
+            self._integers = array("q")
+        if self._integers is not None:
+            try:
+                # NOTE: `array.extend` keeps the keys it added before failing, so the
+                # block is packed on its own first and only then added as a whole.
+                integers = array("q", keys)
+            except (TypeError, OverflowError):
+                self._to_strings()
+            else:
+                self._integers += integers
+                return
+
+        encoded = [str(key).encode() for key in keys]
+        start = self._offsets[-1]
+        self._offsets.extend(start + end for end in accumulate(map(len, encoded)))
+        self._buffer += b"".join(encoded)
+
+    def _to_strings(self) -> None:
+        """
+        Switch to storing keys as strings, once a key is not a 64 bits integer.
+        """
+        integers, self._integers = self._integers, None
+        self.extend([str(key) for key in integers])
+
+    def take(self, indexes: list[int]) -> list[Any]:
+        """
+        Get the keys at every one of the `indexes`.
+
+        :param indexes: Positions of the keys, in row order.
+        :type indexes: list[int]
+        :return: A list with the key at every position.
+        :rtype: list[Any]
+        """
+        if self._integers is not None:
+            integers = self._integers
+            return [integers[index] for index in indexes]
+        buffer, offsets = self._buffer, self._offsets
+        return [
+            buffer[offsets[index] : offsets[index + 1]].decode() for index in indexes
+        ]
+
+
+class ReferenceFieldFaker(FexcelField, faker_types=["reference", "foreign_key"]):
+    """
+    Field of foreign keys drawn uniformly from the keys of the `field` column of
+    another `sheet` of the same workbook, to which the field is bound by
+    :class:`fexcel.FexcelWorkbook` through a key index.
+
+    Keys of `sequence` columns are indexed by their range alone, so they can be drawn
+    before or while they are generated, keys of any other column are indexed as the
+    sheet is generated, so it must be declared before the sheets referencing it.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        *,
+        sheet: str | None = None,
+        field: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        if not sheet or not field:
+            msg = "Both sheet and field of the referenced column must be specified"
+            raise ValueError(msg)
+        self.sheet = sheet
+        self.field = field
+        self._key_index: RangeKeyIndex | ArrayKeyIndex | None = None
+
+    def bind(
+        self,
+        key_index: RangeKeyIndex | ArrayKeyIndex,
+        native_type: type = str,
+    ) -> None:
+        """
+        Bind the field to the index of the keys it references.
+
+        :param key_index: The index of the referenced keys.
+        :type key_index: RangeKeyIndex | ArrayKeyIndex
+        :param native_type: Python type of the referenced keys, defaults to str
+        :type native_type: type, optional
+        """
+        self._key_index = key_index
+        self.native_type = native_type
+
+    @property
+    def key_index(self) -> RangeKeyIndex | ArrayKeyIndex | None:
+        return self._key_index
+
+    @property
+    def cardinality(self) -> int | None:
+        # NOTE: Writers may hold sheets until they are saved, so the keys of a sheet
+        # may not be indexed yet when the sheets referencing them are written.
+        if self._key_index is None or not len(self._key_index):
+            return None
+        return len(self._key_index)
+
+    def get_value(self) -> str:
+        return self.get_values(1)[0]
+
+    def get_values(self, n: int) -> list[str]:
+        return list(map(str, self.get_native_values(n)))
+
+    def get_native_value(self) -> Any:
+        return self.get_native_values(1)[0]
+
+    def get_native_values(self, n: int) -> list[Any]:
+        if self._key_index is None:
+            msg = (
+                f"Reference field '{self.name}' is not bound to '{self.sheet}', "
+                "references can only be resolved within a workbook"
+            )
+            raise ValueError(msg)
+        size = len(self._key_index)
+        if not size:
+            msg = (
+                f"No keys of '{self.sheet}.{self.field}' to reference, the sheet "
+                "must be generated first"
+            )
+            raise ValueError(msg)
+        random = self._rng.random
+        return self._key_index.take([int(random() * size) for _ in range(n)])
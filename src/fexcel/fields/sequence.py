@@ -0,0 +1,103 @@
+from typing import Any
+
+from fexcel.fields.base import FexcelField
+
+
+class SequenceFieldFaker(FexcelField, faker_types=["sequence", "serial"]):
+    """
+    Field of sequential identifiers, e.g. primary keys, whose value is derived from the
+    index of its row alone as `start + index * step`. Shards and part files generated
+    on their own just seek to the index of their first row, so every one of them gets
+    its own contiguous range of identifiers without any coordination.
+
+    Values are plain integers unless they are zero padded to `padding` digits, preceded
+    by a `prefix` or formatted with a `format_string`, e.g. `"INV-{:06d}"`, in which
+    case they are strings.
+    """
+
+    indexed = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        field_name: str,
+        *,
+        start: int | str = 1,
+        step: int | str = 1,
+        padding: int | str = 0,
+        prefix: str = "",
+        format_string: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        self.start = self._ensure_int(start, "start")
+        self.step = self._ensure_int(step, "step")
+        self.padding = self._ensure_int(padding, "padding")
+        self.prefix = str(prefix)
+        self.format_string = format_string
+        self._raise_if_invalid_combination()
+
+        if self.format_string is None and (self.padding or self.prefix):
+            prefix = self.prefix.replace("{", "{{").replace("}", "}}")
+            self.format_string = f"{prefix}{{:0{self.padding}d}}"
+        self.native_type = int if self.format_string is None else str
+        self._index = 0
+
+    @staticmethod
+    def _ensure_int(value: int | str, var_name: str) -> int:
+        try:
+            return int(value)
+        except (ValueError, TypeError) as err:
+            msg = f"Invalid '{var_name}': Unable to convert '{value}' to int"
+            raise ValueError(msg) from err
+
+    def _raise_if_invalid_combination(self) -> None:
+        if self.step == 0:
+            msg = "step must be different from 0"
+            raise ValueError(msg)
+
+        if self.padding < 0:
+            msg = f"Invalid 'padding': Must be a positive integer, got {self.padding}"
+            raise ValueError(msg)
+
+        if self.format_string is not None and (self.padding or self.prefix):
+            msg = "Cannot specify both format_string and padding/prefix"
+            raise ValueError(msg)
+
+        if self.format_string is not None:
+            try:
+                self.format_string.format(self.start)
+            except (ValueError, IndexError, KeyError) as err:
+                msg = f"Invalid 'format_string': '{self.format_string}', {err}"
+                raise ValueError(msg) from err
+
+    def seek(self, index: int) -> None:
+        self._index = index
+
+    def get_value(self) -> str:
+        return self.get_values(1)[0]
+
+    def get_values(self, n: int) -> list[str]:
+        values = self._next_range(n)
+        if self.format_string is None:
+            return list(map(str, values))
+        return list(map(self.format_string.format, values))
+
+    def get_native_value(self) -> int | str:
+        return self.get_native_values(1)[0]
+
+    def get_native_values(self, n: int) -> list[int | str]:
+        if self.format_string is None:
+            return list(self._next_range(n))
+        return self.get_values(n)
+
+    def get_unique_values(self, n: int, *, native: bool = False) -> list[Any]:
+        # NOTE: Sequences never repeat a value, no need to keep track of them
+        return self.get_native_values(n) if native else self.get_values(n)
+
+    def _next_range(self, n: int) -> range:
+        """
+        Values of the next `n` rows, moving the field past them.
+        """
+        first = self.start + self._index * self.step
+        self._index += n
+        return range(first, first + n * self.step, self.step)
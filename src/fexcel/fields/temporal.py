@@ -1,14 +1,87 @@
-from datetime import datetime, timezone
-from typing import Any
+from collections.abc import Callable
+from datetime import date, datetime, time, timedelta, timezone
+from functools import cached_property
+from operator import methodcaller
+from typing import Any, ClassVar
 
-from faker import Faker
+from fexcel.fields.base import NUMPY_MIN_BATCH_SIZE, FexcelField, import_numpy
 
-from fexcel.fields.base import FexcelField
+EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
 
-fake = Faker()
 
+class TemporalFieldFaker(FexcelField, faker_types=[]):
+    """
+    Base class of the temporal fields, which draw their values as integer offsets from
+    the epoch, in `UNIT`, between bounds resolved once when the field is created.
+
+    The most common format strings, listed in `FAST_FORMATS`, are formatted through
+    `isoformat` instead of `strftime`, which is several times slower.
+    """
+
+    UNIT: ClassVar[str] = "us"
+    FAST_FORMATS: ClassVar[dict[str, Callable[[Any], str]]] = {}
+
+    def __init__(self, field_name: str, *, format_string: str, **kwargs: Any) -> None:
+        super().__init__(field_name, **kwargs)
+        self.format_string = format_string
+        self._np_seed = self._rng.getrandbits(64)
+
+    def _resolve_bounds(self, low: int, high: int, *, fast_format: bool = True) -> None:
+        """
+        Resolve the offsets values are drawn between, both included, and the function
+        formatting them.
+        """
+        self._low, self._high = low, high
+        self._epoch = EPOCH.date() if self.UNIT == "D" else EPOCH
+        self._unit = (
+            timedelta(days=1) if self.UNIT == "D" else timedelta(microseconds=1)
+        )
+        self._format = (
+            self.FAST_FORMATS.get(self.format_string) if fast_format else None
+        ) or methodcaller("strftime", self.format_string)
+
+    @property
+    def cardinality(self) -> int:
+        return self._high - self._low + 1
+
+    @cached_property
+    def np_rng(self) -> Any:
+        return import_numpy().random.default_rng(self._np_seed)
+
+    def get_value(self) -> str:
+        return self._format(self.get_native_value())
+
+    def get_values(self, n: int) -> list[str]:
+        return list(map(self._format, self.get_native_values(n)))
+
+    def get_native_value(self) -> Any:
+        return self.get_native_values(1)[0]
+
+    def get_native_values(self, n: int) -> list[Any]:
+        if n >= NUMPY_MIN_BATCH_SIZE and import_numpy() is not None:
+            offsets = self.np_rng.integers(self._low, self._high, n, endpoint=True)
+            return offsets.astype(f"datetime64[{self.UNIT}]").tolist()
+
+        # NOTE: Spans of microseconds exceed the 53 bits of a random float, so offsets
+        # are drawn as integers to reach every one of them.
+        randrange, low, high = self._rng.randrange, self._low, self._high + 1
+        epoch, unit = self._epoch, self._unit
+        return [epoch + unit * randrange(low, high) for _ in range(n)]
+
+
+class DateTimeFieldFaker(TemporalFieldFaker, faker_types=["datetime", "timestamp"]):
+    native_type = datetime
+
+    # NOTE: The bounds are fixed by default, so the values of a seed never change
+    DEFAULT_END_DATE = datetime(2025, 1, 1)  # noqa: DTZ001
+
+    FAST_FORMATS: ClassVar[dict[str, Callable[[Any], str]]] = {
+        "%Y-%m-%d %H:%M:%S": methodcaller("isoformat", " ", "seconds"),
+        "%Y-%m-%dT%H:%M:%S": methodcaller("isoformat", "T", "seconds"),
+        "%Y-%m-%d %H:%M:%S.%f": methodcaller("isoformat", " ", "microseconds"),
+        "%Y-%m-%dT%H:%M:%S.%f": methodcaller("isoformat", "T", "microseconds"),
+    }
 
-class DateTimeFieldFaker(FexcelField, faker_types=["datetime", "timestamp"]):
     def __init__(
         self,
         field_name: str,
@@ -18,45 +91,73 @@ class DateTimeFieldFaker(FexcelField, faker_types=["datetime", "timestamp"]):
         format_string: str = "%Y-%m-%d %H:%M:%S",
         **kwargs: Any,
     ) -> None:
-        super().__init__(field_name, **kwargs)
+        super().__init__(field_name, format_string=format_string, **kwargs)
 
-        self.format_string = format_string
-
-        if isinstance(start_date, str):
-            start_date = self._ensure_datetime(start_date, "start_date")
-        self.start_date = start_date
+        self.start_date = self._ensure_datetime(start_date, "start_date", EPOCH)
+        self.end_date = self._ensure_datetime(
+            end_date, "end_date", self.DEFAULT_END_DATE
+        )
 
-        if isinstance(end_date, str):
-            end_date = self._ensure_datetime(end_date, "end_date")
-        self.end_date = end_date
+        if self.start_date > self.end_date:
+            msg = "start_date must be earlier than or equal to end_date"
+            raise ValueError(msg)
 
-    def _ensure_datetime(self, value: str, var_name: str) -> datetime | None:
-        try:
-            self._try_parse_datetime(value)
-        except ValueError as err:
-            msg = (
-                f"Invalid '{var_name}': '{value}'. A Date or Datetime "
-                "can only be in ISO601 or with a user provided format string"
-            )
-            raise ValueError(msg) from err
+        self._resolve_bounds(
+            self.to_offset(self.start_date),
+            self.to_offset(self.end_date),
+            # NOTE: `isoformat` pads years to 4 digits, unlike `strftime`
+            fast_format=self.start_date.year >= 1000,  # noqa: PLR2004
+        )
 
-    def _try_parse_datetime(self, value: str) -> datetime | None:
+    def _ensure_datetime(
+        self,
+        value: str | date | None,
+        var_name: str,
+        default: datetime,
+    ) -> datetime:
+        if value is None:
+            return default
+        if isinstance(value, str):
+            try:
+                value = self._try_parse_datetime(value)
+            except ValueError as err:
+                msg = (
+                    f"Invalid '{var_name}': '{value}'. A Date or Datetime "
+                    "can only be in ISO601 or with a user provided format string"
+                )
+                raise ValueError(msg) from err
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, time())
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def _try_parse_datetime(self, value: str) -> datetime:
         try:
-            return datetime.strptime(value, self.format_string).astimezone(timezone.utc)
+            return datetime.strptime(value, self.format_string)  # noqa: DTZ007
         except ValueError:
             return datetime.fromisoformat(value)
 
-    def get_value(self) -> str:
-        return self.random_datetime().strftime(self.format_string)
+    def to_offset(self, value: datetime) -> int:
+        """
+        Convert a bound of the field to the offset from the epoch values are drawn as.
 
-    def random_datetime(self) -> datetime:
-        epoch = datetime(1970, 1, 1, 0, 0, 0, 0, timezone.utc)
-        start_value = self.start_date or epoch
-        end_value = self.end_date or datetime.now(timezone.utc)
-        return fake.date_time_between(start_value, end_value)
+        :param value: The bound to convert.
+        :type value: datetime
+        :return: The offset from the epoch, in `UNIT`.
+        :rtype: int
+        """
+        return (value - EPOCH) // timedelta(microseconds=1)
 
 
 class DateFieldFaker(DateTimeFieldFaker, faker_types="date"):
+    native_type = date
+
+    UNIT: ClassVar[str] = "D"
+    FAST_FORMATS: ClassVar[dict[str, Callable[[Any], str]]] = {
+        "%Y-%m-%d": methodcaller("isoformat"),
+    }
+
     def __init__(
         self,
         field_name: str,
@@ -64,18 +165,82 @@ class DateFieldFaker(DateTimeFieldFaker, faker_types="date"):
         start_date: str | datetime | None = None,
         end_date: str | datetime | None = None,
         format_string: str = "%Y-%m-%d",
+        **kwargs: Any,
     ) -> None:
         super().__init__(
             field_name=field_name,
             start_date=start_date,
             end_date=end_date,
             format_string=format_string,
+            **kwargs,
         )
 
-    def get_value(self) -> str:
-        return self.random_datetime().date().strftime(self.format_string)
+    def to_offset(self, value: datetime) -> int:
+        return (value.date() - EPOCH.date()).days
 
 
-class TimeFieldFaker(FexcelField, faker_types="time"):
-    def get_value(self) -> str:
-        return fake.time()
+class TimeFieldFaker(TemporalFieldFaker, faker_types="time"):
+    native_type = time
+
+    FAST_FORMATS: ClassVar[dict[str, Callable[[Any], str]]] = {
+        "%H:%M:%S": methodcaller("isoformat", "seconds"),
+        "%H:%M": methodcaller("isoformat", "minutes"),
+        "%H:%M:%S.%f": methodcaller("isoformat", "microseconds"),
+    }
+
+    def __init__(
+        self,
+        field_name: str,
+        *,
+        start_time: str | time | None = None,
+        end_time: str | time | None = None,
+        format_string: str = "%H:%M:%S",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, format_string=format_string, **kwargs)
+
+        self.start_time = self._ensure_time(start_time, "start_time", time.min)
+        self.end_time = self._ensure_time(end_time, "end_time", time.max)
+
+        if self.start_time > self.end_time:
+            msg = "start_time must be earlier than or equal to end_time"
+            raise ValueError(msg)
+
+        self._resolve_bounds(
+            self.to_offset(self.start_time),
+            self.to_offset(self.end_time),
+        )
+
+    def _ensure_time(
+        self, value: str | time | None, var_name: str, default: time
+    ) -> time:
+        if value is None:
+            return default
+        if isinstance(value, time):
+            return value
+        try:
+            return datetime.strptime(value, self.format_string).time()  # noqa: DTZ007
+        except ValueError:
+            pass
+        try:
+            return time.fromisoformat(value)
+        except ValueError as err:
+            msg = (
+                f"Invalid '{var_name}': '{value}'. A Time can only be in ISO8601 "
+                "or with a user provided format string"
+            )
+            raise ValueError(msg) from err
+
+    def to_offset(self, value: time) -> int:
+        """
+        Convert a bound of the field to the offset from midnight values are drawn as.
+
+        :param value: The bound to convert.
+        :type value: time
+        :return: The offset from midnight, in microseconds.
+        :rtype: int
+        """
+        return (datetime.combine(EPOCH, value) - EPOCH) // timedelta(microseconds=1)
+
+    def get_native_values(self, n: int) -> list[time]:
+        return [value.time() for value in super().get_native_values(n)]
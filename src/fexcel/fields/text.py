@@ -1,40 +1,294 @@
-from faker import Faker
+from collections.abc import Hashable
+from datetime import datetime, timezone
+from functools import cache
+from typing import Any
 
 from fexcel.fields.base import FexcelField
+from fexcel.fields.pool import PooledFieldFaker
 
-fake = Faker()
 
+@cache
+def word_bank() -> tuple[str, ...]:
+    """
+    Get the words texts are made of, the same ones `faker` builds its texts with.
 
-class TextFieldFaker(FexcelField, faker_types=["text", "string"]):
-    def get_value(self) -> str:
-        return fake.text().replace("\n", " ")
+    :return: The words of the bank.
+    :rtype: tuple[str, ...]
+    """
+    from faker.providers.lorem.en_US import Provider  # noqa: PLC0415
 
+    return tuple(Provider.word_list)
 
-class NameFieldFaker(FexcelField, faker_types="name"):
-    def get_value(self) -> str:
-        return fake.name()
 
+class TextFieldFaker(PooledFieldFaker, faker_types=["text", "string"]):
+    """
+    Texts made of sentences of random words from :func:`word_bank`, whose length is
+    bound either by a number of characters or by a number of words.
+
+    Texts are composed directly from the words, which is an order of magnitude faster
+    than going through the text provider of `faker`.
+    """
+
+    SENTENCE_WORDS = (3, 10)
+
+    def __init__(
+        self,
+        field_name: str,
+        *,
+        min_chars: int | None = None,
+        max_chars: int | None = None,
+        min_words: int | None = None,
+        max_words: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        self.is_chars = min_chars is not None or max_chars is not None
+        self.is_words = min_words is not None or max_words is not None
+
+        # NOTE: A bound left out is derived from the other one, so specifying a
+        # single bound never conflicts with the default of the other.
+        self.min_chars = self._ensure_int(min_chars, "min_chars", 5)
+        self.max_chars = self._ensure_int(
+            max_chars, "max_chars", max(200, self.min_chars)
+        )
+        if min_chars is None:
+            self.min_chars = min(self.min_chars, self.max_chars)
+        self.min_words = self._ensure_int(min_words, "min_words", 1)
+        self.max_words = self._ensure_int(
+            max_words, "max_words", max(30, self.min_words)
+        )
+        if min_words is None:
+            self.min_words = min(self.min_words, self.max_words)
+
+        self._raise_if_invalid_combination()
+
+    @staticmethod
+    def _ensure_int(value: int | str | None, var_name: str, default: int) -> int:
+        if value is None:
+            return default
+        try:
+            value = int(value)
+        except (ValueError, TypeError) as err:
+            msg = f"Invalid '{var_name}': Unable to convert '{value}' to int"
+            raise ValueError(msg) from err
+        if value < 0:
+            msg = f"Invalid '{var_name}': Must be a positive integer, got {value}"
+            raise ValueError(msg)
+        return value
+
+    def _raise_if_invalid_combination(self) -> None:
+        if self.is_chars and self.is_words:
+            msg = "Cannot specify both min_chars/max_chars and min_words/max_words"
+            raise ValueError(msg)
+
+        if self.min_chars > self.max_chars or not self.max_chars:
+            msg = "min_chars must be less than or equal than a positive max_chars"
+            raise ValueError(msg)
+
+        if self.min_words > self.max_words or not self.max_words:
+            msg = "min_words must be less than or equal than a positive max_words"
+            raise ValueError(msg)
+
+    @property
+    def pool_key(self) -> Hashable | None:
+        key = super().pool_key
+        if key is None:
+            return None
+        bounds = (self.min_words, self.max_words) if self.is_words else None
+        return (*key, self.min_chars, self.max_chars, bounds)
+
+    def generate_value(self) -> str:
+        return self.generate_values(1)[0]
+
+    def generate_values(self, n: int) -> list[str]:
+        if self.is_words:
+            counts = self._rng.choices(range(self.min_words, self.max_words + 1), k=n)
+            words = self._rng.choices(word_bank(), k=sum(counts))
+            values, start = [], 0
+            for count in counts:
+                values.append(self._sentences(words[start : start + count]))
+                start += count
+            return values
+
+        lengths = self._rng.choices(range(self.min_chars, self.max_chars + 1), k=n)
+        return self._cut_texts(lengths)
+
+    def _sentences(self, words: list[str]) -> str:
+        """
+        Join `words` into sentences of a random number of words each.
+        """
+        min_size, max_size = self.SENTENCE_WORDS
+        sizes = self._rng.choices(
+            range(min_size, max_size + 1),
+            k=len(words) // min_size + 1,
+        )
+        sentences, start = [], 0
+        for size in sizes:
+            if start >= len(words):
+                break
+            sentence = " ".join(words[start : start + size])
+            sentences.append(f"{sentence[:1].upper()}{sentence[1:]}.")
+            start += size
+        return " ".join(sentences)
+
+    def _cut_texts(self, lengths: list[int]) -> list[str]:
+        """
+        Cut a text of every length of `lengths` out of a single long text, each of them
+        ending after the last whole word fitting in its length.
+        """
+        # NOTE: Words take 6.5 characters on average, counting the space after them, and
+        # every text may skip up to a whole word, so a word more per text is drawn.
+        total = sum(lengths) + 16 * len(lengths)
+        text = self._sentences(self._rng.choices(word_bank(), k=total // 6))
+        while len(text) <= total:
+            words = self._rng.choices(word_bank(), k=total // 6 + 1)
+            text = f"{text} {self._sentences(words)}"
+
+        values, start = [], 0
+        for length in lengths:
+            end = start + length
+            # NOTE: A text cut at a space takes at most one more character, the final
+            # period, so cuts are searched for within the bounds of its length.
+            cut = text.rfind(" ", start, end)
+            if cut < start + self.min_chars:
+                cut = text.find(" ", start + self.min_chars, start + self.max_chars)
+            if cut > start:
+                value, start = f"{text[start:cut].rstrip('.')}.", cut + 1
+            else:
+                # NOTE: No whole word fits between `min_chars` and `max_chars`, so the
+                # next text starts after the word cut, or right at the cut if it is the
+                # last word of the text.
+                value, after = text[start:end], text.find(" ", end)
+                start = after + 1 if after != -1 else end
+            values.append(value[:1].upper() + value[1:])
+        return values
 
-class EmailFieldFaker(FexcelField, faker_types="email"):
-    def get_value(self) -> str:
-        return fake.email()
+
+class NameFieldFaker(PooledFieldFaker, faker_types="name"):
+    def generate_value(self) -> str:
+        return self.fake.name()
+
+
+class EmailFieldFaker(PooledFieldFaker, faker_types="email"):
+    def generate_value(self) -> str:
+        return self.fake.email()
 
 
 class PhoneFieldFaker(FexcelField, faker_types="phone"):
     def get_value(self) -> str:
-        return fake.phone_number()
+        return self.fake.phone_number()
 
 
-class AddressFieldFaker(FexcelField, faker_types="address"):
-    def get_value(self) -> str:
-        return fake.address().replace("\n", " ")
+class AddressFieldFaker(PooledFieldFaker, faker_types="address"):
+    def generate_value(self) -> str:
+        return self.fake.address().replace("\n", " ")
+
+
+# NOTE: Translation tables stamping the version and the variant bits on a whole column
+# of UUIDs at once, as each of them is a single byte at a fixed position.
+UUID_VERSION_4 = bytes((byte & 0x0F) | 0x40 for byte in range(256))
+UUID_VARIANT = bytes((byte & 0x3F) | 0x80 for byte in range(256))
 
 
 class UUIDFieldFaker(FexcelField, faker_types="uuid"):
+    """
+    Random version 4 UUIDs, or time ordered version 7 UUIDs, generated in batches from
+    a single buffer of random bytes drawn from the field's own random generator.
+
+    Version 7 UUIDs start at `start_date`, `DEFAULT_START_DATE` by default, and carry
+    a counter after their timestamp, so they are strictly increasing in the order
+    they are generated, see RFC 9562. Their timestamp and counter are derived from the
+    index of their row, so shards and part files seeking to their first row continue
+    the sequence instead of restarting it.
+    """
+
+    VERSIONS = (4, 7)
+    UUID7_COUNTER_BITS = 12
+    DEFAULT_START_DATE = "2025-01-01T00:00:00+00:00"
+
+    def __init__(
+        self,
+        field_name: str,
+        *,
+        version: int = 4,
+        start_date: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(field_name, **kwargs)
+        self.version = version
+        if self.version not in self.VERSIONS:
+            msg = (
+                f"Invalid UUID version {self.version}, expected one of {self.VERSIONS}"
+            )
+            raise ValueError(msg)
+        if start_date is not None and self.version != 7:  # noqa: PLR2004
+            msg = "start_date can only be specified for version 7 UUIDs"
+            raise ValueError(msg)
+
+        self.start_date = start_date
+        self._start_ms = self._ensure_timestamp(start_date or self.DEFAULT_START_DATE)
+        self._sequence = 0
+        self.indexed = self.version == 7  # noqa: PLR2004
+
+    @staticmethod
+    def _ensure_timestamp(value: str) -> int:
+        try:
+            start_date = datetime.fromisoformat(value)
+        except ValueError as err:
+            msg = f"Invalid 'start_date': '{value}'. It can only be in ISO8601"
+            raise ValueError(msg) from err
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=timezone.utc)
+        return int(start_date.timestamp() * 1000)
+
+    def seek(self, index: int) -> None:
+        self._sequence = index
+
     def get_value(self) -> str:
-        return fake.uuid4()
+        return self.get_values(1)[0]
+
+    def get_values(self, n: int) -> list[str]:
+        if self.version == 7:  # noqa: PLR2004
+            return self._uuid7_values(n)
+
+        buffer = bytearray(self._rng.randbytes(16 * n))
+        buffer[6::16] = buffer[6::16].translate(UUID_VERSION_4)
+        buffer[8::16] = buffer[8::16].translate(UUID_VARIANT)
+        digits = buffer.hex()
+        return [
+            f"{digits[i : i + 8]}-{digits[i + 8 : i + 12]}-{digits[i + 12 : i + 16]}-"
+            f"{digits[i + 16 : i + 20]}-{digits[i + 20 : i + 32]}"
+            for i in range(0, 32 * n, 32)
+        ]
+
+    def get_unique_values(self, n: int, *, native: bool = False) -> list[Any]:
+        # NOTE: Version 7 UUIDs never repeat a timestamp and counter, no need to keep
+        # track of them
+        if self.version == 7:  # noqa: PLR2004
+            return self.get_values(n)
+        return super().get_unique_values(n, native=native)
+
+    def _uuid7_values(self, n: int) -> list[str]:
+        # NOTE: Only the last 8 bytes are random, the first ones hold the timestamp in
+        # milliseconds, the version and the counter.
+        buffer = bytearray(self._rng.randbytes(8 * n))
+        buffer[::8] = buffer[::8].translate(UUID_VARIANT)
+        digits = buffer.hex()
+
+        start, self._sequence = self._sequence, self._sequence + n
+        values = []
+        for i, sequence in zip(
+            range(0, 16 * n, 16), range(start, start + n), strict=True
+        ):
+            timestamp, counter = divmod(sequence, 1 << self.UUID7_COUNTER_BITS)
+            timestamp += self._start_ms
+            values.append(
+                f"{timestamp >> 16:08x}-{timestamp & 0xFFFF:04x}-7{counter:03x}-"
+                f"{digits[i : i + 4]}-{digits[i + 4 : i + 16]}",
+            )
+        return values
 
 
 class LocationFieldFaker(FexcelField, faker_types="location"):
     def get_value(self) -> str:
-        return fake.locale()
+        return self.fake.locale()
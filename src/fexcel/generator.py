@@ -1,11 +1,32 @@
 import json
-from itertools import repeat
+import random
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future
+from itertools import accumulate, chain, count, islice
 from pathlib import Path
 from typing import Any, Iterator, Self
 
-import pyexcel as pe
+from fexcel.fields import (
+    ArrayKeyIndex,
+    FexcelField,
+    PooledFieldFaker,
+    RangeKeyIndex,
+    ReferenceFieldFaker,
+    ValuePool,
+)
+from fexcel.profiling import Measurement, Profiler, profile_phase
+from fexcel.writers import (
+    ArrowWriter,
+    CSVWriter,
+    FexcelWriter,
+    PyexcelWriter,
+    XLSXWriter,
+)
+from fexcel.writers.xlsx import MAX_SHEET_NAME_LENGTH
 
-from fexcel.fields import FexcelField
+KeyIndex = RangeKeyIndex | ArrayKeyIndex
 
 
 class Fexcel:
@@ -17,26 +38,64 @@ class Fexcel:
     It can be instantiated either as any normal class passing the schema as a python
     dictionary or through its method `from_file` to read a JSON file containing the
     schema.
+
+    Every instance owns a random generator, seeded with the optional `seed`, from which
+    each field derives its own isolated generator. Given a seed, the same records are
+    generated on every run, and every shard generated by a worker process derives its
+    own seed from it too.
+
+    Sheets never exceed the row limit of the file format, e.g. 1,048,576 rows for
+    `.xlsx` files and 65,536 for `.xls` files. Past it, records roll over to new
+    sheets or new part files, see :meth:`write_to_file`.
+
+    Generation and writing can be instrumented passing a
+    :class:`fexcel.profiling.Profiler` as `profiler`, which records the time spent on
+    every field and on every phase of writing a file.
     """
 
-    def __init__(self, schema: list[dict[str, str]]) -> None:
+    DEFAULT_BATCH_SIZE = 10_000
+    RECORDS_BATCH_SIZE = 100
+    STREAMING_XLSX_THRESHOLD = 100_000
+    ROLLOVER_MODES = ("sheet", "file")
+
+    def __init__(
+        self,
+        schema: list[dict[str, str]],
+        *,
+        seed: int | None = None,
+        profiler: Profiler | None = None,
+    ) -> None:
         self._schema = schema
+        self.seed = seed
+        self.profiler = profiler
+        self._rng = random.Random(seed)
         self._fields = self._parse_fields()
+        self._key_indexes: dict[int, ArrayKeyIndex] = {}
 
     @classmethod
-    def from_file(cls, file: str | Path) -> Self:
+    def from_file(
+        cls,
+        file: str | Path,
+        *,
+        seed: int | None = None,
+        profiler: Profiler | None = None,
+    ) -> Self:
         """
         Create an instance of Fexcel from a JSON schema file.
 
         :param file: Path to the JSON schema file.
         :type file: str | Path
+        :param seed: Seed used to make the generation reproducible, defaults to None
+        :type seed: int | None, optional
+        :param profiler: Profiler instrumenting the generation, defaults to None
+        :type profiler: :class:`fexcel.profiling.Profiler` | None, optional
         :return: An instance of the Fexcel class.
         :rtype: Self
         """
         file = Path(file)
         with file.open("r") as fp:
             schema = json.load(fp)
-        return cls(schema)
+        return cls(schema, seed=seed, profiler=profiler)
 
     @property
     def fields(self) -> list[FexcelField]:
@@ -49,7 +108,13 @@ class Fexcel:
         return self._fields
 
     def _parse_fields(self) -> list[FexcelField]:
-        return [self._parse_field(field) for field in self._schema]
+        fields = [self._parse_field(field) for field in self._schema]
+        # NOTE: Fields with shared pools all draw from the pool of the first of them
+        pools = {}
+        for field in fields:
+            if isinstance(field, PooledFieldFaker) and field.pool_key is not None:
+                field.value_pool = pools.setdefault(field.pool_key, field.value_pool)
+        return fields
 
     def _parse_field(self, field: dict[str, Any]) -> FexcelField:
         try:
@@ -57,6 +122,7 @@ class Fexcel:
             return FexcelField.parse_field(
                 field_name=field["name"],
                 field_type=field["type"],
+                rng=random.Random(self._rng.getrandbits(64)),
                 **constraints,
             )
         except ValueError as err:
@@ -66,51 +132,518 @@ class Fexcel:
             msg = f"Error parsing field '{field}': {err} key not found"
             raise ValueError(msg) from err
 
-    def get_fake_records(self, n: int | None = None) -> Iterator[dict[str, str]]:
+    def track_keys(self, field_name: str) -> ArrayKeyIndex:
+        """
+        Index the values of the field named `field_name` as they are generated, so
+        :class:`fexcel.fields.ReferenceFieldFaker` fields of other schemas can draw
+        them as their keys.
+
+        :param field_name: The name of the field whose values are indexed.
+        :type field_name: str
+        :return: The index of the values of the field, shared by every caller.
+        :rtype: :class:`fexcel.fields.ArrayKeyIndex`
+        :raises ValueError: If there is no field named `field_name`.
+        """
+        names = [field.name for field in self._fields]
+        if field_name not in names:
+            msg = f"Unable to index keys of field '{field_name}': field not found"
+            raise ValueError(msg)
+        return self._key_indexes.setdefault(names.index(field_name), ArrayKeyIndex())
+
+    def seek(self, index: int) -> None:
+        """
+        Move every field to the row at position `index`, so fields derived from the
+        index of their row, e.g. sequences, continue from there. Any other field is
+        not affected by it.
+
+        :param index: The index of the next row to generate, starting at 0.
+        :type index: int
+        """
+        for field in self._fields:
+            field.seek(index)
+
+    def get_fake_records(
+        self,
+        n: int | None = None,
+        *,
+        native: bool = False,
+    ) -> Iterator[dict[str, Any]]:
         """
         Generate an iterator of fake records based on the schema.
 
         :param n: The number of fake records to generate. If None, generates an infinite
         number of records.
         :type n: int | None, optional
+        :param native: Whether to generate values in their native Python types instead
+        of strings, defaults to False
+        :type native: bool, optional
         :return: An iterator yielding dictionaries representing fake records.
-        :rtype: Iterator[dict[str, str]]
+        :rtype: Iterator[dict[str, Any]]
+        """
+        # NOTE: Records are usually consumed lazily, so they are generated in small
+        # batches to avoid paying for a large block before yielding the first one.
+        names = [field.name for field in self._fields]
+        columns_iterator = self.get_fake_columns(
+            n,
+            self.RECORDS_BATCH_SIZE,
+            native=native,
+        )
+        for columns in columns_iterator:
+            for row in zip(*columns, strict=True):
+                yield dict(zip(names, row, strict=True))
+
+    def get_fake_columns(
+        self,
+        n: int | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = 1,
+        *,
+        native: bool = False,
+    ) -> Iterator[list[list[Any]]]:
+        """
+        Generate an iterator of fake column blocks based on the schema.
+
+        Each block holds one list of values per field, in schema order, and all of
+        them have the same length of at most `batch_size` values. Values are produced
+        through :meth:`FexcelField.get_column`, so every column is generated at once
+        instead of cell by cell.
+
+        Fields constrained to `unique` values are generated by this process alone, so
+        they can not be combined with more than one worker.
+
+        :param n: The total number of fake rows to generate across all blocks. If None,
+        generates an infinite number of blocks.
+        :type n: int | None, optional
+        :param batch_size: Maximum number of rows per block, defaults to 10000
+        :type batch_size: int, optional
+        :param workers: Number of processes generating blocks in parallel. When greater
+        than 1 every block is a shard generated in a worker process with its own seed
+        derived from `seed`, and blocks are yielded back in order, defaults to 1
+        :type workers: int, optional
+        :param native: Whether to generate values in their native Python types instead
+        of strings, defaults to False
+        :type native: bool, optional
+        :return: An iterator yielding lists of columns.
+        :rtype: Iterator[list[list[Any]]]
+        """
+        if batch_size <= 0:
+            msg = f"Batch size must be a positive integer, got {batch_size}"
+            raise ValueError(msg)
+        if workers <= 0:
+            msg = f"Number of workers must be a positive integer, got {workers}"
+            raise ValueError(msg)
+        self._raise_if_unique_unsupported(n, workers=workers)
+
+        yield from self._generate_blocks(
+            _batch_sizes(n, batch_size),
+            workers,
+            native=native,
+        )
+
+    def _generate_blocks(
+        self,
+        sizes: Iterable[int],
+        workers: int,
+        *,
+        native: bool,
+    ) -> Iterator[list[list[Any]]]:
+        if workers > 1:
+            blocks = self._get_parallel_fake_columns(sizes, workers, native=native)
+        else:
+            blocks = (
+                _generate_block(
+                    self._fields,
+                    size,
+                    native=native,
+                    profiler=self.profiler,
+                )
+                for size in sizes
+            )
+        for block in blocks:
+            for position, key_index in self._key_indexes.items():
+                keys = block[position]
+                if self._fields[position].null_probability:
+                    # NOTE: Null cells hold no key, so they can never be referenced
+                    keys = [key for key in keys if key is not None and key != ""]
+                key_index.extend(keys)
+            yield block
+
+    def _get_parallel_fake_columns(
+        self,
+        sizes: Iterable[int],
+        workers: int,
+        *,
+        native: bool,
+    ) -> Iterator[list[list[Any]]]:
+        """
+        Generate every block as a deterministic shard on a pool of processes.
+
+        Only a bounded number of shards is in flight at any time so memory does not
+        grow when the consumer is slower than the workers.
         """
-        generator = repeat(None, n) if n is not None else repeat(None)
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
 
-        for _ in generator:
-            yield {field.name: field.get_value() for field in self._fields}
+        seed = self.seed if self.seed is not None else self._rng.getrandbits(64)
+        max_pending = 2 * workers
+        pending: deque[tuple[int, Future[tuple[list[list[Any]], Profiler | None]]]]
+        pending = deque()
+        offset = 0
+        # NOTE: Key indexes and pools may be large, so they are sent once to every
+        # worker instead of along with every shard.
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_shard_worker,
+            initargs=self._shared_state(),
+        ) as executor:
+            for index, size in enumerate(sizes):
+                shard_seed = _derive_seed(seed, index)
+                future = executor.submit(
+                    _generate_shard,
+                    self._schema,
+                    shard_seed,
+                    size,
+                    offset=offset,
+                    native=native,
+                    profile=self.profiler is not None,
+                )
+                pending.append((size, future))
+                offset += size
+                if len(pending) >= max_pending:
+                    yield self._shard_result(*pending.popleft())
+            while pending:
+                yield self._shard_result(*pending.popleft())
+
+    def _shard_result(
+        self,
+        size: int,
+        future: "Future[tuple[list[list[Any]], Profiler | None]]",
+    ) -> list[list[Any]]:
+        if self.profiler is None:
+            block, _ = future.result()
+            return block
+        # NOTE: Only the time spent waiting for the shard counts as generation time
+        # of this process, fields were timed on the worker processes.
+        with self.profiler.generating(size):
+            block, shard_profiler = future.result()
+        if shard_profiler is not None:
+            self.profiler.merge(shard_profiler, kinds=("field",))
+        return block
 
     def write_to_file(
         self,
         file_path: str | Path,
         num_fakes: int = 1000,
         sheet_name: str = "Sheet1",
+        workers: int = 1,
+        rollover: str = "sheet",
+        **writer_options: Any,
     ) -> None:
         """
         Generate and write fake records based on the schema in an excel file.
 
+        Numeric, boolean and temporal values are written as properly typed cells, only
+        plain text formats such as CSV or TSV receive them already formatted as strings.
+        Rows are streamed to the file in a single pass, in schema order.
+
+        When there are more records than a sheet of the file format can hold, they roll
+        over either to new sheets of the same file, named after `sheet_name` followed
+        by their number (e.g. `Sheet1 (2)`), or to numbered part files next to it (e.g.
+        `output-1.xlsx`, `output-2.xlsx`), which are written concurrently by `workers`
+        processes. Either way, a `<file name>.manifest.json` file listing the files and
+        sheets produced and how many records each one holds is written too.
+
         :param file_path: Path to the file where the excel data will be written.
         :type file_path: str | Path
         :param num_fakes: Number of fake records to create, defaults to 1000
         :type num_fakes: int, optional
         :param sheet_name: Name for the excel sheet to be created, defaults to "Sheet1"
         :type sheet_name: str, optional
+        :param workers: Number of processes used to generate the records, see
+        :meth:`get_fake_columns`, defaults to 1
+        :type workers: int, optional
+        :param rollover: Where records past the row limit of the file format go, either
+        `"sheet"` or `"file"`, defaults to `"sheet"`
+        :type rollover: str, optional
+        :param writer_options: Options passed down to the writer handling the file type,
+        e.g. `delimiter`, `quoting` or `encoding` for `.csv` and `.tsv` files.
+        :type writer_options: Any
         """
+        if rollover not in self.ROLLOVER_MODES:
+            msg = (
+                f"Invalid rollover mode: {rollover}, must be one of "
+                f"{', '.join(self.ROLLOVER_MODES)}"
+            )
+            raise ValueError(msg)
 
         file_path = Path(file_path).resolve()
-        iterator = self.get_fake_records(num_fakes)
-        pe.isave_as(
-            records=iterator,
-            dest_file_name=str(file_path),
-            sheet_name=sheet_name,
+        writer_cls = self.get_writer_class(file_path, num_fakes)
+        max_rows = writer_cls.get_max_rows(file_path)
+        parts = (
+            _split_rows(num_fakes, max_rows - 1)
+            if rollover == "file" and max_rows is not None
+            else [num_fakes]
         )
-        sheet = pe.get_sheet(
-            file_name=str(file_path),
-            name_columns_by_row=0,
+        self._raise_if_unique_unsupported(num_fakes, workers=workers, parts=len(parts))
+        if len(parts) > 1:
+            files = self._write_part_files(
+                file_path,
+                parts,
+                sheet_name,
+                workers,
+                writer_options,
+            )
+        else:
+            files = {
+                file_path: self._write_file(
+                    file_path,
+                    num_fakes,
+                    sheet_name,
+                    workers,
+                    writer_options,
+                ),
+            }
+
+        if len(files) > 1 or any(len(sheets) > 1 for sheets in files.values()):
+            self._write_manifest(file_path, files)
+
+    def _raise_if_unique_unsupported(
+        self,
+        n: int | None,
+        *,
+        workers: int,
+        parts: int = 1,
+    ) -> None:
+        """
+        Fail fast, before anything is generated, if the fields constrained to `unique`
+        values can not generate `n` more of them, or would be generated by several
+        processes or files, each of them unaware of the values of the others.
+        """
+        for field in self._fields:
+            # NOTE: Indexed fields are unique by row, so shards never collide
+            if not field.unique or field.indexed:
+                continue
+            if workers > 1:
+                msg = (
+                    f"Unique field '{field.name}' can not be generated by more than "
+                    f"one worker, got {workers}"
+                )
+                raise ValueError(msg)
+            if parts > 1:
+                msg = (
+                    f"Unique field '{field.name}' can not be split into {parts} "
+                    "part files, use rollover 'sheet' instead"
+                )
+                raise ValueError(msg)
+            # NOTE: Nulls do not count as unique values, so their number is unknown
+            if n is not None and not field.null_probability:
+                field.raise_if_not_enough_values(n)
+
+    def _shared_state(
+        self,
+    ) -> tuple[dict[int, tuple[KeyIndex, type]], dict[int, ValuePool]]:
+        """
+        State of the fields every shard and part file, generated by an instance of its
+        own, must share with this one, by position of the field: the key indexes of
+        the reference fields and the pools of the pooled fields, which are generated
+        here once so they are the very same pools everywhere.
+        """
+        references, pools = {}, {}
+        for position, field in enumerate(self._fields):
+            if isinstance(field, ReferenceFieldFaker) and field.key_index is not None:
+                references[position] = (field.key_index, field.native_type)
+            elif isinstance(field, PooledFieldFaker) and field.value_pool is not None:
+                field.value_pool.get_values(field.generate_value)
+                pools[position] = field.value_pool
+        return references, pools
+
+    def _write_file(
+        self,
+        file_path: Path,
+        num_fakes: int,
+        sheet_name: str,
+        workers: int,
+        writer_options: dict[str, Any],
+    ) -> list[tuple[str, int]]:
+        writer_cls = self.get_writer_class(file_path, num_fakes)
+        with writer_cls(file_path, **writer_options) as writer:
+            with profile_phase(self.profiler, "serialize"):
+                sheets = self.write_sheet(writer, num_fakes, sheet_name, workers)
+                writer.flush()
+            with profile_phase(self.profiler, "finalize"):
+                writer.close()
+        if self.profiler is not None:
+            self.profiler.record(
+                Measurement("file", file_path.name, nbytes=file_path.stat().st_size),
+            )
+        return sheets
+
+    def _write_part_files(
+        self,
+        file_path: Path,
+        sizes: list[int],
+        sheet_name: str,
+        workers: int,
+        writer_options: dict[str, Any],
+    ) -> dict[Path, list[tuple[str, int]]]:
+        """
+        Write every part of the records to its own numbered file, each of them generated
+        with its own seed derived from `seed`, on a pool of processes.
+        """
+        seed = self.seed if self.seed is not None else self._rng.getrandbits(64)
+        width = len(str(len(sizes)))
+        paths = [
+            file_path.with_name(f"{file_path.stem}-{index:0{width}d}{file_path.suffix}")
+            for index in range(1, len(sizes) + 1)
+        ]
+        profile = self.profiler is not None
+        offsets = [0, *accumulate(sizes[:-1])]
+        shared_state = self._shared_state()
+        parts = [
+            (self._schema, _derive_seed(seed, index), path, size, sheet_name)
+            for index, (path, size) in enumerate(zip(paths, sizes, strict=True))
+        ]
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+            with ProcessPoolExecutor(max_workers=min(workers, len(parts))) as executor:
+                futures = [
+                    executor.submit(
+                        _write_part_file,
+                        *part,
+                        offset=offset,
+                        shared_state=shared_state,
+                        profile=profile,
+                        **writer_options,
+                    )
+                    for part, offset in zip(parts, offsets, strict=True)
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                _write_part_file(
+                    *part,
+                    offset=offset,
+                    shared_state=shared_state,
+                    profile=profile,
+                    **writer_options,
+                )
+                for part, offset in zip(parts, offsets, strict=True)
+            ]
+
+        files = {}
+        for path, (sheets, part_profiler) in zip(paths, results, strict=True):
+            if self.profiler is not None and part_profiler is not None:
+                self.profiler.merge(part_profiler)
+            files[path] = sheets
+        return files
+
+    def _write_manifest(
+        self,
+        file_path: Path,
+        files: dict[Path, list[tuple[str, int]]],
+    ) -> None:
+        manifest = {
+            "seed": self.seed,
+            "fields": [field.name for field in self._fields],
+            "num_fakes": sum(rows for sheets in files.values() for _, rows in sheets),
+            "files": [
+                {
+                    "path": path.name,
+                    "sheets": [{"name": name, "rows": rows} for name, rows in sheets],
+                }
+                for path, sheets in files.items()
+            ],
+        }
+        manifest_path = file_path.with_name(f"{file_path.name}.manifest.json")
+        with manifest_path.open("w") as fp:
+            json.dump(manifest, fp, indent=2)
+
+    def write_sheet(
+        self,
+        writer: FexcelWriter,
+        num_fakes: int = 1000,
+        sheet_name: str = "Sheet1",
+        workers: int = 1,
+    ) -> list[tuple[str, int]]:
+        """
+        Generate fake records based on the schema and write them as a new sheet through
+        an already open writer.
+
+        If there are more records than a single sheet of the file can hold, they roll
+        over to as many new sheets as needed, named after `sheet_name` followed by
+        their number, e.g. `Sheet1 (2)`.
+
+        :param writer: The writer of the destination file.
+        :type writer: :class:`fexcel.writers.FexcelWriter`
+        :param num_fakes: Number of fake records to create, defaults to 1000
+        :type num_fakes: int, optional
+        :param sheet_name: Name for the excel sheet to be created, defaults to "Sheet1"
+        :type sheet_name: str, optional
+        :param workers: Number of processes used to generate the records, see
+        :meth:`get_fake_columns`, defaults to 1
+        :type workers: int, optional
+        :return: The name and number of records of every sheet written.
+        :rtype: list[tuple[str, int]]
+        """
+        if workers <= 0:
+            msg = f"Number of workers must be a positive integer, got {workers}"
+            raise ValueError(msg)
+        self._raise_if_unique_unsupported(num_fakes, workers=workers)
+
+        # NOTE: Every sheet starts a new block, so each one of them consumes a known
+        # number of blocks from a single stream of blocks.
+        max_rows = writer.max_rows - 1 if writer.max_rows is not None else None
+        sizes = _split_rows(num_fakes, max_rows)
+        block_sizes = [
+            list(_batch_sizes(size, self.DEFAULT_BATCH_SIZE)) for size in sizes
+        ]
+        blocks = self._generate_blocks(
+            chain.from_iterable(block_sizes),
+            workers,
+            native=writer.native,
         )
-        sheet = sheet.project([field.name for field in self.fields])
-        sheet.save_as(str(file_path))
+
+        sheets = []
+        for index, (size, sheet_block_sizes) in enumerate(
+            zip(sizes, block_sizes, strict=True),
+            1,
+        ):
+            name = sheet_name if index == 1 else _part_sheet_name(sheet_name, index)
+            writer.write_sheet(
+                name,
+                [field.name for field in self._fields],
+                islice(blocks, len(sheet_block_sizes)),
+                types=[field.native_type for field in self._fields],
+            )
+            sheets.append((name, size))
+        return sheets
+
+    @classmethod
+    def get_writer_class(cls, file_path: Path, num_rows: int) -> type[FexcelWriter]:
+        """
+        Pick the writer for the destination file. `.csv` and `.tsv` files are written
+        natively by :class:`CSVWriter`, `.parquet` and `.arrow` files by
+        :class:`ArrowWriter` and large `.xlsx` files are streamed by the dedicated
+        :class:`XLSXWriter` so memory usage does not grow with the number of rows,
+        anything else is delegated to `pyexcel`.
+
+        :param file_path: Path to the destination file.
+        :type file_path: Path
+        :param num_rows: Total number of rows that will be written to the file.
+        :type num_rows: int
+        :return: The writer class handling the file.
+        :rtype: type[:class:`fexcel.writers.FexcelWriter`]
+        """
+        if file_path.suffix.lower() in (".csv", ".tsv"):
+            return CSVWriter
+        if file_path.suffix.lower() in (".parquet", ".arrow"):
+            return ArrowWriter
+        if (
+            file_path.suffix.lower() == ".xlsx"
+            and num_rows >= cls.STREAMING_XLSX_THRESHOLD
+        ):
+            return XLSXWriter
+        return PyexcelWriter
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Fexcel):
@@ -123,3 +656,136 @@ class Fexcel:
             ret += f"\t{field}\n"
         ret += ")"
         return ret
+
+
+def _batch_sizes(n: int | None, batch_size: int) -> Iterator[int]:
+    """Sizes of the blocks of at most `batch_size` rows `n` rows are split into."""
+    offsets = range(0, n, batch_size) if n is not None else count(0, batch_size)
+    return (
+        batch_size if n is None else min(batch_size, n - offset) for offset in offsets
+    )
+
+
+def _split_rows(n: int, max_rows: int | None) -> list[int]:
+    """Split `n` rows into parts of at most `max_rows` rows, with at least one part."""
+    if max_rows is None or n <= max_rows:
+        return [n]
+    full_parts, remainder = divmod(n, max_rows)
+    return [max_rows] * full_parts + ([remainder] if remainder else [])
+
+
+def _part_sheet_name(sheet_name: str, index: int) -> str:
+    """Name of the sheet at position `index` a sheet rolls over to."""
+    suffix = f" ({index})"
+    return f"{sheet_name[: MAX_SHEET_NAME_LENGTH - len(suffix)]}{suffix}"
+
+
+def _derive_seed(seed: int, index: int) -> int:
+    """Derive a reproducible seed for the shard at position `index`."""
+    return random.Random(f"{seed}:{index}").getrandbits(64)
+
+
+# NOTE: Key indexes of the reference fields and pools of the pooled fields of the
+# shards generated by this worker process, kept once when it starts instead of sent
+# along with every shard.
+_shard_references: dict[int, tuple[KeyIndex, type]] = {}
+_shard_pools: dict[int, ValuePool] = {}
+
+
+def _init_shard_worker(
+    references: dict[int, tuple[KeyIndex, type]],
+    pools: dict[int, ValuePool],
+) -> None:
+    """Keep the state shared by every shard generated by a worker process."""
+    _shard_references.update(references)
+    _shard_pools.update(pools)
+
+
+def _bind_shared_state(
+    fexcel: Fexcel,
+    references: dict[int, tuple[KeyIndex, type]],
+    pools: dict[int, ValuePool],
+) -> None:
+    """Bind the fields of a shard or part file to the state shared with the rest."""
+    for position, (key_index, native_type) in references.items():
+        fexcel.fields[position].bind(key_index, native_type)
+    for position, pool in pools.items():
+        fexcel.fields[position].value_pool = pool
+
+
+def _generate_shard(  # noqa: PLR0913
+    schema: list[dict[str, str]],
+    seed: int,
+    size: int,
+    *,
+    offset: int = 0,
+    native: bool,
+    profile: bool = False,
+) -> tuple[list[list[Any]], Profiler | None]:
+    """
+    Generate a block of `size` rows of the schema, starting at row `offset`, in a worker
+    process, along with the profiler that instrumented it if `profile` is set.
+    """
+    fexcel = Fexcel(schema, seed=seed, profiler=Profiler() if profile else None)
+    fexcel.seek(offset)
+    _bind_shared_state(fexcel, _shard_references, _shard_pools)
+    block = _generate_block(
+        fexcel.fields, size, native=native, profiler=fexcel.profiler
+    )
+    return block, fexcel.profiler
+
+
+def _write_part_file(  # noqa: PLR0913
+    schema: list[dict[str, str]],
+    seed: int,
+    file_path: Path,
+    num_fakes: int,
+    sheet_name: str,
+    *,
+    offset: int,
+    shared_state: tuple[dict[int, tuple[KeyIndex, type]], dict[int, ValuePool]],
+    profile: bool,
+    **writer_options: Any,
+) -> tuple[list[tuple[str, int]], Profiler | None]:
+    """
+    Write a part file holding `num_fakes` records of the schema, starting at row
+    `offset` and sharing the `shared_state` of the instance splitting them, returning
+    its sheets along with the profiler that instrumented it if `profile` is set.
+    """
+    fexcel = Fexcel(schema, seed=seed, profiler=Profiler() if profile else None)
+    fexcel.seek(offset)
+    _bind_shared_state(fexcel, *shared_state)
+    sheets = fexcel._write_file(file_path, num_fakes, sheet_name, 1, writer_options)  # noqa: SLF001
+    return sheets, fexcel.profiler
+
+
+def _generate_block(
+    fields: list[FexcelField],
+    size: int,
+    *,
+    native: bool,
+    profiler: Profiler | None = None,
+) -> list[list[Any]]:
+    """Generate one column of `size` values for every field."""
+    if profiler is not None:
+        with profiler.generating(size):
+            return [
+                _generate_profiled_column(field, size, native=native, profiler=profiler)
+                for field in fields
+            ]
+    return [field.get_column(size, native=native) for field in fields]
+
+
+def _generate_profiled_column(
+    field: FexcelField,
+    size: int,
+    *,
+    native: bool,
+    profiler: Profiler,
+) -> list[Any]:
+    """Generate one column of `size` values of `field`, timing it with `profiler`."""
+    start = time.perf_counter()
+    column = field.get_column(size, native=native)
+    elapsed = time.perf_counter() - start
+    profiler.record(Measurement("field", field.name, elapsed, values=size))
+    return column
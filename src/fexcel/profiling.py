@@ -0,0 +1,206 @@
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """
+    A measurement recorded by a :class:`Profiler`, either of a single event or the
+    aggregate of every event of the same `kind` and `name`.
+
+    `kind` is `"field"` for the time spent generating the values of a field, named
+    after it, `"phase"` for the time spent on each phase of writing a file, named
+    `"generate"`, `"serialize"` or `"finalize"`, and `"file"` for each file written.
+    """
+
+    kind: str
+    name: str
+    seconds: float = 0.0
+    values: int = 0
+    nbytes: int = 0
+    calls: int = 1
+
+    def __add__(self, other: "Measurement") -> "Measurement":
+        return replace(
+            self,
+            seconds=self.seconds + other.seconds,
+            values=self.values + other.values,
+            nbytes=self.nbytes + other.nbytes,
+            calls=self.calls + other.calls,
+        )
+
+
+class Profiler:
+    """
+    Opt-in instrumentation of `Fexcel`, recording the time spent generating every field,
+    the time spent on every phase of writing a file, the number of values generated and
+    the number of bytes written.
+
+    Fields are timed once per column block, so profiling does not add any per value
+    overhead, and nothing at all is timed unless a profiler is given to `Fexcel`
+
+    >>> from fexcel import Fexcel
+    >>> from fexcel.profiling import Profiler
+    >>>
+    >>> profiler = Profiler()
+    >>> fexcel = Fexcel([{"name": "Amount", "type": "int"}], profiler=profiler)
+    >>> records = list(fexcel.get_fake_records(10))
+    >>> [(m.name, m.values) for m in profiler.measurements if m.kind == "field"]
+    [('Amount', 10)]
+
+    Every single event is also passed to the optional `callback` as soon as it is
+    recorded, e.g. to export it to a metrics system.
+
+    :param callback: Function called with every recorded :class:`Measurement`.
+    """
+
+    KINDS = ("phase", "field", "file")
+
+    def __init__(self, callback: Callable[[Measurement], None] | None = None) -> None:
+        self.callback = callback
+        self._measurements: dict[tuple[str, str], Measurement] = {}
+        self._generation_seconds = 0.0
+
+    @property
+    def measurements(self) -> list[Measurement]:
+        """
+        Get the aggregated measurements, sorted from the most to the least time spent.
+
+        :return: A list of Measurement objects.
+        :rtype: list[:class:`Measurement`]
+        """
+        return sorted(
+            self._measurements.values(),
+            key=lambda measurement: measurement.seconds,
+            reverse=True,
+        )
+
+    def record(self, measurement: Measurement) -> None:
+        """
+        Record a new measurement, adding it to any other one of the same kind and name.
+
+        :param measurement: The measurement to record.
+        :type measurement: :class:`Measurement`
+        """
+        key = (measurement.kind, measurement.name)
+        if key in self._measurements:
+            self._measurements[key] += measurement
+        else:
+            self._measurements[key] = measurement
+        if self.callback is not None:
+            self.callback(measurement)
+
+    @contextmanager
+    def generating(self, rows: int) -> Iterator[None]:
+        """
+        Time the generation of a block of rows as part of the `generate` phase.
+
+        :param rows: The number of rows of the block.
+        :type rows: int
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._generation_seconds += elapsed
+            self.record(Measurement("phase", "generate", elapsed, values=rows))
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase of writing a file. Writers consume lazily generated blocks, so the
+        time spent generating them meanwhile is only accounted in the `generate` phase.
+
+        :param name: The name of the phase.
+        :type name: str
+        """
+        start = time.perf_counter()
+        generation_start = self._generation_seconds
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            generation = self._generation_seconds - generation_start
+            self.record(Measurement("phase", name, elapsed - generation))
+
+    def merge(self, other: "Profiler", kinds: tuple[str, ...] = KINDS) -> None:
+        """
+        Record the measurements of another profiler, such as one that profiled a
+        worker process.
+
+        :param other: The profiler to merge.
+        :type other: :class:`Profiler`
+        :param kinds: Kinds of measurements to merge, defaults to all of them
+        :type kinds: tuple[str, ...], optional
+        """
+        for measurement in other.measurements:
+            if measurement.kind in kinds:
+                self.record(measurement)
+
+    def report(self) -> str:
+        """
+        Format the measurements as a plain text table with the phases first and then the
+        fields, each of them sorted from the most to the least time spent.
+
+        :return: The formatted report.
+        :rtype: str
+        """
+        measurements = sorted(
+            self.measurements,
+            key=lambda measurement: self.KINDS.index(measurement.kind),
+        )
+        total = sum(m.seconds for m in measurements if m.kind == "phase")
+        rows = [("kind", "name", "seconds", "%", "values", "values/s", "bytes")]
+        rows.extend(
+            (
+                measurement.kind,
+                measurement.name,
+                f"{measurement.seconds:.3f}" if measurement.kind != "file" else "",
+                (
+                    f"{measurement.seconds / total:.1%}"
+                    if total and measurement.kind != "file"
+                    else ""
+                ),
+                f"{measurement.values:,}" if measurement.values else "",
+                (
+                    f"{measurement.values / measurement.seconds:,.0f}"
+                    if measurement.values and measurement.seconds
+                    else ""
+                ),
+                f"{measurement.nbytes:,}" if measurement.nbytes else "",
+            )
+            for measurement in measurements
+        )
+
+        widths = [
+            max(len(row[column]) for row in rows) for column in range(len(rows[0]))
+        ]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if column < 2 else cell.rjust(width)  # noqa: PLR2004
+                for column, (cell, width) in enumerate(zip(row, widths, strict=True))
+            ).rstrip()
+            for row in rows
+        )
+
+
+def profile_phase(
+    profiler: Profiler | None,
+    name: str,
+) -> AbstractContextManager[None]:
+    """
+    Time a phase of writing a file with `profiler`, or do nothing at all without one.
+
+    :param profiler: The profiler recording the phase, if any.
+    :type profiler: :class:`Profiler` | None
+    :param name: The name of the phase.
+    :type name: str
+    :return: A context manager timing the phase.
+    :rtype: AbstractContextManager[None]
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.phase(name)
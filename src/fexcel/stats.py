@@ -0,0 +1,124 @@
+import sys
+import time
+from typing import Any, TextIO
+
+from fexcel.profiling import Measurement, Profiler
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def peak_rss(*, children: bool = False) -> int | None:
+    """
+    Get the peak resident set size, in bytes, of the current process or of the largest
+    of its finished child processes, such as workers.
+
+    :param children: Whether to get the peak of the child processes instead, defaults
+    to False
+    :type children: bool, optional
+    :return: The peak resident set size, or None where it cannot be measured.
+    :rtype: int | None
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    max_rss = resource.getrusage(who).ru_maxrss
+    # NOTE: Linux reports it in kilobytes while macOS does in bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_stats(
+    profiler: Profiler,
+    elapsed: float,
+    error: BaseException | None = None,
+) -> dict[str, Any]:
+    """
+    Summarize a run instrumented by `profiler` in a machine readable report with the
+    rows generated, the throughput, the bytes written, the time spent on every phase
+    and the peak memory used.
+
+    :param profiler: The profiler that instrumented the run.
+    :type profiler: :class:`fexcel.profiling.Profiler`
+    :param elapsed: Wall time of the whole run, in seconds.
+    :type elapsed: float
+    :param error: The error the run failed with, if any, defaults to None
+    :type error: BaseException | None, optional
+    :return: The report of the run.
+    :rtype: dict[str, Any]
+    """
+    phases = dict.fromkeys(("generate", "serialize", "finalize"), 0.0)
+    rows, files = 0, []
+    for measurement in profiler.measurements:
+        if measurement.kind == "phase":
+            phases[measurement.name] = measurement.seconds
+            if measurement.name == "generate":
+                rows = measurement.values
+        elif measurement.kind == "file":
+            files.append({"name": measurement.name, "bytes": measurement.nbytes})
+
+    return {
+        "status": "error" if error is not None else "ok",
+        "error": str(error) if error is not None else None,
+        "rows": rows,
+        "elapsed_seconds": elapsed,
+        "rows_per_second": rows / elapsed if elapsed else None,
+        "bytes_written": sum(file["bytes"] for file in files),
+        "files": sorted(files, key=lambda file: file["name"]),
+        "phases": phases,
+        "peak_rss_bytes": peak_rss(),
+        "peak_workers_rss_bytes": peak_rss(children=True) or None,
+    }
+
+
+class ProgressReporter:
+    """
+    :class:`fexcel.profiling.Profiler` callback printing a progress line with the rows
+    generated so far and the current throughput at most once every `interval` seconds.
+
+    :param total: Total number of rows of the run, if known.
+    :param interval: Minimum number of seconds between two progress lines.
+    :param stream: Stream the progress lines are written to, defaults to `stderr`.
+    """
+
+    def __init__(
+        self,
+        total: int | None,
+        interval: float,
+        stream: TextIO | None = None,
+    ) -> None:
+        if interval <= 0:
+            msg = f"Progress interval must be a positive number, got {interval}"
+            raise ValueError(msg)
+        self.total = total
+        self.interval = interval
+        self.stream = stream if stream is not None else sys.stderr
+        self.rows = 0
+        self._start = self._last = time.perf_counter()
+
+    def __call__(self, measurement: Measurement) -> None:
+        if measurement.kind != "phase" or measurement.name != "generate":
+            return
+        self.rows += measurement.values
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            print(self.format_line(now - self._start), file=self.stream, flush=True)
+
+    def format_line(self, elapsed: float) -> str:
+        """
+        Format the progress line of the run after `elapsed` seconds.
+
+        :param elapsed: Seconds since the run started.
+        :type elapsed: float
+        :return: The progress line.
+        :rtype: str
+        """
+        progress = f"{self.rows:,}"
+        if self.total:
+            progress += f"/{self.total:,} rows ({self.rows / self.total:.1%})"
+        else:
+            progress += " rows"
+        rate = self.rows / elapsed if elapsed else 0
+        return f"fexcel: {progress} in {elapsed:.1f}s, {rate:,.0f} rows/s"
@@ -0,0 +1,258 @@
+import json
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Self
+
+from fexcel.fields import RangeKeyIndex, ReferenceFieldFaker, SequenceFieldFaker
+from fexcel.generator import Fexcel
+from fexcel.profiling import Measurement, Profiler, profile_phase
+
+
+@dataclass
+class FexcelSheet:
+    """
+    A single sheet of a :class:`FexcelWorkbook`, holding its name, the `Fexcel`
+    instance generating its records and how many of them will be generated.
+    """
+
+    name: str
+    fexcel: Fexcel
+    num_fakes: int
+
+
+class FexcelWorkbook:  # noqa: PLW1641
+    """
+    FexcelWorkbook generates fake excel files with several sheets, each one of them
+    with its own schema and number of records.
+
+    Its schema is an object with a list of `sheets`, where every sheet declares its
+    `name`, its `fields`, following the same structure as a `Fexcel` schema, and
+    optionally its `num_fakes`
+
+    >>> workbook = FexcelWorkbook(
+    ...     {
+    ...         "sheets": [
+    ...             {
+    ...                 "name": "Customers",
+    ...                 "num_fakes": 10,
+    ...                 "fields": [{"name": "Customer", "type": "name"}],
+    ...             },
+    ...             {
+    ...                 "name": "Orders",
+    ...                 "fields": [{"name": "Amount", "type": "float"}],
+    ...             },
+    ...         ],
+    ...     },
+    ...     num_fakes=100,
+    ... )
+    >>> [(sheet.name, sheet.num_fakes) for sheet in workbook.sheets]
+    [('Customers', 10), ('Orders', 100)]
+
+    All sheets are generated and streamed to the same file in a single pass, without
+    any intermediate file. Just like `Fexcel`, an optional `seed` makes the generated
+    workbook reproducible and an optional `profiler` instruments its generation.
+
+    Fields of type `reference` draw their values from the keys of a column of another
+    sheet, given by their `sheet` and `field` constraints. Keys of `sequence` columns
+    are described by their range alone, any other column is indexed while its sheet
+    is generated, so it must be declared before the sheets referencing it.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        *,
+        seed: int | None = None,
+        num_fakes: int = 1000,
+        profiler: Profiler | None = None,
+    ) -> None:
+        self._schema = schema
+        self.seed = seed
+        self.num_fakes = num_fakes
+        self.profiler = profiler
+        self._rng = random.Random(seed)
+        self._sheets = self._parse_sheets()
+
+    @classmethod
+    def from_file(
+        cls,
+        file: str | Path,
+        *,
+        seed: int | None = None,
+        num_fakes: int = 1000,
+        profiler: Profiler | None = None,
+    ) -> Self:
+        """
+        Create an instance of FexcelWorkbook from a JSON schema file.
+
+        :param file: Path to the JSON schema file.
+        :type file: str | Path
+        :param seed: Seed used to make the generation reproducible, defaults to None
+        :type seed: int | None, optional
+        :param num_fakes: Number of fake records of the sheets that do not declare
+        their own, defaults to 1000
+        :type num_fakes: int, optional
+        :param profiler: Profiler instrumenting the generation, defaults to None
+        :type profiler: :class:`fexcel.profiling.Profiler` | None, optional
+        :return: An instance of the FexcelWorkbook class.
+        :rtype: Self
+        """
+        file = Path(file)
+        with file.open("r") as fp:
+            schema = json.load(fp)
+        return cls(schema, seed=seed, num_fakes=num_fakes, profiler=profiler)
+
+    @property
+    def sheets(self) -> list[FexcelSheet]:
+        """
+        Get the list of parsed sheets.
+
+        :return: A list of FexcelSheet objects.
+        :rtype: list[:class:`FexcelSheet`]
+        """
+        return self._sheets
+
+    def _parse_sheets(self) -> list[FexcelSheet]:
+        if not isinstance(self._schema, dict) or not isinstance(
+            self._schema.get("sheets"),
+            list,
+        ):
+            msg = "Error parsing workbook: a 'sheets' list is required"
+            raise ValueError(msg)
+
+        sheets = [self._parse_sheet(sheet) for sheet in self._schema["sheets"]]
+        names = [sheet.name for sheet in sheets]
+        if len(set(names)) != len(names):
+            msg = f"Error parsing workbook: repeated sheet names in {names}"
+            raise ValueError(msg)
+        for position, sheet in enumerate(sheets):
+            for field in sheet.fexcel.fields:
+                if isinstance(field, ReferenceFieldFaker):
+                    self._bind_reference(field, sheet, sheets[:position], sheets)
+        return sheets
+
+    @staticmethod
+    def _bind_reference(
+        field: ReferenceFieldFaker,
+        sheet: FexcelSheet,
+        previous: list[FexcelSheet],
+        sheets: list[FexcelSheet],
+    ) -> None:
+        """
+        Bind a reference field of `sheet` to the index of the keys it references, either
+        the range of a sequence column or an index filled while the referenced sheet,
+        which must be one of the `previous` sheets, is generated.
+        """
+        error = f"Error parsing field '{field.name}' of sheet '{sheet.name}'"
+        parent = next((other for other in sheets if other.name == field.sheet), None)
+        if parent is None:
+            msg = f"{error}: referenced sheet '{field.sheet}' not found"
+            raise ValueError(msg)
+        key = next(
+            (other for other in parent.fexcel.fields if other.name == field.field),
+            None,
+        )
+        if key is None:
+            msg = f"{error}: referenced field '{field.sheet}.{field.field}' not found"
+            raise ValueError(msg)
+
+        # NOTE: Nullable sequences skip the keys of their null cells, so only the keys
+        # they actually hold can be referenced, which takes indexing them.
+        if isinstance(key, SequenceFieldFaker) and not key.null_probability:
+            keys = range(
+                key.start,
+                key.start + parent.num_fakes * key.step,
+                key.step,
+            )
+            field.bind(RangeKeyIndex(keys, key.format_string), key.native_type)
+        elif parent in previous:
+            native_type = key.native_type if key.native_type is int else str
+            field.bind(parent.fexcel.track_keys(key.name), native_type)
+        else:
+            msg = (
+                f"{error}: sheet '{parent.name}' must be declared before the sheets "
+                "referencing it, unless the referenced field is a sequence"
+            )
+            raise ValueError(msg)
+
+    def _parse_sheet(self, sheet: dict[str, Any]) -> FexcelSheet:
+        try:
+            name = sheet["name"]
+            fields = sheet["fields"]
+        except (KeyError, TypeError) as err:
+            msg = f"Error parsing sheet '{sheet}': {err} key not found"
+            raise ValueError(msg) from err
+
+        num_fakes = sheet.get("num_fakes", self.num_fakes)
+        if not isinstance(num_fakes, int) or num_fakes < 0:
+            msg = (
+                f"Error parsing sheet '{name}': 'num_fakes' must be a non negative "
+                f"integer, got {num_fakes}"
+            )
+            raise ValueError(msg)
+
+        fexcel = Fexcel(
+            fields,
+            seed=self._rng.getrandbits(64),
+            profiler=self.profiler,
+        )
+        return FexcelSheet(name=name, fexcel=fexcel, num_fakes=num_fakes)
+
+    def write_to_file(
+        self,
+        file_path: str | Path,
+        workers: int = 1,
+        **writer_options: Any,
+    ) -> None:
+        """
+        Generate and write the fake records of every sheet in a single excel file.
+
+        Sheets are generated and streamed to the file one after the other, in the order
+        they were declared, in a single pass.
+
+        :param file_path: Path to the file where the excel data will be written.
+        :type file_path: str | Path
+        :param workers: Number of processes used to generate the records, see
+        :meth:`fexcel.Fexcel.get_fake_columns`, defaults to 1
+        :type workers: int, optional
+        :param writer_options: Options passed down to the writer handling the file type.
+        :type writer_options: Any
+        """
+        file_path = Path(file_path).resolve()
+        num_rows = sum(sheet.num_fakes for sheet in self._sheets)
+        writer_cls = Fexcel.get_writer_class(file_path, num_rows)
+        if writer_cls.single_sheet and len(self._sheets) > 1:
+            msg = (
+                f"Cannot write {len(self._sheets)} sheets, {file_path.name} can only "
+                "hold a single sheet"
+            )
+            raise ValueError(msg)
+        with writer_cls(file_path, **writer_options) as writer:
+            with profile_phase(self.profiler, "serialize"):
+                for sheet in self._sheets:
+                    sheet.fexcel.write_sheet(
+                        writer,
+                        sheet.num_fakes,
+                        sheet.name,
+                        workers,
+                    )
+                writer.flush()
+            with profile_phase(self.profiler, "finalize"):
+                writer.close()
+        if self.profiler is not None:
+            self.profiler.record(
+                Measurement("file", file_path.name, nbytes=file_path.stat().st_size),
+            )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FexcelWorkbook):
+            return False
+        return self.sheets == other.sheets
+
+    def __str__(self) -> str:
+        ret = "ExcelWorkbookFaker(\n"
+        for sheet in self.sheets:
+            ret += f"\t{sheet.name} ({sheet.num_fakes} records): {sheet.fexcel}\n"
+        ret += ")"
+        return ret
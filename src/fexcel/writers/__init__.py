@@ -0,0 +1,13 @@
+from .base import FexcelWriter
+from .columnar import ArrowWriter
+from .delimited import CSVWriter
+from .generic import PyexcelWriter
+from .xlsx import XLSXWriter
+
+__all__ = [
+    "ArrowWriter",
+    "CSVWriter",
+    "FexcelWriter",
+    "PyexcelWriter",
+    "XLSXWriter",
+]
@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Self
+
+
+class FexcelWriter(ABC):
+    """
+    Abstract base class representing a sink `Fexcel` streams its fake data to.
+
+    Writers receive the data of each sheet as an iterable of column blocks, the same
+    blocks :meth:`fexcel.Fexcel.get_fake_columns` yields, and are expected to consume
+    them one at a time so memory usage does not depend on the number of rows written.
+
+    Writers are context managers, the destination file is only guaranteed to be
+    complete once the writer has been closed.
+    """
+
+    native: bool = True
+    """Whether the writer expects values in their native types instead of strings"""
+
+    single_sheet: bool = False
+    """Whether the file format can only hold a single sheet"""
+
+    # NOTE: Maximum number of rows of a single sheet, header included, of the file
+    # formats that have one.
+    ROW_LIMITS = {  # noqa: RUF012
+        ".xls": 65_536,
+        ".xlsx": 1_048_576,
+        ".xlsm": 1_048_576,
+        ".ods": 1_048_576,
+    }
+
+    def __init__(self, file_path: str | Path, **_kwargs: Any) -> None:
+        self.file_path = Path(file_path)
+        self.max_rows = self.get_max_rows(self.file_path)
+
+    @classmethod
+    def get_max_rows(cls, file_path: Path) -> int | None:
+        """
+        Get the maximum number of rows, header included, a single sheet of the file
+        can hold.
+
+        :param file_path: Path to the destination file.
+        :type file_path: Path
+        :return: The row limit of the file format, or None if it has no limit.
+        :rtype: int | None
+        """
+        return cls.ROW_LIMITS.get(file_path.suffix.lower())
+
+    @abstractmethod
+    def write_sheet(
+        self,
+        sheet_name: str,
+        header: list[str],
+        blocks: Iterable[list[list[Any]]],
+        types: list[type] | None = None,
+    ) -> None:
+        """
+        Write a whole sheet to the destination file.
+
+        :param sheet_name: The name of the sheet to write.
+        :type sheet_name: str
+        :param header: The names of the columns of the sheet.
+        :type header: list[str]
+        :param blocks: The column blocks holding the data of the sheet.
+        :type blocks: Iterable[list[list[Any]]]
+        :param types: The native types of the values of each column, used by writers
+        of formats with a typed schema. If None, every column holds strings.
+        :type types: list[type] | None, optional
+        """
+        ...
+
+    def flush(self) -> None:  # noqa: B027
+        """
+        Serialize every sheet whose writing `write_sheet` deferred, for writers of
+        formats saved as a whole, so it is timed apart from finishing the file. Does
+        nothing by default.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """
+        Finish writing the destination file and release any resource held by the
+        writer. Does nothing by default.
+        """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,160 @@
+from collections.abc import Iterable
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from fexcel.writers.base import FexcelWriter
+
+# NOTE: `pyarrow` is only imported once a writer needs it, it is slow to import
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from pyarrow import ipc, parquet
+
+
+class ArrowWriter(FexcelWriter):
+    """
+    Writer for the columnar `.parquet` and Arrow IPC `.arrow` file formats, requires
+    the `parquet` extra (`pyarrow`) to be installed.
+
+    Column blocks are converted to Arrow record batches with a proper column type for
+    every field, and they are buffered until `row_group_size` rows are ready to be
+    flushed to the file together, as a single row group in `.parquet` files.
+
+    :param row_group_size: Number of rows buffered before writing them to the file,
+    defaults to 100000.
+    :param compression: Compression codec of the file, defaults to `"snappy"` for
+    `.parquet` files and to no compression for `.arrow` files.
+    """
+
+    single_sheet = True
+
+    DEFAULT_ROW_GROUP_SIZE = 100_000
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        compression: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file_path, **kwargs)
+        try:
+            import pyarrow as pa  # noqa: F401, PLC0415
+        except ImportError as err:
+            msg = (
+                f"Unable to write {self.file_path.name}: pyarrow is not installed, "
+                "install it with the 'parquet' extra"
+            )
+            raise ImportError(msg) from err
+        if row_group_size <= 0:
+            msg = f"Row group size must be a positive integer, got {row_group_size}"
+            raise ValueError(msg)
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._has_sheet = False
+
+    @staticmethod
+    def arrow_type(native_type: type) -> "pa.DataType":
+        """
+        Map the native type of a field to the Arrow type of its column. Any type
+        without a dedicated Arrow type is stored as a string.
+
+        :param native_type: The native type of the field values.
+        :type native_type: type
+        :return: The corresponding Arrow type.
+        :rtype: pyarrow.DataType
+        """
+        import pyarrow as pa  # noqa: PLC0415
+
+        # NOTE: `bool` must be checked before `int` and `datetime` before `date` as
+        # they are subclasses of them.
+        arrow_types = (
+            (bool, pa.bool_),
+            (int, pa.int64),
+            (float, pa.float64),
+            (datetime, lambda: pa.timestamp("us")),
+            (date, pa.date32),
+            (time, lambda: pa.time64("us")),
+        )
+        for python_type, arrow_type in arrow_types:
+            if issubclass(native_type, python_type):
+                return arrow_type()
+        return pa.string()
+
+    def write_sheet(
+        self,
+        sheet_name: str,
+        header: list[str],
+        blocks: Iterable[list[list[Any]]],
+        types: list[type] | None = None,
+    ) -> None:
+        if self._has_sheet:
+            msg = (
+                f"Cannot write sheet '{sheet_name}', {self.file_path.name} can only "
+                "hold a single table"
+            )
+            raise ValueError(msg)
+        self._has_sheet = True
+
+        import pyarrow as pa  # noqa: PLC0415
+
+        types = types or [str] * len(header)
+        schema = pa.schema(
+            [
+                pa.field(name, self.arrow_type(native_type))
+                for name, native_type in zip(header, types, strict=True)
+            ],
+        )
+        with self._open(schema) as writer:
+            pending: list[pa.RecordBatch] = []
+            pending_rows = 0
+            for columns in blocks:
+                batch = pa.record_batch(
+                    [
+                        self._to_array(column, field.type)
+                        for column, field in zip(columns, schema, strict=True)
+                    ],
+                    schema=schema,
+                )
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                if pending_rows >= self.row_group_size:
+                    writer.write_table(pa.Table.from_batches(pending, schema=schema))
+                    pending, pending_rows = [], 0
+            if pending:
+                writer.write_table(pa.Table.from_batches(pending, schema=schema))
+
+    @staticmethod
+    def _to_array(column: list[Any], arrow_type: "pa.DataType") -> "pa.Array":
+        """
+        Convert a column to an Arrow array of `arrow_type`. String columns may hold
+        values of any other type, e.g. choices among numbers, which are converted to
+        strings, nulls aside, only when Arrow rejects them.
+        """
+        import pyarrow as pa  # noqa: PLC0415
+
+        try:
+            return pa.array(column, type=arrow_type)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            if arrow_type != pa.string():
+                raise
+        return pa.array(
+            [None if value is None else str(value) for value in column],
+            type=arrow_type,
+        )
+
+    def _open(
+        self,
+        schema: "pa.Schema",
+    ) -> "parquet.ParquetWriter | ipc.RecordBatchFileWriter":
+        from pyarrow import ipc, parquet  # noqa: PLC0415
+
+        if self.file_path.suffix.lower() == ".parquet":
+            return parquet.ParquetWriter(
+                str(self.file_path),
+                schema,
+                compression=self.compression or "snappy",
+            )
+        options = ipc.IpcWriteOptions(compression=self.compression)
+        return ipc.new_file(str(self.file_path), schema, options=options)
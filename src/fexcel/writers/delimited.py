@@ -0,0 +1,90 @@
+import csv
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from fexcel.writers.base import FexcelWriter
+
+
+class CSVWriter(FexcelWriter):
+    """
+    Native writer for delimited text files such as `.csv` and `.tsv` files.
+
+    Rows are streamed in schema order through the standard library `csv` module into a
+    file with a large write buffer, without going through `pyexcel` at all.
+
+    :param delimiter: Character separating values, defaults to a tab for `.tsv` files
+    and to a comma for any other file.
+    :param quoting: Quoting policy, either one of `"minimal"`, `"all"`, `"nonnumeric"`
+    or `"none"` or any of the `csv.QUOTE_*` constants, defaults to `"minimal"`.
+    :param encoding: Encoding of the file, defaults to `"utf-8"`.
+    :param buffer_size: Size in bytes of the write buffer, defaults to 1 MiB.
+    """
+
+    native = False
+    single_sheet = True
+
+    QUOTING_POLICIES = {  # noqa: RUF012
+        "minimal": csv.QUOTE_MINIMAL,
+        "all": csv.QUOTE_ALL,
+        "nonnumeric": csv.QUOTE_NONNUMERIC,
+        "none": csv.QUOTE_NONE,
+    }
+    DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        delimiter: str | None = None,
+        quoting: str | int = "minimal",
+        encoding: str = "utf-8",
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(file_path, **kwargs)
+        if delimiter is None:
+            delimiter = "\t" if self.file_path.suffix.lower() == ".tsv" else ","
+        self.delimiter = delimiter
+        self.quoting = self._parse_quoting(quoting)
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self._has_sheet = False
+
+    def _parse_quoting(self, quoting: str | int) -> int:
+        if isinstance(quoting, int):
+            return quoting
+        try:
+            return self.QUOTING_POLICIES[quoting.lower()]
+        except KeyError as err:
+            msg = (
+                f"Invalid quoting policy: {quoting}, must be one of "
+                f"{', '.join(self.QUOTING_POLICIES)}"
+            )
+            raise ValueError(msg) from err
+
+    def write_sheet(
+        self,
+        sheet_name: str,
+        header: list[str],
+        blocks: Iterable[list[list[Any]]],
+        types: list[type] | None = None,  # noqa: ARG002
+    ) -> None:
+        if self._has_sheet:
+            msg = (
+                f"Cannot write sheet '{sheet_name}', {self.file_path.name} can only "
+                "hold a single sheet"
+            )
+            raise ValueError(msg)
+        self._has_sheet = True
+
+        with self.file_path.open(
+            "w",
+            newline="",
+            encoding=self.encoding,
+            buffering=self.buffer_size,
+        ) as fp:
+            writer = csv.writer(fp, delimiter=self.delimiter, quoting=self.quoting)
+            writer.writerow(header)
+            for columns in blocks:
+                writer.writerows(zip(*columns, strict=True))
@@ -0,0 +1,86 @@
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from fexcel.writers.base import FexcelWriter
+
+
+class PyexcelWriter(FexcelWriter):
+    """
+    Writer delegating to `pyexcel`, and therefore able to handle any file type there is
+    a `pyexcel` plugin installed for.
+
+    Rows are handed to `pyexcel` through a generator, so they are written in a single
+    pass. Whether they are streamed to disk or held in memory depends on the plugin.
+
+    As `pyexcel` saves a whole book at once, sheets are only registered by
+    `write_sheet` and they are all generated and written, in order, when the writer
+    is flushed, or closed if it was not.
+    """
+
+    TEXT_FORMATS = (".csv", ".tsv", ".csvz", ".tsvz")
+
+    def __init__(self, file_path: str | Path, **kwargs: Any) -> None:
+        super().__init__(file_path, **kwargs)
+        # NOTE: Only plain text formats need strings, any other format stores numbers,
+        # booleans and dates as properly typed cells.
+        self.native = self.file_path.suffix.lower() not in self.TEXT_FORMATS
+        self._sheets: dict[str, Iterator[list[Any]]] = {}
+
+    def write_sheet(
+        self,
+        sheet_name: str,
+        header: list[str],
+        blocks: Iterable[list[list[Any]]],
+        types: list[type] | None = None,  # noqa: ARG002
+    ) -> None:
+        if sheet_name in self._sheets:
+            msg = f"Sheet name '{sheet_name}' is already in use"
+            raise ValueError(msg)
+        self._sheets[sheet_name] = self._iter_rows(header, blocks)
+
+    def flush(self) -> None:
+        # NOTE: `pyexcel` and its plugins are slow to import, so they are only imported
+        # when the file is finally saved.
+        import pyexcel as pe  # noqa: PLC0415
+
+        sheets, self._sheets = self._sheets, {}
+        if not sheets:
+            return
+        if len(sheets) == 1:
+            [(sheet_name, rows)] = sheets.items()
+            pe.isave_as(
+                array=rows,
+                dest_file_name=str(self.file_path),
+                sheet_name=sheet_name,
+            )
+        else:
+            pe.isave_book_as(bookdict=sheets, dest_file_name=str(self.file_path))
+        pe.free_resources()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # NOTE: Nothing has been written yet, so there is no file to finish on errors
+        if exc_type is not None:
+            self._sheets.clear()
+        super().__exit__(exc_type, exc_value, traceback)
+
+    @staticmethod
+    def _iter_rows(
+        header: list[str],
+        blocks: Iterable[list[list[Any]]],
+    ) -> Iterator[list[Any]]:
+        yield header
+        for columns in blocks:
+            # NOTE: Not every pyexcel plugin can write a None, e.g. `pyexcel-ods3`, so
+            # null cells are written as empty cells instead.
+            for row in zip(*columns, strict=True):
+                yield ["" if value is None else value for value in row]
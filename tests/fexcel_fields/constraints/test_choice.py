@@ -5,6 +5,7 @@ import pytest
 
 from fexcel.fields import (
     FexcelField,
+    choice,
 )
 
 
@@ -41,6 +42,57 @@ def test_choice_distributions() -> None:
     assert random_sample.count("C") <= max_range
 
 
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_choice_batch_distributions(
+    monkeypatch: pytest.MonkeyPatch,
+    use_numpy: bool,  # noqa: FBT001
+) -> None:
+    if use_numpy and choice.import_numpy() is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(choice, "import_numpy", lambda: None)
+
+    allowed_values = ["A", "B", "C"]
+    max_range = 1000
+
+    field_faker = FexcelField.parse_field(
+        field_name="ChoiceField",
+        field_type="choice",
+        allowed_values=allowed_values,
+        probabilities=[0, 0.01, 0.99],
+    )
+
+    random_sample = field_faker.get_values(max_range)
+
+    assert len(random_sample) == max_range
+    assert random_sample.count("A") == 0
+    assert random_sample.count("B") <= max_range // 2
+    assert random_sample.count("C") >= max_range // 2
+
+
+def test_choice_many_allowed_values() -> None:
+    allowed_values = [f"SKU-{i}" for i in range(50_000)]
+
+    field_faker = FexcelField.parse_field(
+        field_name="ChoiceField",
+        field_type="choice",
+        allowed_values=allowed_values,
+    )
+
+    assert set(field_faker.get_values(1000)) <= set(allowed_values)
+
+
+def test_choice_partial_probabilities() -> None:
+    field_faker = FexcelField.parse_field(
+        field_name="ChoiceField",
+        field_type="choice",
+        allowed_values=["A", "B", "C"],
+        probabilities=[0.5],
+    )
+
+    assert field_faker.probabilities == [0.5, 0.25, 0.25]
+
+
 def test_invalid_choice_distribution() -> None:
     allowed_values = ["A", "B", "C"]
 
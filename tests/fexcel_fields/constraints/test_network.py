@@ -0,0 +1,76 @@
+import random
+from collections import Counter
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+
+import pytest
+
+from fexcel.fields import FexcelField
+
+
+@pytest.mark.parametrize(
+    ("field_type", "network"),
+    [
+        ("ipv4", "10.0.0.0/8"),
+        ("ipv4", "192.168.1.0/24"),
+        ("ipv4", "192.168.1.7/32"),
+        ("ipv6", "2001:db8::/32"),
+        ("ipv6", "fe80::/64"),
+    ],
+)
+def test_ip_network(field_type: str, network: str) -> None:
+    field = FexcelField.parse_field("IPField", field_type, network=network)
+
+    values = [*field.get_values(1000), field.get_value()]
+
+    assert all(ip_address(value) in ip_network(network) for value in values)
+    assert all(str(ip_address(value)) == value for value in values)
+
+
+def test_ip_default_network() -> None:
+    ipv4 = FexcelField.parse_field("IPField", "ipv4")
+    ipv6 = FexcelField.parse_field("IPField", "ipv6")
+
+    assert all(
+        isinstance(ip_address(value), IPv4Address) for value in ipv4.get_values(100)
+    )
+    assert all(
+        isinstance(ip_address(value), IPv6Address) for value in ipv6.get_values(100)
+    )
+
+
+def test_ip_several_networks() -> None:
+    networks = [ip_network("10.0.0.0/24"), ip_network("172.16.0.0/16")]
+    field = FexcelField.parse_field(
+        "IPField",
+        "ipv4",
+        cidr=[str(network) for network in networks],
+        rng=random.Random(0),
+    )
+
+    counts = Counter(
+        next(network for network in networks if ip_address(value) in network)
+        for value in field.get_values(10_000)
+    )
+
+    # NOTE: Networks are drawn from in proportion to their size, 1 to 256 here
+    assert counts[networks[0]] < counts[networks[1]] // 100
+    assert counts.total() == 10_000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("field_type", "constraints", "message"),
+    [
+        (
+            "ipv4",
+            {"network": "10.0.0.0/8", "cidr": "10.0.0.0/8"},
+            "Cannot specify both",
+        ),
+        ("ipv4", {"network": "10.0.0.0/33"}, "Invalid network '10.0.0.0/33'"),
+        ("ipv4", {"network": "2001:db8::/32"}, "Not an IPv4 network"),
+        ("ipv6", {"cidr": "10.0.0.0/8"}, "Not an IPv6 network"),
+        ("ipv6", {"cidr": []}, "At least one network"),
+    ],
+)
+def test_invalid_ip_network(field_type: str, constraints: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("IPField", field_type, **constraints)
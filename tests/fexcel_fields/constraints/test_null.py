@@ -0,0 +1,145 @@
+import importlib.util
+import random
+from pathlib import Path
+
+import pyexcel as pe
+import pytest
+
+from fexcel import Fexcel, FexcelField
+from fexcel.fields import base
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("native", [True, False])
+def test_null_probability(
+    monkeypatch: pytest.MonkeyPatch,
+    use_numpy: bool,  # noqa: FBT001
+    native: bool,  # noqa: FBT001
+) -> None:
+    if use_numpy and base.import_numpy() is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(base, "import_numpy", lambda: None)
+    field = FexcelField.parse_field(
+        "IntegerField",
+        "int",
+        null_probability=0.3,
+        min_value=1,
+        max_value=10,
+        rng=random.Random(0),
+    )
+
+    column = field.get_column(base.NUMPY_MIN_BATCH_SIZE * 5, native=native)
+
+    null = None if native else ""
+    nulls = column.count(null)
+    assert 0.25 < nulls / len(column) < 0.35  # noqa: PLR2004
+    assert {type(value) for value in column} == {int if native else str, type(null)}
+
+
+@pytest.mark.parametrize("null_probability", [0, 1, "1"])
+def test_null_probability_bounds(null_probability: float | str) -> None:
+    field = FexcelField.parse_field(
+        "NameField",
+        "name",
+        null_probability=null_probability,
+    )
+
+    column = field.get_column(100, native=True)
+
+    assert column.count(None) == (100 if float(null_probability) else 0)
+
+
+def test_null_cells_are_not_generated(monkeypatch: pytest.MonkeyPatch) -> None:
+    field = FexcelField.parse_field("NameField", "name", null_probability=0.9)
+    sizes = []
+    get_values = field.get_values
+    monkeypatch.setattr(field, "get_values", lambda n: sizes.append(n) or get_values(n))
+
+    column = field.get_column(1_000)
+
+    assert sizes == [1_000 - column.count("")]
+
+
+def test_unique_values_skip_nulls() -> None:
+    field = FexcelField.parse_field(
+        "ChoiceField",
+        "choice",
+        allowed_values=list("abcdefghij"),
+        unique=True,
+        null_probability=0.99,
+        rng=random.Random(0),
+    )
+
+    column = field.get_column(500)
+
+    values = [value for value in column if value]
+    assert len(values) == len(set(values))
+    assert column.count("") >= 490  # noqa: PLR2004
+
+
+def test_nullable_sequence_keeps_row_values() -> None:
+    field = FexcelField.parse_field("SequenceField", "sequence", null_probability=0.5)
+
+    column = field.get_column(100, native=True) + field.get_column(100, native=True)
+
+    assert all(value in {None, row} for row, value in enumerate(column, 1))
+    assert None in column
+
+
+def test_null_probability_is_reproducible() -> None:
+    schema = [
+        {"name": "name", "type": "name", "constraints": {"null_probability": 0.5}},
+        {"name": "int", "type": "int"},
+    ]
+    dense = Fexcel([{"name": "name", "type": "name"}, schema[1]], seed=0)
+
+    records = list(Fexcel(schema, seed=0).get_fake_records(50))
+
+    assert records == list(Fexcel(schema, seed=0).get_fake_records(50))
+    assert [record["int"] for record in records] == [
+        record["int"] for record in dense.get_fake_records(50)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("extension", "plugin"),
+    [
+        ("xlsx", "pyexcel_xlsx"),
+        ("xls", "pyexcel_xls"),
+        ("ods", "pyexcel_ods3"),
+    ],
+)
+def test_null_cells_in_pyexcel_formats(
+    output_path: Path,
+    extension: str,
+    plugin: str,
+) -> None:
+    if importlib.util.find_spec(plugin) is None:
+        pytest.skip(f"Plugin to handle {extension} is not installed")
+    schema = [
+        {"name": "id", "type": "sequence"},
+        {"name": "int", "type": "int", "constraints": {"null_probability": 0.5}},
+        {"name": "name", "type": "name", "constraints": {"null_probability": 0.5}},
+    ]
+    output_file = output_path / f"nulls.{extension}"
+
+    Fexcel(schema, seed=0).write_to_file(output_file, 20)
+
+    [header, *rows] = pe.get_array(file_name=str(output_file))
+    assert header == ["id", "int", "name"]
+    assert len(rows) == 20  # noqa: PLR2004
+    assert any("" in row for row in rows)
+
+
+@pytest.mark.parametrize(
+    ("null_probability", "message"),
+    [
+        (1.5, "null_probability must be between 0 and 1"),
+        (-0.1, "null_probability must be between 0 and 1"),
+        ("often", "Unable to convert 'often' to float"),
+    ],
+)
+def test_invalid_null_probability(null_probability: object, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("NameField", "name", null_probability=null_probability)
@@ -1,6 +1,7 @@
 # flake8: noqa: E501, DTZ007
 
 import random
+import re
 from dataclasses import dataclass
 from typing import Callable
 
@@ -8,8 +9,9 @@ import pytest
 
 from fexcel.fields import (
     FexcelField,
+    numeric,
 )
-from fexcel.fields.numeric import FloatFieldFaker
+from fexcel.fields.numeric import FloatFieldFaker, IntegerFieldFaker
 
 # fmt: off
 numeric_field_sample = [
@@ -52,7 +54,7 @@ numeric_distributions_sample = [
             max_value=100,
             distribution="uniform",
         ),
-        expected_distribution=random.uniform,
+        expected_distribution=random.Random.uniform,
     ),
     DistributionTestCase(
         input=FexcelField.parse_field(
@@ -62,7 +64,7 @@ numeric_distributions_sample = [
             std=1,
             distribution="normal",
         ),
-        expected_distribution=random.normalvariate,
+        expected_distribution=random.Random.normalvariate,
     ),
     DistributionTestCase(
         input=FexcelField.parse_field(
@@ -72,7 +74,7 @@ numeric_distributions_sample = [
             std=1,
             distribution="gaussian",
         ),
-        expected_distribution=random.gauss,
+        expected_distribution=random.Random.gauss,
     ),
     DistributionTestCase(
         input=FexcelField.parse_field(
@@ -82,7 +84,7 @@ numeric_distributions_sample = [
             std=1,
             distribution="lognormal",
         ),
-        expected_distribution=random.lognormvariate,
+        expected_distribution=random.Random.lognormvariate,
     ),
 ]
 
@@ -90,7 +92,7 @@ numeric_distributions_sample = [
 @pytest.mark.parametrize("test_case", numeric_distributions_sample)
 def test_numeric_distributions(test_case: DistributionTestCase) -> None:
     assert isinstance(test_case.input, FloatFieldFaker)
-    assert test_case.input.rng.func == test_case.expected_distribution
+    assert test_case.input.rng.func.__func__ == test_case.expected_distribution
 
 
 @dataclass
@@ -153,3 +155,47 @@ def test_numeric_distributions_invalid(test_case: InvalidDistributionTestCase) -
             field_type="int",
             **test_case.constraints,
         )
+
+
+@pytest.mark.parametrize("field", numeric_field_sample)
+def test_numeric_batch_constraint(field: FexcelField) -> None:
+    assert isinstance(field, FloatFieldFaker)
+    values = [float(value) for value in field.get_values(100)]
+    assert all(field.min_value <= value <= field.max_value for value in values)
+
+
+@pytest.mark.parametrize("field_type", ["int", "float"])
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        {"min_value": 0, "max_value": 100, "distribution": "uniform"},
+        {"mean": 0, "std": 1, "distribution": "normal"},
+        {"mean": 0, "std": 1, "distribution": "gaussian"},
+        {"mean": 0, "std": 1, "distribution": "lognormal"},
+    ],
+)
+def test_numeric_batch_without_numpy(
+    monkeypatch: pytest.MonkeyPatch,
+    field_type: str,
+    constraints: dict,
+) -> None:
+    monkeypatch.setattr(numeric, "import_numpy", lambda: None)
+    field = FexcelField.parse_field("NumericField", field_type, **constraints)
+    assert isinstance(field, FloatFieldFaker)
+    assert field.np_rng is None
+
+    values = field.get_values(numeric.NUMPY_MIN_BATCH_SIZE)
+    assert len(values) == numeric.NUMPY_MIN_BATCH_SIZE
+    assert all(isinstance(float(value), float) for value in values)
+
+
+@pytest.mark.skipif(numeric.import_numpy() is None, reason="NumPy is not installed")
+@pytest.mark.parametrize("test_case", numeric_distributions_sample)
+def test_numeric_batch_with_numpy(test_case: DistributionTestCase) -> None:
+    assert isinstance(test_case.input, FloatFieldFaker)
+    assert test_case.input.np_rng is not None
+
+    values = test_case.input.get_values(numeric.NUMPY_MIN_BATCH_SIZE)
+    assert len(values) == numeric.NUMPY_MIN_BATCH_SIZE
+    if isinstance(test_case.input, IntegerFieldFaker):
+        assert all(re.match(r"^-?\d+$", value) for value in values)
@@ -0,0 +1,170 @@
+import random
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from fexcel import Fexcel, FexcelField
+from fexcel.fields import pool
+from fexcel.writers import FexcelWriter
+
+
+@pytest.mark.parametrize("field_type", ["name", "address", "text", "email"])
+def test_pool_size(field_type: str) -> None:
+    field = FexcelField.parse_field("Field", field_type, pool_size=5)
+
+    values = field.get_values(200) + [field.get_value() for _ in range(20)]
+
+    assert len(set(values)) <= 5  # noqa: PLR2004
+    assert set(values) <= set(field.value_pool.get_values(field.generate_value))
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_pool_zipf_distribution(
+    monkeypatch: pytest.MonkeyPatch,
+    use_numpy: bool,  # noqa: FBT001
+) -> None:
+    if use_numpy and pool.import_numpy() is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(pool, "import_numpy", lambda: None)
+    field = FexcelField.parse_field(
+        "Name",
+        "name",
+        pool_size=100,
+        pool_distribution="zipf",
+        pool_skew=2,
+        rng=random.Random(0),
+    )
+
+    counts = Counter(field.get_values(pool.NUMPY_MIN_BATCH_SIZE * 5))
+
+    [(most_common, count)] = counts.most_common(1)
+    assert most_common == field.value_pool.get_values(field.generate_value)[0]
+    # NOTE: With a skew of 2 the first value is drawn ~61% of the times
+    assert count > pool.NUMPY_MIN_BATCH_SIZE * 5 // 2
+
+
+def test_pool_weights() -> None:
+    field = FexcelField.parse_field("Name", "name", pool_weights=[0, 1, 0])
+
+    values = field.get_values(50)
+
+    assert field.pool_size == 3  # noqa: PLR2004
+    assert set(values) == {field.value_pool.get_values(field.generate_value)[1]}
+
+
+def test_pool_memory_limit() -> None:
+    field = FexcelField.parse_field(
+        "Text",
+        "text",
+        pool_size=1000,
+        pool_memory_limit=2048,
+    )
+
+    values = set(field.get_values(500))
+
+    assert 0 < len(values) < 50  # noqa: PLR2004
+    assert len(field.value_pool.get_values(field.generate_value)) < 50  # noqa: PLR2004
+
+
+def test_shared_pool() -> None:
+    schema = [
+        {
+            "name": "A",
+            "type": "name",
+            "constraints": {"pool_size": 3, "shared_pool": True},
+        },
+        {
+            "name": "B",
+            "type": "name",
+            "constraints": {"pool_size": 3, "shared_pool": True},
+        },
+        {"name": "C", "type": "name", "constraints": {"pool_size": 3}},
+    ]
+    a, b, c = Fexcel(schema, seed=0).fields
+
+    assert a.value_pool is b.value_pool
+    assert a.value_pool is not c.value_pool
+    assert set(a.get_values(100)) | set(b.get_values(100)) <= set(
+        a.value_pool.get_values(a.generate_value),
+    )
+
+
+def test_pool_is_reproducible() -> None:
+    schema = [{"name": "A", "type": "email", "constraints": {"pool_size": 10}}]
+
+    first = list(Fexcel(schema, seed=1).get_fake_records(50))
+    second = list(Fexcel(schema, seed=1).get_fake_records(50))
+
+    assert first == second
+
+
+@pytest.mark.parametrize(
+    ("constraints", "message"),
+    [
+        ({"pool_size": 0}, "pool_size must be a positive integer"),
+        ({"pool_size": 10, "pool_distribution": "normal"}, "Invalid pool_distribution"),
+        ({"pool_size": 2, "pool_weights": [1, 1, 1]}, "must have a weight for every"),
+        ({"pool_weights": [0, 0]}, "pool_weights must be positive"),
+        ({"pool_size": 2, "pool_memory_limit": 0}, "pool_memory_limit must be"),
+        ({"pool_size": 2.5}, "Invalid 'pool_size'"),
+        ({"pool_size": "many"}, "Invalid 'pool_size'"),
+        ({"pool_size": 2, "pool_skew": "steep"}, "Invalid 'pool_skew'"),
+        ({"pool_size": 2, "pool_skew": 0}, "pool_skew must be a positive number"),
+        ({"pool_weights": [1, "heavy"]}, "Invalid 'pool_weights'"),
+    ],
+)
+def test_invalid_pool(constraints: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("Name", "name", **constraints)
+
+
+def test_pool_constraints_from_strings() -> None:
+    field = FexcelField.parse_field(
+        "Name",
+        "name",
+        pool_size="3",
+        pool_distribution="zipf",
+        pool_skew="1.5",
+        pool_memory_limit="4096",
+    )
+
+    values = field.get_values(100)
+
+    assert field.pool_size == 3  # noqa: PLR2004
+    assert field.pool_skew == 1.5  # noqa: PLR2004
+    assert field.pool_memory_limit == 4096  # noqa: PLR2004
+    assert len(set(values)) <= 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pool_is_shared_by_shards(workers: int) -> None:
+    fexcel = Fexcel(
+        [{"name": "name", "type": "name", "constraints": {"pool_size": 5}}],
+        seed=0,
+    )
+
+    blocks = fexcel.get_fake_columns(30_000, batch_size=5_000, workers=workers)
+
+    values = {value for [column] in blocks for value in column}
+    assert values == set(fexcel.fields[0].value_pool.get_values(lambda: None))
+
+
+def test_pool_is_shared_by_part_files(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+) -> None:
+    monkeypatch.setitem(FexcelWriter.ROW_LIMITS, ".csv", 101)
+    fexcel = Fexcel(
+        [{"name": "name", "type": "name", "constraints": {"pool_size": 5}}],
+        seed=0,
+    )
+
+    fexcel.write_to_file(output_path / "pooled.csv", 500, rollover="file")
+
+    values = set()
+    for index in range(1, 6):
+        with output_path.joinpath(f"pooled-{index}.csv").open() as fp:
+            values.update(fp.read().splitlines()[1:])
+    assert len(values) <= 5  # noqa: PLR2004
@@ -0,0 +1,95 @@
+import random
+import sys
+
+import pytest
+
+from fexcel import FexcelField
+from fexcel.fields import ArrayKeyIndex, RangeKeyIndex
+
+
+def test_range_key_index() -> None:
+    key_index = RangeKeyIndex(range(10, 10**12, 10), "K{:012d}")
+
+    assert len(key_index) == 10**11 - 1
+    assert key_index[0] == "K000000000010"
+    assert key_index.take([1, len(key_index) - 1]) == ["K000000000020", "K999999999990"]
+
+
+def test_array_key_index() -> None:
+    key_index = ArrayKeyIndex()
+    key_index.extend([3, 1, 2])
+    key_index.extend([])
+
+    assert len(key_index) == 3  # noqa: PLR2004
+    assert key_index.take([2, 0, 0]) == [2, 3, 3]
+
+    # NOTE: Keys that are not 64 bits integers turn every key into a string
+    key_index.extend(["ñandú", 2**64])
+
+    assert len(key_index) == 5  # noqa: PLR2004
+    assert key_index.take([0, 3, 4]) == ["3", "ñandú", str(2**64)]
+
+
+def test_array_key_index_overflow_keeps_keys() -> None:
+    key_index = ArrayKeyIndex()
+    key_index.extend([1, 2])
+    key_index.extend([3, 2**70])
+
+    assert len(key_index) == 4  # noqa: PLR2004
+    assert key_index.take([0, 1, 2, 3]) == ["1", "2", "3", str(2**70)]
+
+
+def test_array_key_index_is_compact() -> None:
+    keys = [f"customer-{index}" for index in range(10_000)]
+    key_index = ArrayKeyIndex()
+    key_index.extend(keys)
+
+    assert key_index.take([0, 9_999]) == ["customer-0", "customer-9999"]
+    assert sys.getsizeof(key_index._buffer) + sys.getsizeof(key_index._offsets) < sum(  # noqa: SLF001
+        map(sys.getsizeof, keys),
+    )
+
+
+def test_reference_values() -> None:
+    field = FexcelField.parse_field(
+        "ReferenceField",
+        "reference",
+        sheet="Customers",
+        field="Id",
+        rng=random.Random(0),
+    )
+    field.bind(RangeKeyIndex(range(1, 101)), int)
+
+    values = field.get_native_values(1_000)
+
+    assert field.native_type is int
+    assert set(values) <= set(range(1, 101))
+    assert len(set(values)) > 50  # noqa: PLR2004
+    assert field.get_values(1)[0] in {str(value) for value in range(1, 101)}
+    assert field.cardinality == 100  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("key_index", "message"),
+    [
+        (None, "only be resolved within a workbook"),
+        (ArrayKeyIndex(), "the sheet must be generated first"),
+    ],
+)
+def test_unresolved_reference(key_index: ArrayKeyIndex | None, message: str) -> None:
+    field = FexcelField.parse_field(
+        "ReferenceField",
+        "reference",
+        sheet="Customers",
+        field="Id",
+    )
+    if key_index is not None:
+        field.bind(key_index)
+
+    with pytest.raises(ValueError, match=message):
+        field.get_values(10)
+
+
+def test_invalid_reference_constraints() -> None:
+    with pytest.raises(ValueError, match="Both sheet and field"):
+        FexcelField.parse_field("ReferenceField", "reference", sheet="Customers")
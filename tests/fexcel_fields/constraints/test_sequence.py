@@ -0,0 +1,66 @@
+import pytest
+
+from fexcel import FexcelField
+
+
+@pytest.mark.parametrize(
+    ("constraints", "expected"),
+    [
+        ({}, ["1", "2", "3"]),
+        ({"start": 10, "step": 5}, ["10", "15", "20"]),
+        ({"start": 0, "step": -2}, ["0", "-2", "-4"]),
+        ({"padding": 4}, ["0001", "0002", "0003"]),
+        ({"prefix": "ID-"}, ["ID-1", "ID-2", "ID-3"]),
+        ({"prefix": "{A}", "padding": 2}, ["{A}01", "{A}02", "{A}03"]),
+        (
+            {"format_string": "INV-{:03d}/2024"},
+            ["INV-001/2024", "INV-002/2024", "INV-003/2024"],
+        ),
+    ],
+)
+def test_sequence_values(constraints: dict, expected: list[str]) -> None:
+    field = FexcelField.parse_field("SequenceField", "sequence", **constraints)
+
+    assert [field.get_value(), *field.get_values(2)] == expected
+
+
+def test_sequence_native_values() -> None:
+    field = FexcelField.parse_field("SequenceField", "sequence", start=100)
+    padded = FexcelField.parse_field("SequenceField", "sequence", padding=3)
+
+    assert field.native_type is int
+    assert field.get_native_values(3) == [100, 101, 102]
+    assert padded.native_type is str
+    assert padded.get_native_values(2) == ["001", "002"]
+
+
+def test_sequence_seek() -> None:
+    field = FexcelField.parse_field("SequenceField", "serial", start=1, step=10)
+
+    field.seek(1_000)
+
+    assert field.get_native_values(2) == [10_001, 10_011]
+    assert field.get_column(2, native=True) == [10_021, 10_031]
+
+
+def test_other_fields_ignore_seek() -> None:
+    field = FexcelField.parse_field("IntegerField", "int", min_value=1, max_value=1)
+
+    field.seek(1_000)
+
+    assert field.get_values(2) == ["1", "1"]
+
+
+@pytest.mark.parametrize(
+    ("constraints", "message"),
+    [
+        ({"step": 0}, "step must be different from 0"),
+        ({"start": "first"}, "Unable to convert 'first' to int"),
+        ({"padding": -1}, "Must be a positive integer"),
+        ({"format_string": "{:d}", "prefix": "A"}, "Cannot specify both"),
+        ({"format_string": "{0}-{1}"}, "Invalid 'format_string'"),
+    ],
+)
+def test_invalid_sequence_constraints(constraints: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("SequenceField", "sequence", **constraints)
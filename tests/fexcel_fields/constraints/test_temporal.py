@@ -1,6 +1,7 @@
 # flake8: noqa: E501, DTZ007
 
-from datetime import datetime, timezone
+import random
+from datetime import datetime, time, timezone
 
 import pytest
 
@@ -8,6 +9,7 @@ from fexcel.fields import (
     DateFieldFaker,
     DateTimeFieldFaker,
     FexcelField,
+    temporal,
 )
 
 # fmt: off
@@ -39,3 +41,159 @@ def test_temporal_constraint(field: FexcelField) -> None:
 def test_invalid_temporal_constraint() -> None:
     with pytest.raises(ValueError, match=r"Invalid 'start_date'"):
         FexcelField.parse_field("DateField", "datetime", start_date="FAIL")
+
+
+def test_temporal_constraint_is_parsed() -> None:
+    field = FexcelField.parse_field(
+        "DateTimeField",
+        "datetime",
+        start_date="2023-01-01 10:00:00",
+        end_date="2023-01-01T12:00:00+02:00",
+    )
+
+    assert field.start_date == datetime(2023, 1, 1, 10)  # noqa: DTZ001
+    assert field.end_date == datetime(2023, 1, 1, 10)  # noqa: DTZ001
+    assert set(field.get_values(10)) == {"2023-01-01 10:00:00"}
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("field_type", ["date", "datetime"])
+def test_temporal_batch_constraint(
+    monkeypatch: pytest.MonkeyPatch,
+    field_type: str,
+    use_numpy: bool,  # noqa: FBT001
+) -> None:
+    if use_numpy and temporal.import_numpy() is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(temporal, "import_numpy", lambda: None)
+    field = FexcelField.parse_field(
+        "TemporalField",
+        field_type,
+        start_date="2023-01-01",
+        end_date="2023-01-31",
+    )
+
+    values = field.get_native_values(temporal.NUMPY_MIN_BATCH_SIZE)
+
+    assert all(isinstance(value, field.native_type) for value in values)
+    assert min(values).isoformat() >= "2023-01-01"
+    assert max(values).isoformat() <= "2023-01-31T00:00:00"
+    assert len({value.day for value in values}) > 1
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_time_constraint(
+    monkeypatch: pytest.MonkeyPatch,
+    use_numpy: bool,  # noqa: FBT001
+) -> None:
+    if use_numpy and temporal.import_numpy() is None:
+        pytest.skip("NumPy is not installed")
+    if not use_numpy:
+        monkeypatch.setattr(temporal, "import_numpy", lambda: None)
+    field = FexcelField.parse_field(
+        "TimeField",
+        "time",
+        start_time="09:00",
+        end_time="17:30:00",
+    )
+
+    values = field.get_native_values(temporal.NUMPY_MIN_BATCH_SIZE)
+
+    assert all(isinstance(value, time) for value in values)
+    assert min(values) >= time(9)
+    assert max(values) <= time(17, 30)
+    assert all("09:00:00" <= value <= "17:30:00" for value in field.get_values(100))
+
+
+@pytest.mark.parametrize("field_type", ["date", "datetime"])
+def test_temporal_default_bounds_are_fixed(field_type: str) -> None:
+    def generate() -> list[str]:
+        field = FexcelField.parse_field(
+            "TemporalField",
+            field_type,
+            rng=random.Random(0),
+        )
+        return field.get_values(temporal.NUMPY_MIN_BATCH_SIZE)
+
+    values = generate()
+
+    assert values == generate()
+    assert "1970-01-01" <= min(values) <= max(values) <= "2025-01-01"
+
+
+def test_temporal_wide_span_reaches_every_microsecond() -> None:
+    field = FexcelField.parse_field(
+        "DateTimeField",
+        "datetime",
+        start_date="0001-01-01",
+        end_date="9999-12-31",
+        rng=random.Random(0),
+    )
+
+    values = field.get_native_values(500)
+
+    # NOTE: Scaling a random float, with its 53 bits, to this span of 2**58
+    # microseconds only reaches multiples of 16 microseconds
+    assert len({value.microsecond % 16 for value in values}) == 16  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("field_type", "format_string"),
+    [
+        ("datetime", "%Y-%m-%d %H:%M:%S"),
+        ("datetime", "%Y-%m-%dT%H:%M:%S.%f"),
+        ("datetime", "%d/%m/%Y %H:%M"),
+        ("date", "%Y-%m-%d"),
+        ("time", "%H:%M:%S"),
+        ("time", "%H:%M"),
+    ],
+)
+def test_temporal_format(field_type: str, format_string: str) -> None:
+    # NOTE: Fields end by default at the current time, which changes between them
+    constraints = (
+        {"end_time": "23:59"} if field_type == "time" else {"end_date": "2023-01-01"}
+    )
+    field = FexcelField.parse_field(
+        "TemporalField",
+        field_type,
+        format_string=format_string,
+        rng=random.Random(0),
+        **constraints,
+    )
+    same_field = FexcelField.parse_field(
+        "TemporalField",
+        field_type,
+        format_string=format_string,
+        rng=random.Random(0),
+        **constraints,
+    )
+
+    values = field.get_values(50)
+
+    assert values == [
+        value.strftime(format_string) for value in same_field.get_native_values(50)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("field_type", "constraints", "message"),
+    [
+        (
+            "datetime",
+            {"start_date": "2023-02-01", "end_date": "2023-01-01"},
+            "start_date must be earlier",
+        ),
+        (
+            "time",
+            {"start_time": "12:00", "end_time": "11:00"},
+            "start_time must be earlier",
+        ),
+        ("time", {"start_time": "noon"}, "Invalid 'start_time'"),
+    ],
+)
+def test_invalid_temporal_bounds(
+    field_type: str, constraints: dict, message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("TemporalField", field_type, **constraints)
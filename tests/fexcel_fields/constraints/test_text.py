@@ -1,7 +1,197 @@
-from fexcel import FexcelField
+import random
+from uuid import RFC_4122, UUID
+
+import pytest
+
+from fexcel import Fexcel, FexcelField
+from fexcel.fields.text import word_bank
 
 
 def test_valid_text() -> None:
     field = FexcelField.parse_field("TextField", "text")
     for _ in range(100):
         assert "\n" not in field.get_value()
+
+
+@pytest.mark.parametrize(
+    ("min_chars", "max_chars"),
+    [(5, 200), (20, 25), (1, 2), (50, 50), (0, 1)],
+)
+def test_text_length(min_chars: int, max_chars: int) -> None:
+    field = FexcelField.parse_field(
+        "TextField",
+        "text",
+        min_chars=min_chars,
+        max_chars=max_chars,
+    )
+
+    values = [*field.get_values(500), field.get_value()]
+
+    assert all(min_chars <= len(value) <= max_chars for value in values)
+
+
+def test_text_ends_with_whole_words() -> None:
+    field = FexcelField.parse_field("TextField", "text", min_chars=30, max_chars=60)
+
+    words = {word.lower() for word in word_bank()}
+    for value in field.get_values(200):
+        assert value[0].isupper()
+        assert value.endswith(".")
+        assert all(word.strip(".").lower() in words for word in value.split())
+
+
+def test_text_words() -> None:
+    field = FexcelField.parse_field("TextField", "text", min_words=3, max_words=5)
+
+    counts = {len(value.split()) for value in field.get_values(500)}
+
+    assert counts == {3, 4, 5}
+
+
+@pytest.mark.parametrize(
+    ("constraints", "bounds"),
+    [
+        ({"max_chars": 3}, (3, 3, 1, 30)),
+        ({"min_chars": 300}, (300, 300, 1, 30)),
+        ({"max_chars": "50"}, (5, 50, 1, 30)),
+        ({"max_words": 2}, (5, 200, 1, 2)),
+        ({"min_words": 40}, (5, 200, 40, 40)),
+    ],
+)
+def test_text_missing_bound(constraints: dict, bounds: tuple[int, ...]) -> None:
+    field = FexcelField.parse_field("TextField", "text", **constraints)
+
+    assert (
+        field.min_chars,
+        field.max_chars,
+        field.min_words,
+        field.max_words,
+    ) == bounds
+
+
+def test_text_without_whole_words(monkeypatch: pytest.MonkeyPatch) -> None:
+    field = FexcelField.parse_field(
+        "TextField",
+        "text",
+        min_chars=3,
+        max_chars=3,
+        rng=random.Random(0),
+    )
+    # NOTE: A text without spaces leaves no whole word to end the texts at
+    monkeypatch.setattr(field, "_sentences", "".join)
+
+    values = field.generate_values(50)
+
+    assert all(len(value) == 3 for value in values)  # noqa: PLR2004
+    assert len(set(values)) > 40  # noqa: PLR2004
+
+
+def test_text_is_reproducible() -> None:
+    first = FexcelField.parse_field("TextField", "text", rng=random.Random(0))
+    second = FexcelField.parse_field("TextField", "text", rng=random.Random(0))
+
+    assert first.get_values(100) == second.get_values(100)
+
+
+@pytest.mark.parametrize(
+    ("constraints", "message"),
+    [
+        ({"min_chars": 10, "max_words": 5}, "Cannot specify both"),
+        ({"min_chars": 10, "max_chars": 5}, "min_chars must be less than"),
+        ({"max_chars": 0}, "min_chars must be less than"),
+        ({"min_words": 4, "max_words": 2}, "min_words must be less than"),
+        ({"min_words": -1}, "Must be a positive integer"),
+        ({"max_chars": "many"}, "Unable to convert 'many' to int"),
+    ],
+)
+def test_invalid_text_constraints(constraints: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("TextField", "text", **constraints)
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuid_version(version: int) -> None:
+    field = FexcelField.parse_field("UUIDField", "uuid", version=version)
+
+    values = [*field.get_values(1000), field.get_value()]
+
+    assert len(set(values)) == len(values)
+    for value in values:
+        parsed = UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == version
+        assert parsed.variant == RFC_4122
+
+
+def test_uuid7_is_time_ordered() -> None:
+    field = FexcelField.parse_field(
+        "UUIDField",
+        "uuid",
+        version=7,
+        start_date="2024-01-01T00:00:00",
+    )
+
+    values = field.get_values(5000) + field.get_values(5000)
+
+    assert values == sorted(values)
+    assert UUID(values[0]).int >> 80 == 1_704_067_200_000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuid_is_reproducible(version: int) -> None:
+    def generate() -> list[str]:
+        field = FexcelField.parse_field(
+            "UUIDField",
+            "uuid",
+            version=version,
+            rng=random.Random(0),
+        )
+        return field.get_values(100)
+
+    assert generate() == generate()
+
+
+def test_uuid7_default_start_date() -> None:
+    field = FexcelField.parse_field("UUIDField", "uuid", version=7)
+
+    assert UUID(field.get_value()).int >> 80 == 1_735_689_600_000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_uuid7_continues_across_shards(workers: int) -> None:
+    fexcel = Fexcel(
+        [{"name": "id", "type": "uuid", "constraints": {"version": 7, "unique": True}}],
+        seed=0,
+    )
+
+    blocks = fexcel.get_fake_columns(10_000, batch_size=1_000, workers=workers)
+
+    values = [value for [column] in blocks for value in column]
+    assert values == sorted(values)
+    assert [UUID(value).int >> 64 & 0xFFF for value in values[4095:4098]] == [
+        4095,
+        0,
+        1,
+    ]
+
+
+def test_uuid7_seek() -> None:
+    field = FexcelField.parse_field("UUIDField", "uuid", version=7)
+    [_, _, third] = field.get_values(3)
+
+    field.seek(2)
+
+    assert field.get_value()[:18] == third[:18]
+
+
+@pytest.mark.parametrize(
+    ("constraints", "message"),
+    [
+        ({"version": 1}, "Invalid UUID version 1"),
+        ({"start_date": "2024-01-01"}, "only be specified for version 7"),
+        ({"version": 7, "start_date": "yesterday"}, "Invalid 'start_date'"),
+    ],
+)
+def test_invalid_uuid_constraints(constraints: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        FexcelField.parse_field("UUIDField", "uuid", **constraints)
@@ -0,0 +1,124 @@
+# flake8: noqa: E501
+
+import random
+
+import pytest
+
+from fexcel import FexcelField
+
+# fmt: off
+unique_field_sample = [
+    FexcelField.parse_field("IntegerField", "int", unique=True, min_value=-50, max_value=1_000),
+    FexcelField.parse_field("IntegerField", "int", unique=True, max_value=10**12),
+    FexcelField.parse_field("DateField", "date", unique=True, start_date="2023-01-01"),
+    FexcelField.parse_field("IPv4Field", "ipv4", unique=True, network="10.0.0.0/22"),
+    FexcelField.parse_field("NameField", "name", unique=True),
+    FexcelField.parse_field("ChoiceField", "choice", unique=True, allowed_values=list("abcdefghij")),
+    FexcelField.parse_field("TextField", "text", unique=True, pool_size=50),
+]
+# fmt: on
+
+
+@pytest.mark.parametrize("field", unique_field_sample)
+def test_unique_values(field: FexcelField) -> None:
+    n = field.cardinality if field.cardinality is not None else 1_000
+    n = min(n, 1_000)
+
+    values = field.get_column(n // 2) + field.get_column(n - n // 2)
+
+    assert len(values) == n
+    assert len(set(values)) == n
+
+
+def test_unique_integers_cover_the_range() -> None:
+    field = FexcelField.parse_field(
+        "IntegerField",
+        "int",
+        unique=True,
+        min_value=1.5,
+        max_value=100,
+    )
+
+    values = field.get_column(99, native=True)
+
+    assert sorted(values) == list(range(2, 101))
+    assert values != sorted(values)
+    with pytest.raises(ValueError, match="it can only generate 99 distinct values"):
+        field.get_column(1)
+
+
+@pytest.mark.parametrize(
+    ("field_type", "constraints", "cardinality"),
+    [
+        ("bool", {}, 2),
+        ("bool", {"probability": 1}, 1),
+        ("choice", {"allowed_values": ["a", "b", "a"]}, 2),
+        ("choice", {"allowed_values": ["a", "b"], "probabilities": [1, 0]}, 1),
+        ("date", {"start_date": "2023-01-01", "end_date": "2023-01-31"}, 31),
+        ("time", {"start_time": "10:00", "end_time": "10:00:01"}, 1_000_001),
+        ("ipv6", {"network": ["fe80::/120", "fe90::/124"]}, 272),
+        ("name", {"pool_size": 3, "pool_weights": [1, 0, 1]}, 2),
+        ("name", {}, None),
+    ],
+)
+def test_cardinality(field_type: str, constraints: dict, cardinality: int) -> None:
+    field = FexcelField.parse_field("Field", field_type, **constraints)
+
+    assert field.cardinality == cardinality
+
+
+def test_not_enough_unique_values() -> None:
+    field = FexcelField.parse_field(
+        "ChoiceField",
+        "choice",
+        unique=True,
+        allowed_values=["a", "b", "c"],
+    )
+
+    assert sorted(field.get_column(2)) != ["a", "a"]
+    with pytest.raises(ValueError, match="it can only generate 3 distinct values"):
+        field.get_column(2)
+
+
+def test_unique_values_run_out() -> None:
+    field = FexcelField.parse_field(
+        "DateTimeField",
+        "datetime",
+        unique=True,
+        start_date="2023-01-01",
+        end_date="2023-01-02T23:59:59",
+        format_string="%Y-%m-%d",
+    )
+
+    # NOTE: The field draws microseconds but only formats two distinct days
+    with pytest.raises(ValueError, match="its values ran out after 2 unique values"):
+        field.get_column(3)
+
+
+def test_unique_values_are_reproducible() -> None:
+    def generate() -> list[str]:
+        field = FexcelField.parse_field(
+            "NameField",
+            "name",
+            unique=True,
+            pool_size=200,
+            rng=random.Random(0),
+        )
+        return field.get_column(150)
+
+    assert generate() == generate()
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_unique_values_with_colliding_hashes(native: bool) -> None:  # noqa: FBT001
+    # NOTE: -1 and -2 share the same hash in CPython
+    field = FexcelField.parse_field(
+        "ChoiceField",
+        "choice",
+        unique=True,
+        allowed_values=[-1, -2],
+    )
+
+    values = field.get_column(2, native=native)
+
+    assert sorted(map(int, values)) == [-2, -1]
@@ -1,3 +1,4 @@
+import random
 import re
 
 import pytest
@@ -26,3 +27,48 @@ def test_field_faker_factory_invalid_type() -> None:
 
     with pytest.raises(ValueError, match=f"Unknown field type: {invalid_type.lower()}"):
         FexcelField.parse_field("Test", invalid_type)
+
+
+@pytest.mark.parametrize("tt", test_cases)
+def test_field_faker_batch_values(tt: FactoryTestCase) -> None:
+    field_faker = FexcelField.parse_field(
+        tt.input.name,
+        tt.input.type,
+    )
+
+    n = 50
+    values = field_faker.get_values(n)
+    assert isinstance(values, list)
+    assert len(values) == n
+
+    expected = re.compile(tt.output.pattern)
+    assert all(re.match(expected, value) is not None for value in values)
+    assert field_faker.get_values(0) == []
+
+
+@pytest.mark.parametrize("tt", test_cases)
+def test_field_faker_seeded_rng(tt: FactoryTestCase) -> None:
+    def sample(seed: int) -> list[str]:
+        field_faker = FexcelField.parse_field(
+            tt.input.name,
+            tt.input.type,
+            rng=random.Random(seed),
+        )
+        return [field_faker.get_value(), *field_faker.get_values(10)]
+
+    assert sample(42) == sample(42)
+
+
+def test_fields_share_faker() -> None:
+    first = FexcelField.parse_field("First", "name", rng=random.Random(1))
+    second = FexcelField.parse_field("Second", "name", rng=random.Random(2))
+    interleaved = FexcelField.parse_field("Third", "name", rng=random.Random(1))
+
+    assert first.fake is second.fake
+    expected = first.get_values(5)
+    # NOTE: Drawing from another field in between does not alter the sequence
+    actual = []
+    for _ in range(5):
+        actual.append(interleaved.get_value())
+        second.get_value()
+    assert actual == expected
@@ -15,6 +15,7 @@ from fexcel.fields import (
     LocationFieldFaker,
     NameFieldFaker,
     PhoneFieldFaker,
+    SequenceFieldFaker,
     TextFieldFaker,
     TimeFieldFaker,
     URLFieldFaker,
@@ -132,4 +133,8 @@ test_cases = [
         input=Input(name="choice", type="CHOICE"),
         output=Output(type=ChoiceFieldFaker, pattern=r"NULL"),
     ),
+    FactoryTestCase(
+        input=Input(name="sequence", type="SEQUENCE"),
+        output=Output(type=SequenceFieldFaker, pattern=r"^\d+$"),
+    ),
 ]
@@ -0,0 +1,114 @@
+import sys
+from datetime import date, datetime, time
+from pathlib import Path
+
+import pytest
+
+from fexcel.generator import Fexcel
+from fexcel.writers import ArrowWriter
+
+pa = pytest.importorskip("pyarrow")
+parquet = pytest.importorskip("pyarrow.parquet")
+
+SCHEMA = [
+    {"name": "int", "type": "int"},
+    {"name": "float", "type": "float"},
+    {"name": "bool", "type": "bool"},
+    {"name": "datetime", "type": "datetime"},
+    {"name": "date", "type": "date"},
+    {"name": "time", "type": "time"},
+    {"name": "name", "type": "name"},
+]
+
+
+def read_table(file: Path) -> "pa.Table":
+    if file.suffix == ".parquet":
+        return parquet.read_table(file)
+    with pa.ipc.open_file(file) as reader:
+        return reader.read_all()
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_write_columnar_file(output_path: Path, extension: str) -> None:
+    output_file = output_path / f"columnar.{extension}"
+
+    Fexcel(SCHEMA).write_to_file(output_file, 50)
+
+    table = read_table(output_file)
+    assert table.num_rows == 50  # noqa: PLR2004
+    assert table.schema.names == [field["name"] for field in SCHEMA]
+    assert table.schema.types == [
+        pa.int64(),
+        pa.float64(),
+        pa.bool_(),
+        pa.timestamp("us"),
+        pa.date32(),
+        pa.time64("us"),
+        pa.string(),
+    ]
+
+
+@pytest.mark.parametrize("extension", ["parquet", "arrow"])
+def test_write_columnar_non_string_values(output_path: Path, extension: str) -> None:
+    output_file = output_path / f"choices.{extension}"
+    schema = [
+        {
+            "name": "choice",
+            "type": "choice",
+            "constraints": {"allowed_values": [1, 2, 3], "null_probability": 0.2},
+        },
+    ]
+
+    Fexcel(schema, seed=0).write_to_file(output_file, 50)
+
+    table = read_table(output_file)
+    assert table.schema.types == [pa.string()]
+    values = table.column("choice").to_pylist()
+    assert None in values
+    assert set(values) <= {None, "1", "2", "3"}
+
+
+def test_parquet_row_groups(output_path: Path) -> None:
+    output_file = output_path / "row-groups.parquet"
+    blocks = [[[i] * 10] for i in range(5)]
+
+    with ArrowWriter(output_file, row_group_size=20) as writer:
+        writer.write_sheet("Sheet1", ["value"], blocks, types=[int])
+
+    metadata = parquet.ParquetFile(output_file).metadata
+    assert metadata.num_rows == 50  # noqa: PLR2004
+    assert metadata.num_row_groups == 3  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("native_type", "expected"),
+    [
+        (bool, "bool"),
+        (int, "int64"),
+        (float, "double"),
+        (datetime, "timestamp[us]"),
+        (date, "date32[day]"),
+        (time, "time64[us]"),
+        (str, "string"),
+        (list, "string"),
+    ],
+)
+def test_arrow_types(native_type: type, expected: str) -> None:
+    assert str(ArrowWriter.arrow_type(native_type)) == expected
+
+
+def test_arrow_writer_single_table(output_path: Path) -> None:
+    with ArrowWriter(output_path / "single.parquet") as writer:
+        writer.write_sheet("Sheet1", ["a"], [])
+        with pytest.raises(ValueError, match="can only hold a single table"):
+            writer.write_sheet("Sheet2", ["a"], [])
+
+
+def test_arrow_writer_without_pyarrow(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="pyarrow is not installed"):
+        ArrowWriter(output_path / "missing.parquet")
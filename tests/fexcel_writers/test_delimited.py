@@ -0,0 +1,85 @@
+import csv
+from pathlib import Path
+
+import pytest
+
+from fexcel.generator import Fexcel
+from fexcel.writers import CSVWriter
+
+BLOCKS = [
+    [["1", "2"], ["a", "b,c"]],
+    [["3"], ['d "quoted"']],
+]
+
+
+def read_rows(file: Path, **kwargs: str) -> list[list[str]]:
+    with file.open(newline="", encoding=kwargs.pop("encoding", "utf-8")) as fp:
+        return list(csv.reader(fp, **kwargs))
+
+
+@pytest.mark.parametrize(
+    ("extension", "delimiter"),
+    [("csv", ","), ("tsv", "\t")],
+)
+def test_csv_writer_default_delimiter(
+    output_path: Path,
+    extension: str,
+    delimiter: str,
+) -> None:
+    output_file = output_path / f"native.{extension}"
+
+    with CSVWriter(output_file) as writer:
+        writer.write_sheet("Sheet1", ["number", "text"], BLOCKS)
+
+    assert writer.delimiter == delimiter
+    assert read_rows(output_file, delimiter=delimiter) == [
+        ["number", "text"],
+        ["1", "a"],
+        ["2", "b,c"],
+        ["3", 'd "quoted"'],
+    ]
+
+
+def test_csv_writer_options(output_path: Path) -> None:
+    output_file = output_path / "options.csv"
+
+    with CSVWriter(
+        output_file,
+        delimiter=";",
+        quoting="all",
+        encoding="utf-16",
+    ) as writer:
+        writer.write_sheet("Sheet1", ["number", "text"], BLOCKS)
+
+    text = output_file.read_text(encoding="utf-16")
+    assert text.splitlines()[0] == '"number";"text"'
+    assert read_rows(output_file, delimiter=";", encoding="utf-16")[2] == ["2", "b,c"]
+
+
+def test_csv_writer_invalid_quoting(output_path: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid quoting policy"):
+        CSVWriter(output_path / "invalid.csv", quoting="sometimes")
+
+
+def test_csv_writer_single_sheet(output_path: Path) -> None:
+    with CSVWriter(output_path / "single.csv") as writer:
+        writer.write_sheet("Sheet1", ["a"], [])
+        with pytest.raises(ValueError, match="can only hold a single sheet"):
+            writer.write_sheet("Sheet2", ["a"], [])
+
+
+def test_write_to_file_csv_options(output_path: Path) -> None:
+    output_file = output_path / "fexcel-options.csv"
+    fexcel = Fexcel(
+        [
+            {"name": "int", "type": "int"},
+            {"name": "bool", "type": "bool"},
+        ],
+    )
+
+    fexcel.write_to_file(output_file, 20, delimiter="|")
+
+    rows = read_rows(output_file, delimiter="|")
+    assert rows[0] == ["int", "bool"]
+    assert len(rows) == 20 + 1
+    assert all(row[1] in {"True", "False"} for row in rows[1:])
@@ -0,0 +1,124 @@
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any
+
+import pyexcel as pe
+import pytest
+
+from fexcel.generator import Fexcel
+from fexcel.writers import PyexcelWriter, XLSXWriter
+
+try:
+    import pyexcel_xlsx  # type: ignore[reportMissingImports]
+except ImportError:
+    pyexcel_xlsx = None
+
+pytestmark = pytest.mark.skipif(
+    pyexcel_xlsx is None,
+    reason="Plugin to read xlsx files is not installed",
+)
+
+
+@pytest.fixture
+def output_file(output_path: Path) -> Path:
+    output_file = output_path / "streamed.xlsx"
+    if output_file.exists():
+        output_file.unlink()
+    return output_file
+
+
+def test_xlsx_writer_typed_cells(output_file: Path) -> None:
+    row = [
+        1,
+        1.5,
+        True,
+        datetime(2023, 1, 2, 3, 4, 5),  # noqa: DTZ001
+        date(2023, 1, 2),
+        time(3, 4, 5),
+        " <escaped> & spaced ",
+        None,
+        "last",
+    ]
+    header = [f"column{i}" for i in range(len(row))]
+
+    with XLSXWriter(output_file) as writer:
+        writer.write_sheet("Typed", header, [[[value] for value in row]])
+
+    sheet = pe.get_sheet(file_name=str(output_file), name_columns_by_row=0)
+    assert sheet.name == "Typed"
+    assert sheet.colnames == header
+    got = sheet.row[0]
+    assert got[:3] == [1, 1.5, True]
+    assert got[3] == datetime(2023, 1, 2, 3, 4, 5)  # noqa: DTZ001
+    assert got[4] in (date(2023, 1, 2), datetime(2023, 1, 2))  # noqa: DTZ001
+    assert got[5] == time(3, 4, 5)
+    assert got[6] == " <escaped> & spaced "
+    assert got[7] in (None, "")
+    assert got[8] == "last"
+
+
+def test_xlsx_writer_multiple_blocks_and_sheets(output_file: Path) -> None:
+    fexcel = Fexcel(
+        [
+            {"name": "int", "type": "int"},
+            {"name": "name", "type": "name"},
+        ],
+    )
+
+    with XLSXWriter(output_file) as writer:
+        for sheet_name, n in (("First", 25), ("Second", 7)):
+            writer.write_sheet(
+                sheet_name,
+                ["int", "name"],
+                fexcel.get_fake_columns(n, batch_size=10, native=True),
+            )
+
+    book = pe.get_book(file_name=str(output_file))
+    assert book.sheet_names() == ["First", "Second"]
+    assert book["First"].number_of_rows() == 25 + 1
+    assert book["Second"].number_of_rows() == 7 + 1
+
+
+@pytest.mark.parametrize("sheet_name", ["", "x" * 32, "a/b", "[sheet]"])
+def test_xlsx_writer_invalid_sheet_name(output_file: Path, sheet_name: str) -> None:
+    with (
+        XLSXWriter(output_file) as writer,
+        pytest.raises(ValueError, match="Invalid sheet name"),
+    ):
+        writer.write_sheet(sheet_name, ["a"], [])
+
+
+def test_xlsx_writer_repeated_sheet_name(output_file: Path) -> None:
+    with XLSXWriter(output_file) as writer:
+        writer.write_sheet("Sheet", ["a"], [])
+        with pytest.raises(ValueError, match="already in use"):
+            writer.write_sheet("SHEET", ["a"], [])
+
+
+@pytest.mark.parametrize(
+    ("threshold", "expected"),
+    [(0, XLSXWriter), (1_000_000, PyexcelWriter)],
+)
+def test_streaming_xlsx_writer_selection(
+    monkeypatch: pytest.MonkeyPatch,
+    output_file: Path,
+    threshold: int,
+    expected: type,
+) -> None:
+    monkeypatch.setattr(Fexcel, "STREAMING_XLSX_THRESHOLD", threshold)
+    used = []
+    original_write_sheet = expected.write_sheet
+
+    def spy(self: XLSXWriter | PyexcelWriter, *args: Any, **kwargs: Any) -> None:
+        used.append(type(self))
+        original_write_sheet(self, *args, **kwargs)
+
+    monkeypatch.setattr(expected, "write_sheet", spy)
+
+    fexcel = Fexcel([{"name": "int", "type": "int"}, {"name": "text", "type": "text"}])
+    fexcel.write_to_file(output_file, 10)
+
+    assert used == [expected]
+    sheet = pe.get_sheet(file_name=str(output_file), name_columns_by_row=0)
+    assert sheet.colnames == ["int", "text"]
+    assert sheet.number_of_rows() == 10  # noqa: PLR2004
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from fexcel.__main__ import Args, parse_args
@@ -14,8 +17,53 @@ def test_parse_valid_arguments() -> None:
     assert args.schema_path == schema_path
     assert args.output_path == output_path
     assert args.num_fakes == num_fakes
+    assert args.workers == 1
+    assert args.seed is None
+    assert not args.profile
+
+
+def test_parse_parallel_arguments() -> None:
+    args = parse_args(["schema.json", "output.xlsx", "--workers", "4", "--seed", "7"])
+
+    assert args.workers == 4  # noqa: PLR2004
+    assert args.seed == 7  # noqa: PLR2004
 
 
 def test_parse_invalid_arguments() -> None:
     with pytest.raises(SystemExit):
         parse_args([])
+
+
+def test_parse_profile_argument() -> None:
+    args = parse_args(["schema.json", "output.xlsx", "--profile"])
+
+    assert args.profile
+
+
+def test_cli_imports_dependencies_lazily() -> None:
+    modules = ("faker", "pyexcel", "numpy", "pyarrow")
+    code = (
+        "import sys, fexcel.__main__; "
+        f"print(*[m for m in {modules!r} if m in sys.modules])"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == ""
+
+
+def test_parse_stats_arguments() -> None:
+    args = parse_args(["schema.json", "output.xlsx"])
+    assert args.stats is None
+    assert args.progress is None
+
+    args = parse_args(["schema.json", "output.xlsx", "--stats", "--progress", "5"])
+    assert args.stats == "-"
+    assert args.progress == 5  # noqa: PLR2004
+
+    args = parse_args(["schema.json", "output.xlsx", "--stats", "stats.json"])
+    assert args.stats == "stats.json"
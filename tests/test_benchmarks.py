@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks import report, suite
+
+
+def test_run_benchmarks() -> None:
+    metrics = suite.run(
+        field_rows=10,
+        writer_rows=10,
+        memory_rows=[10],
+        repeat=1,
+        groups=["fields", "writers", "memory"],
+    )
+    names = {metric.name for metric in metrics}
+
+    for field_type, _ in suite.field_types():
+        assert f"field.{field_type}.get_values" in names
+        assert f"field.{field_type}.get_native_values" in names
+    assert {"write.csv", "write.xlsx-streaming", "memory.csv.10"} <= names
+    assert all(metric.value > 0 for metric in metrics)
+
+
+@pytest.mark.parametrize(
+    ("value", "higher_is_better", "expected"),
+    [
+        (100, True, "ok"),
+        (105, True, "ok"),
+        (150, True, "better"),
+        (50, True, "worse"),
+        (150, False, "worse"),
+        (50, False, "better"),
+    ],
+)
+def test_compare_against_baseline(
+    value: float,
+    *,
+    higher_is_better: bool,
+    expected: str,
+) -> None:
+    baseline = [suite.Metric("metric", 100, "rows/s", higher_is_better)]
+    metric = suite.Metric("metric", value, "rows/s", higher_is_better)
+
+    [comparison] = report.compare([metric], baseline, threshold=0.1)
+
+    assert comparison.status == expected
+
+
+def test_baseline_round_trip(output_path: Path) -> None:
+    baseline_file = output_path / "baseline.json"
+    metrics = [
+        suite.Metric("new", 1, "s", higher_is_better=False),
+        suite.Metric("old", 1, "s", higher_is_better=False),
+    ]
+    report.save(baseline_file, metrics[1:], {"repeat": 1})
+
+    comparisons = report.compare(metrics, report.load(baseline_file), threshold=0.1)
+
+    assert [comparison.status for comparison in comparisons] == ["new", "ok"]
+    assert "new" in report.format_report(comparisons)
@@ -3,6 +3,8 @@ import re
 import types
 from collections.abc import Iterator
 from dataclasses import dataclass
+from datetime import date, datetime, time
+from itertools import chain
 from pathlib import Path
 
 import pyexcel as pe
@@ -10,6 +12,7 @@ import pytest
 
 from fexcel.fields import FexcelField
 from fexcel.generator import Fexcel
+from fexcel.writers import FexcelWriter
 
 try:
     import pyexcel_xlsx  # type: ignore[reportMissingImports]
@@ -54,6 +57,111 @@ def test_create_fake_excel(input_path: Path) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    ("n", "batch_size", "expected_sizes"),
+    [
+        (0, 10, []),
+        (5, 10, [5]),
+        (10, 10, [10]),
+        (25, 10, [10, 10, 5]),
+    ],
+)
+def test_get_fake_columns(n: int, batch_size: int, expected_sizes: list[int]) -> None:
+    fexcel = Fexcel(
+        [
+            {"name": "field1", "type": "int"},
+            {"name": "field2", "type": "bool"},
+            {"name": "field3", "type": "text"},
+        ],
+    )
+
+    blocks = list(fexcel.get_fake_columns(n, batch_size=batch_size))
+
+    assert [len(block[0]) for block in blocks] == expected_sizes
+    for block in blocks:
+        assert len(block) == len(fexcel.fields)
+        assert len({len(column) for column in block}) == 1
+        assert all(value in {"True", "False"} for value in block[1])
+
+
+def test_get_fake_columns_infinite() -> None:
+    fexcel = Fexcel([{"name": "field1", "type": "int"}])
+
+    batch_size = 3
+    iterator = fexcel.get_fake_columns(batch_size=batch_size)
+    for _ in range(5):
+        assert len(next(iterator)[0]) == batch_size
+
+
+def test_get_fake_columns_invalid_batch_size() -> None:
+    fexcel = Fexcel([{"name": "field1", "type": "int"}])
+
+    with pytest.raises(ValueError, match="Batch size must be a positive integer"):
+        next(fexcel.get_fake_columns(10, batch_size=0))
+
+
+def test_seeded_fake_records_are_reproducible(input_path: Path) -> None:
+    want = list(
+        Fexcel.from_file(input_path / "mock-values.json", seed=1).get_fake_records(10)
+    )
+    got = list(
+        Fexcel.from_file(input_path / "mock-values.json", seed=1).get_fake_records(10)
+    )
+    other = list(
+        Fexcel.from_file(input_path / "mock-values.json", seed=2).get_fake_records(10)
+    )
+
+    assert want == got
+    assert want != other
+
+
+def test_parallel_fake_columns_are_reproducible() -> None:
+    schema = [
+        {"name": "field1", "type": "int"},
+        {"name": "field2", "type": "name"},
+        {"name": "field3", "type": "date"},
+    ]
+    n, batch_size = 25, 10
+
+    want = list(Fexcel(schema, seed=42).get_fake_columns(n, batch_size, workers=2))
+    got = list(Fexcel(schema, seed=42).get_fake_columns(n, batch_size, workers=2))
+    other = list(Fexcel(schema, seed=24).get_fake_columns(n, batch_size, workers=2))
+
+    assert [len(block[0]) for block in want] == [10, 10, 5]
+    assert want == got
+    assert want != other
+
+
+def test_get_fake_columns_invalid_workers() -> None:
+    fexcel = Fexcel([{"name": "field1", "type": "int"}])
+
+    with pytest.raises(ValueError, match="Number of workers must be a positive"):
+        next(fexcel.get_fake_columns(10, workers=0))
+
+
+def test_native_fake_records() -> None:
+    fexcel = Fexcel(
+        [
+            {"name": "int", "type": "int"},
+            {"name": "float", "type": "float"},
+            {"name": "bool", "type": "bool"},
+            {"name": "datetime", "type": "datetime"},
+            {"name": "date", "type": "date"},
+            {"name": "time", "type": "time"},
+            {"name": "text", "type": "text"},
+        ],
+    )
+
+    for record in fexcel.get_fake_records(5, native=True):
+        assert isinstance(record["int"], int)
+        assert isinstance(record["float"], float)
+        assert isinstance(record["bool"], bool)
+        assert isinstance(record["datetime"], datetime)
+        assert isinstance(record["date"], date)
+        assert isinstance(record["time"], time)
+        assert isinstance(record["text"], str)
+
+
 def test_incorrect_schema() -> None:
     invalid_field = {"": ""}
 
@@ -226,3 +334,238 @@ def test_ordered_write(
     got = sheet.colnames
 
     assert want == got
+
+
+@pytest.mark.parametrize("tt", write_to_file_cases)
+def test_write_to_file_row_count(output_path: Path, tt: WriteToFileCase) -> None:
+    if tt.module is None:
+        pytest.skip(f"Plugin to handle {tt.extension} is not installed")
+
+    output_file = output_path / f"rows.{tt.extension}"
+    if output_file.exists():
+        output_file.unlink()
+
+    num_fakes = 25
+    fexcel = Fexcel(
+        [
+            {"name": "field1", "type": "int"},
+            {"name": "field2", "type": "text"},
+        ],
+    )
+    fexcel.write_to_file(output_file, num_fakes)
+
+    sheet = pe.get_sheet(
+        file_name=str(output_file),
+        name_columns_by_row=0,
+    )
+    assert sheet.number_of_rows() == num_fakes
+    assert sheet.colnames == ["field1", "field2"]
+
+
+@pytest.mark.skipif(pyexcel_xlsx is None, reason="Plugin to handle xlsx not installed")
+def test_write_typed_cells(output_path: Path) -> None:
+    output_file = output_path / "typed.xlsx"
+    if output_file.exists():
+        output_file.unlink()
+
+    fexcel = Fexcel(
+        [
+            {"name": "int", "type": "int"},
+            {"name": "bool", "type": "bool"},
+            {"name": "datetime", "type": "datetime"},
+        ],
+    )
+    fexcel.write_to_file(output_file, 5)
+
+    sheet = pe.get_sheet(file_name=str(output_file), name_columns_by_row=0)
+    for row in sheet.rows():
+        assert isinstance(row[0], int)
+        assert isinstance(row[1], bool)
+        assert isinstance(row[2], datetime)
+
+
+@pytest.mark.parametrize(
+    ("extension", "module", "streaming_threshold"),
+    [
+        pytest.param("xlsx", pyexcel_xlsx, Fexcel.STREAMING_XLSX_THRESHOLD, id="xlsx"),
+        pytest.param("xlsx", pyexcel_xlsx, 1, id="streaming-xlsx"),
+        pytest.param("xls", pyexcel_xls, Fexcel.STREAMING_XLSX_THRESHOLD, id="xls"),
+    ],
+)
+def test_sheet_rollover(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+    extension: str,
+    module: types.ModuleType | None,
+    streaming_threshold: int,
+) -> None:
+    if module is None:
+        pytest.skip(f"Plugin to handle {extension} is not installed")
+    monkeypatch.setattr(Fexcel, "STREAMING_XLSX_THRESHOLD", streaming_threshold)
+    monkeypatch.setitem(FexcelWriter.ROW_LIMITS, f".{extension}", 11)
+
+    output_file = output_path / f"rollover.{extension}"
+    fexcel = Fexcel([{"name": "field1", "type": "int"}], seed=0)
+    fexcel.write_to_file(output_file, 25, workers=2)
+
+    book = pe.get_book(file_name=str(output_file))
+    assert book.sheet_names() == ["Sheet1", "Sheet1 (2)", "Sheet1 (3)"]
+    assert [book[name].number_of_rows() for name in book.sheet_names()] == [11, 11, 6]
+
+    with output_path.joinpath(f"rollover.{extension}.manifest.json").open() as fp:
+        manifest = json.load(fp)
+    assert manifest["num_fakes"] == 25  # noqa: PLR2004
+    assert manifest["files"] == [
+        {
+            "path": output_file.name,
+            "sheets": [
+                {"name": "Sheet1", "rows": 10},
+                {"name": "Sheet1 (2)", "rows": 10},
+                {"name": "Sheet1 (3)", "rows": 5},
+            ],
+        },
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.skipif(pyexcel_xlsx is None, reason="Plugin to handle xlsx not installed")
+def test_file_rollover(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+    workers: int,
+) -> None:
+    monkeypatch.setitem(FexcelWriter.ROW_LIMITS, ".xlsx", 11)
+
+    output_file = output_path / "parts.xlsx"
+    output_file.unlink(missing_ok=True)
+    fexcel = Fexcel([{"name": "field1", "type": "int"}], seed=0)
+    fexcel.write_to_file(output_file, 25, workers=workers, rollover="file")
+
+    assert not output_file.exists()
+    parts = [output_path / f"parts-{index}.xlsx" for index in range(1, 4)]
+    assert [pe.get_sheet(file_name=str(part)).number_of_rows() for part in parts] == [
+        11,
+        11,
+        6,
+    ]
+
+    with output_path.joinpath("parts.xlsx.manifest.json").open() as fp:
+        manifest = json.load(fp)
+    assert [file["path"] for file in manifest["files"]] == [part.name for part in parts]
+    assert [file["sheets"][0]["rows"] for file in manifest["files"]] == [10, 10, 5]
+
+
+def test_no_rollover_below_row_limit(output_path: Path) -> None:
+    output_file = output_path / "no-rollover.csv"
+    output_path.joinpath("no-rollover.csv.manifest.json").unlink(missing_ok=True)
+    Fexcel([{"name": "field1", "type": "int"}]).write_to_file(output_file, 25)
+
+    assert not output_path.joinpath("no-rollover.csv.manifest.json").exists()
+
+
+def test_invalid_rollover(output_path: Path) -> None:
+    fexcel = Fexcel([{"name": "field1", "type": "int"}])
+
+    with pytest.raises(ValueError, match="Invalid rollover mode"):
+        fexcel.write_to_file(output_path / "out.xlsx", rollover="table")
+
+
+@pytest.mark.parametrize(
+    ("file_name", "expected"),
+    [
+        ("out.xlsx", 1_048_576),
+        ("out.xls", 65_536),
+        ("out.csv", None),
+    ],
+)
+def test_row_limits(file_name: str, expected: int | None) -> None:
+    assert FexcelWriter.get_max_rows(Path(file_name)) == expected
+
+
+def test_unique_fake_columns() -> None:
+    fexcel = Fexcel(
+        [
+            {
+                "name": "id",
+                "type": "int",
+                "constraints": {"unique": True, "max_value": 10**6},
+            },
+            {"name": "name", "type": "name", "constraints": {"unique": True}},
+        ],
+        seed=0,
+    )
+
+    ids, names = zip(*fexcel.get_fake_columns(1_000, batch_size=300), strict=True)
+
+    assert len(set(chain.from_iterable(ids))) == 1_000  # noqa: PLR2004
+    assert len(set(chain.from_iterable(names))) == 1_000  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"n": 200}, "it can only generate 101 distinct values"),
+        ({"n": 50, "workers": 2}, "can not be generated by more than one worker"),
+    ],
+)
+def test_invalid_unique_fake_columns(kwargs: dict, message: str) -> None:
+    fexcel = Fexcel(
+        [{"name": "id", "type": "int", "constraints": {"unique": True}}],
+    )
+
+    with pytest.raises(ValueError, match=message):
+        next(fexcel.get_fake_columns(**kwargs))
+
+
+def test_unique_file_rollover(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+) -> None:
+    monkeypatch.setitem(FexcelWriter.ROW_LIMITS, ".csv", 11)
+    fexcel = Fexcel(
+        [{"name": "id", "type": "int", "constraints": {"unique": True}}],
+    )
+
+    output_path.joinpath("parts-1.csv").unlink(missing_ok=True)
+
+    with pytest.raises(ValueError, match="can not be split into 3 part files"):
+        fexcel.write_to_file(output_path / "parts.csv", 25, rollover="file")
+    assert not output_path.joinpath("parts-1.csv").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sequence_fake_columns(workers: int) -> None:
+    fexcel = Fexcel(
+        [
+            {
+                "name": "id",
+                "type": "sequence",
+                "constraints": {"start": 1_000, "unique": True},
+            },
+        ],
+        seed=0,
+    )
+
+    blocks = list(fexcel.get_fake_columns(250, batch_size=100, workers=workers))
+
+    assert [value for [column] in blocks for value in column] == [
+        str(value) for value in range(1_000, 1_250)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sequence_file_rollover(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+    workers: int,
+) -> None:
+    monkeypatch.setitem(FexcelWriter.ROW_LIMITS, ".csv", 11)
+    fexcel = Fexcel([{"name": "id", "type": "sequence"}], seed=0)
+
+    fexcel.write_to_file(output_path / "ids.csv", 25, workers=workers, rollover="file")
+
+    ids = []
+    for index in range(1, 4):
+        with output_path.joinpath(f"ids-{index}.csv").open() as fp:
+            ids.extend(int(line) for line in fp.read().splitlines()[1:])
+    assert ids == list(range(1, 26))
@@ -0,0 +1,115 @@
+from pathlib import Path
+
+import pytest
+
+from fexcel.generator import Fexcel
+from fexcel.profiling import Measurement, Profiler
+from fexcel.workbook import FexcelWorkbook
+
+SCHEMA = [
+    {"name": "name", "type": "name"},
+    {"name": "amount", "type": "int"},
+]
+
+
+def test_profile_records() -> None:
+    events: list[Measurement] = []
+    profiler = Profiler(callback=events.append)
+    fexcel = Fexcel(SCHEMA, profiler=profiler)
+
+    records = list(fexcel.get_fake_records(250))
+
+    assert len(records) == 250  # noqa: PLR2004
+    fields = {m.name: m for m in profiler.measurements if m.kind == "field"}
+    assert set(fields) == {"name", "amount"}
+    assert all(measurement.values == 250 for measurement in fields.values())  # noqa: PLR2004
+    assert fields["name"].seconds > fields["amount"].seconds
+    assert events
+    assert sum(event.values for event in events if event.name == "name") == 250  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("extension", ["csv", "xlsx"])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_profile_write_to_file(output_path: Path, extension: str, workers: int) -> None:
+    output_file = output_path / f"profiled.{extension}"
+    profiler = Profiler()
+    fexcel = Fexcel(SCHEMA, seed=0, profiler=profiler)
+
+    fexcel.write_to_file(output_file, 100, workers=workers)
+
+    measurements = {(m.kind, m.name): m for m in profiler.measurements}
+    assert {
+        ("phase", "generate"),
+        ("phase", "serialize"),
+        ("phase", "finalize"),
+    } <= set(
+        measurements,
+    )
+    assert measurements["field", "name"].values == 100  # noqa: PLR2004
+    assert measurements["field", "amount"].values == 100  # noqa: PLR2004
+    assert measurements["file", output_file.name].nbytes == output_file.stat().st_size
+
+
+def test_profile_pyexcel_serialization(output_path: Path) -> None:
+    output_file = output_path / "profiled.ods"
+    profiler = Profiler()
+    fexcel = Fexcel(SCHEMA, seed=0, profiler=profiler)
+
+    fexcel.write_to_file(output_file, 100)
+
+    phases = {
+        name: sum(
+            m.seconds
+            for m in profiler.measurements
+            if m.kind == "phase" and m.name == name
+        )
+        for name in ("generate", "serialize", "finalize")
+    }
+    # NOTE: pyexcel saves the whole file at once, which is serializing it
+    assert phases["generate"] > 0
+    assert phases["serialize"] > phases["finalize"]
+
+
+def test_profile_workbook(output_path: Path) -> None:
+    output_file = output_path / "profiled-workbook.xlsx"
+    profiler = Profiler()
+    workbook = FexcelWorkbook(
+        {
+            "sheets": [
+                {"name": "First", "num_fakes": 10, "fields": SCHEMA},
+                {"name": "Second", "num_fakes": 20, "fields": SCHEMA},
+            ],
+        },
+        profiler=profiler,
+    )
+
+    workbook.write_to_file(output_file)
+
+    fields = {m.name: m for m in profiler.measurements if m.kind == "field"}
+    assert fields["name"].values == 30  # noqa: PLR2004
+
+
+def test_report_is_sorted() -> None:
+    profiler = Profiler()
+    profiler.record(Measurement("field", "fast", 0.1, values=10))
+    profiler.record(Measurement("field", "slow", 0.5, values=10))
+    profiler.record(Measurement("field", "slow", 0.5, values=10))
+    profiler.record(Measurement("phase", "generate", 1.1))
+
+    report = profiler.report().splitlines()
+
+    assert [line.split()[1] for line in report[1:]] == ["generate", "slow", "fast"]
+    assert profiler.measurements[1] == Measurement(
+        "field",
+        "slow",
+        1.0,
+        values=20,
+        calls=2,
+    )
+
+
+def test_no_profiler() -> None:
+    fexcel = Fexcel(SCHEMA)
+
+    assert fexcel.profiler is None
+    assert len(list(fexcel.get_fake_records(10))) == 10  # noqa: PLR2004
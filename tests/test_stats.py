@@ -0,0 +1,125 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from fexcel.__main__ import main
+from fexcel.generator import Fexcel
+from fexcel.profiling import Measurement, Profiler
+from fexcel.stats import ProgressReporter, peak_rss, run_stats
+
+SCHEMA = [
+    {"name": "name", "type": "name"},
+    {"name": "amount", "type": "int"},
+]
+
+
+def test_run_stats(output_path: Path) -> None:
+    output_file = output_path / "stats.csv"
+    profiler = Profiler()
+
+    Fexcel(SCHEMA, seed=0, profiler=profiler).write_to_file(output_file, 100)
+    stats = run_stats(profiler, 2.0)
+
+    assert stats["status"] == "ok"
+    assert stats["error"] is None
+    assert stats["rows"] == 100  # noqa: PLR2004
+    assert stats["rows_per_second"] == 50  # noqa: PLR2004
+    assert stats["bytes_written"] == output_file.stat().st_size
+    assert stats["files"] == [
+        {"name": output_file.name, "bytes": stats["bytes_written"]}
+    ]
+    assert set(stats["phases"]) == {"generate", "serialize", "finalize"}
+    assert stats["phases"]["generate"] > 0
+    assert stats["peak_rss_bytes"] > 0
+    json.dumps(stats)
+
+
+def test_run_stats_error() -> None:
+    stats = run_stats(Profiler(), 0.0, ValueError("Invalid"))
+
+    assert stats["status"] == "error"
+    assert stats["error"] == "Invalid"
+    assert stats["rows"] == 0
+    assert stats["rows_per_second"] is None
+
+
+def test_peak_rss_without_resource(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("fexcel.stats.resource", None)
+
+    assert peak_rss() is None
+
+
+def test_progress_reporter() -> None:
+    stream = io.StringIO()
+    reporter = ProgressReporter(1000, interval=1e-9, stream=stream)
+
+    reporter(Measurement("field", "amount", values=250))
+    reporter(Measurement("phase", "generate", values=250))
+    reporter(Measurement("phase", "generate", values=250))
+
+    lines = stream.getvalue().splitlines()
+    assert reporter.rows == 500  # noqa: PLR2004
+    assert len(lines) == 2  # noqa: PLR2004
+    assert lines[-1].startswith("fexcel: 500/1,000 rows (50.0%)")
+    assert lines[-1].endswith("rows/s")
+
+
+def test_progress_reporter_invalid_interval() -> None:
+    with pytest.raises(ValueError, match="must be a positive number"):
+        ProgressReporter(1000, interval=0)
+
+
+def test_cli_stats(
+    capsys: pytest.CaptureFixture[str],
+    output_path: Path,
+) -> None:
+    schema_file = output_path / "stats-schema.json"
+    schema_file.write_text(json.dumps(SCHEMA))
+    output_file = output_path / "cli-stats.csv"
+    stats_file = output_path / "cli-stats.json"
+    argv = [str(schema_file), str(output_file), "-n", "50", "--stats", str(stats_file)]
+
+    main([*argv, "--progress", "1e-9"])
+
+    stats = json.loads(stats_file.read_text())
+    assert stats["status"] == "ok"
+    assert stats["rows"] == 50  # noqa: PLR2004
+    assert stats["bytes_written"] == output_file.stat().st_size
+    assert "fexcel: 50/50 rows (100.0%)" in capsys.readouterr().err
+
+
+def test_cli_stats_on_error(
+    capsys: pytest.CaptureFixture[str],
+    output_path: Path,
+) -> None:
+    schema_file = output_path / "stats-invalid-schema.json"
+    schema_file.write_text(json.dumps([{"name": "x", "type": "unknown"}]))
+    argv = [str(schema_file), str(output_path / "invalid.csv"), "--stats"]
+
+    with pytest.raises(SystemExit):
+        main(argv)
+
+    output = capsys.readouterr()
+    stats = json.loads(output.out)
+    assert stats["status"] == "error"
+    assert stats["rows"] == 0
+    assert output.err.startswith("fexcel: ")
+
+
+def test_cli_stats_with_profile(
+    capsys: pytest.CaptureFixture[str],
+    output_path: Path,
+) -> None:
+    schema_file = output_path / "stats-profile-schema.json"
+    schema_file.write_text(json.dumps(SCHEMA))
+    argv = [str(schema_file), str(output_path / "cli-profile.csv"), "-n", "50"]
+
+    main([*argv, "--profile", "--stats"])
+
+    output = capsys.readouterr()
+    stats = json.loads(output.out)
+    assert stats["status"] == "ok"
+    assert stats["rows"] == 50  # noqa: PLR2004
+    assert "generate" in output.err
@@ -0,0 +1,320 @@
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+import pyexcel as pe
+import pytest
+
+from fexcel.generator import Fexcel
+from fexcel.workbook import FexcelWorkbook
+
+try:
+    import pyexcel_xlsx  # type: ignore[reportMissingImports]
+except ImportError:
+    pyexcel_xlsx = None
+
+try:
+    import pyexcel_ods3  # type: ignore[reportMissingImports]
+except ImportError:
+    pyexcel_ods3 = None
+
+
+WORKBOOK_SCHEMA = {
+    "sheets": [
+        {
+            "name": "Customers",
+            "num_fakes": 20,
+            "fields": [
+                {"name": "Customer", "type": "name"},
+                {"name": "Email", "type": "email"},
+            ],
+        },
+        {
+            "name": "Orders",
+            "fields": [
+                {"name": "Amount", "type": "float"},
+                {"name": "Paid", "type": "bool"},
+            ],
+        },
+    ],
+}
+
+
+def test_parse_workbook() -> None:
+    workbook = FexcelWorkbook(WORKBOOK_SCHEMA, num_fakes=30)
+
+    assert [sheet.name for sheet in workbook.sheets] == ["Customers", "Orders"]
+    assert [sheet.num_fakes for sheet in workbook.sheets] == [20, 30]
+    assert all(isinstance(sheet.fexcel, Fexcel) for sheet in workbook.sheets)
+    assert workbook == FexcelWorkbook(WORKBOOK_SCHEMA, num_fakes=30)
+
+
+def test_seeded_workbook_is_reproducible() -> None:
+    def records(seed: int) -> list[list[dict[str, Any]]]:
+        workbook = FexcelWorkbook(WORKBOOK_SCHEMA, seed=seed)
+        return [list(sheet.fexcel.get_fake_records(5)) for sheet in workbook.sheets]
+
+    assert records(1) == records(1)
+    assert records(1) != records(2)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        [{"name": "Customer", "type": "name"}],
+        {"tables": []},
+        {"sheets": [{"fields": []}]},
+        {"sheets": [{"name": "Sheet", "fields": [], "num_fakes": -1}]},
+        {"sheets": [{"name": "Sheet", "fields": []}, {"name": "Sheet", "fields": []}]},
+    ],
+)
+def test_invalid_workbook(schema: Any) -> None:
+    with pytest.raises(ValueError, match="Error parsing"):
+        FexcelWorkbook(schema)
+
+
+@pytest.mark.parametrize(
+    ("extension", "module", "streaming_threshold"),
+    [
+        pytest.param("xlsx", pyexcel_xlsx, Fexcel.STREAMING_XLSX_THRESHOLD, id="xlsx"),
+        pytest.param("xlsx", pyexcel_xlsx, 1, id="streaming-xlsx"),
+        pytest.param("ods", pyexcel_ods3, Fexcel.STREAMING_XLSX_THRESHOLD, id="ods"),
+    ],
+)
+def test_write_workbook(
+    monkeypatch: pytest.MonkeyPatch,
+    output_path: Path,
+    extension: str,
+    module: object,
+    streaming_threshold: int,
+) -> None:
+    if module is None:
+        pytest.skip(f"Plugin to handle {extension} not installed")
+    monkeypatch.setattr(Fexcel, "STREAMING_XLSX_THRESHOLD", streaming_threshold)
+
+    num_fakes = 40
+    output_file = output_path / f"workbook.{extension}"
+    workbook = FexcelWorkbook(WORKBOOK_SCHEMA, seed=0, num_fakes=num_fakes)
+    workbook.write_to_file(output_file)
+
+    book = pe.get_book(file_name=str(output_file))
+    assert book.sheet_names() == ["Customers", "Orders"]
+    assert book["Customers"].row[0] == ["Customer", "Email"]
+    assert book["Customers"].number_of_rows() == 20 + 1
+    assert book["Orders"].row[0] == ["Amount", "Paid"]
+    assert book["Orders"].number_of_rows() == num_fakes + 1
+
+
+def test_write_workbook_to_single_sheet_format(output_path: Path) -> None:
+    output_file = output_path / "workbook.csv"
+    output_file.unlink(missing_ok=True)
+    workbook = FexcelWorkbook(WORKBOOK_SCHEMA)
+
+    with pytest.raises(ValueError, match="Cannot write 2 sheets"):
+        workbook.write_to_file(output_file)
+    assert not output_file.exists()
+
+
+REFERENCE_SCHEMA = {
+    "sheets": [
+        {
+            "name": "Customers",
+            "num_fakes": 50,
+            "fields": [
+                {"name": "Id", "type": "sequence", "constraints": {"prefix": "C-"}},
+                {"name": "Code", "type": "int", "constraints": {"max_value": 10**9}},
+                {"name": "Customer", "type": "name"},
+            ],
+        },
+        {
+            "name": "Orders",
+            "fields": [
+                {
+                    "name": "Customer Id",
+                    "type": "reference",
+                    "constraints": {"sheet": "Customers", "field": "Id"},
+                },
+                {
+                    "name": "Customer Code",
+                    "type": "reference",
+                    "constraints": {"sheet": "Customers", "field": "Code"},
+                },
+                {
+                    "name": "Customer",
+                    "type": "foreign_key",
+                    "constraints": {"sheet": "Customers", "field": "Customer"},
+                },
+            ],
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("native", [True, False])
+def test_workbook_references(workers: int, native: bool) -> None:  # noqa: FBT001
+    workbook = FexcelWorkbook(REFERENCE_SCHEMA, seed=0, num_fakes=300)
+    customers, orders = workbook.sheets
+
+    [ids, codes, names] = [
+        list(chain.from_iterable(column))
+        for column in zip(
+            *customers.fexcel.get_fake_columns(customers.num_fakes, native=native),
+            strict=True,
+        )
+    ]
+    [order_ids, order_codes, order_names] = [
+        list(chain.from_iterable(column))
+        for column in zip(
+            *orders.fexcel.get_fake_columns(
+                orders.num_fakes,
+                batch_size=100,
+                workers=workers,
+                native=native,
+            ),
+            strict=True,
+        )
+    ]
+
+    assert ids == [f"C-{index}" for index in range(1, 51)]
+    assert set(order_ids) <= set(ids)
+    assert set(order_codes) <= set(codes)
+    assert set(order_names) <= set(names)
+    assert len(set(order_ids)) > 1
+    assert all(isinstance(code, int if native else str) for code in order_codes)
+
+
+@pytest.mark.parametrize(
+    ("extension", "module"),
+    [
+        pytest.param("xlsx", pyexcel_xlsx, id="xlsx"),
+        pytest.param("ods", pyexcel_ods3, id="ods"),
+    ],
+)
+def test_write_workbook_unique_references(
+    output_path: Path,
+    extension: str,
+    module: object,
+) -> None:
+    if module is None:
+        pytest.skip(f"Plugin to handle {extension} not installed")
+    schema = {
+        "sheets": [
+            {
+                "name": "Customers",
+                "num_fakes": 20,
+                "fields": [
+                    {
+                        "name": "Code",
+                        "type": "int",
+                        "constraints": {"unique": True, "max_value": 10**6},
+                    },
+                ],
+            },
+            {
+                "name": "Orders",
+                "num_fakes": 10,
+                "fields": [
+                    {
+                        "name": "Customer Code",
+                        "type": "reference",
+                        "constraints": {
+                            "sheet": "Customers",
+                            "field": "Code",
+                            "unique": True,
+                        },
+                    },
+                ],
+            },
+        ],
+    }
+    output_file = output_path / f"unique-references.{extension}"
+
+    FexcelWorkbook(schema, seed=0).write_to_file(output_file)
+
+    book = pe.get_book(file_name=str(output_file))
+    codes = [row[0] for row in book["Customers"].array[1:]]
+    customer_codes = [row[0] for row in book["Orders"].array[1:]]
+    assert len(customer_codes) == len(set(customer_codes)) == 10  # noqa: PLR2004
+    assert set(customer_codes) <= set(codes)
+
+
+@pytest.mark.parametrize(
+    ("constraints", "message"),
+    [
+        ({"sheet": "Clients", "field": "Id"}, "referenced sheet 'Clients' not found"),
+        ({"sheet": "Customers", "field": "Age"}, "'Customers.Age' not found"),
+        (
+            {"sheet": "Customers", "field": "Customer"},
+            "'Customers' must be declared before",
+        ),
+    ],
+)
+def test_invalid_workbook_references(constraints: dict, message: str) -> None:
+    schema = {
+        "sheets": [
+            {
+                "name": "Orders",
+                "fields": [
+                    {"name": "Ref", "type": "reference", "constraints": constraints},
+                ],
+            },
+            REFERENCE_SCHEMA["sheets"][0],
+        ],
+    }
+
+    with pytest.raises(ValueError, match=message):
+        FexcelWorkbook(schema)
+
+
+def test_workbook_references_sequence_declared_later() -> None:
+    schema = {"sheets": list(reversed(REFERENCE_SCHEMA["sheets"]))}
+    schema["sheets"][0] = {
+        "name": "Orders",
+        "fields": [REFERENCE_SCHEMA["sheets"][1]["fields"][0]],
+    }
+
+    orders, _ = FexcelWorkbook(schema).sheets
+
+    [[values]] = orders.fexcel.get_fake_columns(100)
+    assert {int(value.removeprefix("C-")) for value in values} <= set(range(1, 51))
+
+
+@pytest.mark.parametrize("key_type", ["int", "sequence"])
+@pytest.mark.parametrize("native", [True, False])
+def test_workbook_references_nullable_keys(key_type: str, native: bool) -> None:  # noqa: FBT001
+    schema = {
+        "sheets": [
+            {
+                "name": "Customers",
+                "num_fakes": 200,
+                "fields": [
+                    {
+                        "name": "Id",
+                        "type": key_type,
+                        "constraints": {"null_probability": 0.5},
+                    },
+                ],
+            },
+            {
+                "name": "Orders",
+                "fields": [
+                    {
+                        "name": "Customer Id",
+                        "type": "reference",
+                        "constraints": {"sheet": "Customers", "field": "Id"},
+                    },
+                ],
+            },
+        ],
+    }
+    customers, orders = FexcelWorkbook(schema, seed=0, num_fakes=300).sheets
+
+    [[ids]] = customers.fexcel.get_fake_columns(customers.num_fakes, native=native)
+    [[order_ids]] = orders.fexcel.get_fake_columns(orders.num_fakes, native=native)
+
+    null = None if native else ""
+    assert null in ids
+    assert null not in order_ids
+    assert set(order_ids) <= set(ids)
+    assert all(isinstance(key, int if native else str) for key in order_ids)